@@ -8,11 +8,12 @@ analysis - Анализ позиций и pruning
 """
 
 from .patterns import match_patterns, apply_pattern_sequence
-from .symmetry import get_symmetry_canonical, count_symmetries
+from .symmetry import get_symmetry_canonical, symmetry_canonical_bits, count_symmetries
 
 __all__ = [
     'match_patterns',
     'apply_pattern_sequence',
     'get_symmetry_canonical',
+    'symmetry_canonical_bits',
     'count_symmetries'
 ]
@@ -5,86 +5,213 @@ analysis/patterns.py
 """
 
 from typing import Optional, Tuple, List
-from copy import deepcopy
 
+from core.utils import PEG, HOLE, index_to_pos
 
-def match_line_of_three(board: List[List[str]]) -> Optional[Tuple[int, int, int, int]]:
-    """Находит три клетки подряд: ●●○ или ○●●."""
+Match = Tuple[int, int, int, int]
+
+
+# =====================================================
+# Битовое кодирование сетки
+# =====================================================
+#
+# Сетка rows×cols кодируется в int со строкой длины cols + 2:
+# два "пустых" столбца справа не бывают ни колышком, ни дыркой,
+# поэтому сдвиги на 1..3 не переносят окно на соседнюю строку.
+# Вертикальные шаблоны ищутся в транспонированной сетке — так самый
+# младший бит совпадает с порядком обхода по столбцам.
+
+
+def _board_to_bits(board: List[List[str]], transpose: bool = False) -> Tuple[int, int]:
+    """
+    Кодирует сетку в битовые маски (pegs, holes).
+
+    Args:
+        board: матрица доски
+        transpose: кодировать транспонированную сетку (по столбцам)
+    """
     rows, cols = len(board), len(board[0])
-    
-    for r in range(rows):
-        for c in range(cols - 2):
-            if board[r][c] == board[r][c+1] == '●' and board[r][c+2] == '○':
-                return (r, c, 0, 1)
-            if board[r][c] == '○' and board[r][c+1] == board[r][c+2] == '●':
-                return (r, c+2, 0, -1)
-    
-    for c in range(cols):
-        for r in range(rows - 2):
-            if board[r][c] == board[r+1][c] == '●' and board[r+2][c] == '○':
-                return (r, c, 1, 0)
-            if board[r][c] == '○' and board[r+1][c] == board[r+2][c] == '●':
-                return (r+2, c, -1, 0)
-    
+    pegs = 0
+    holes = 0
+    if transpose:
+        stride = rows + 2
+        for r in range(rows):
+            row = board[r]
+            for c in range(cols):
+                cell = row[c]
+                if cell == PEG:
+                    pegs |= 1 << (c * stride + r)
+                elif cell == HOLE:
+                    holes |= 1 << (c * stride + r)
+    else:
+        stride = cols + 2
+        for r in range(rows):
+            row = board[r]
+            for c in range(cols):
+                cell = row[c]
+                if cell == PEG:
+                    pegs |= 1 << (r * stride + c)
+                elif cell == HOLE:
+                    holes |= 1 << (r * stride + c)
+    return pegs, holes
+
+
+def _first_line(forward: int, backward: int, stride: int, length: int) -> Optional[Tuple[int, int, int]]:
+    """
+    Выбирает первое совпадение (младший бит) среди двух масок окон.
+
+    Returns:
+        (line, offset, step) для позиции, откуда делается ход, или None
+    """
+    found = forward | backward
+    if not found:
+        return None
+    lsb = found & -found
+    line, offset = divmod(lsb.bit_length() - 1, stride)
+    if forward & lsb:
+        return line, offset, 1
+    return line, offset + length - 1, -1
+
+
+def _match_three_bits(pegs: int, holes: int, pegs_t: int, holes_t: int,
+                      rows: int, cols: int) -> Optional[Match]:
+    """●●○ / ○●● по строкам, затем по столбцам."""
+    found = _first_line(
+        pegs & (pegs >> 1) & (holes >> 2),
+        holes & (pegs >> 1) & (pegs >> 2),
+        cols + 2, 3
+    )
+    if found:
+        r, c, step = found
+        return (r, c, 0, step)
+
+    found = _first_line(
+        pegs_t & (pegs_t >> 1) & (holes_t >> 2),
+        holes_t & (pegs_t >> 1) & (pegs_t >> 2),
+        rows + 2, 3
+    )
+    if found:
+        c, r, step = found
+        return (r, c, step, 0)
+
+    return None
+
+
+def _match_four_bits(pegs: int, holes: int, pegs_t: int, holes_t: int,
+                     rows: int, cols: int) -> Optional[Match]:
+    """●●●○ / ○●●● по строкам, затем по столбцам."""
+    found = _first_line(
+        pegs & (pegs >> 1) & (pegs >> 2) & (holes >> 3),
+        holes & (pegs >> 1) & (pegs >> 2) & (pegs >> 3),
+        cols + 2, 4
+    )
+    if found:
+        r, c, step = found
+        return (r, c, 0, step)
+
+    found = _first_line(
+        pegs_t & (pegs_t >> 1) & (pegs_t >> 2) & (holes_t >> 3),
+        holes_t & (pegs_t >> 1) & (pegs_t >> 2) & (pegs_t >> 3),
+        rows + 2, 4
+    )
+    if found:
+        c, r, step = found
+        return (r, c, step, 0)
+
     return None
 
 
+def match_line_of_three(board: List[List[str]]) -> Optional[Tuple[int, int, int, int]]:
+    """Находит три клетки подряд: ●●○ или ○●●."""
+    pegs, holes = _board_to_bits(board)
+    pegs_t, holes_t = _board_to_bits(board, transpose=True)
+    return _match_three_bits(pegs, holes, pegs_t, holes_t, len(board), len(board[0]))
+
+
 def match_line_of_four(board: List[List[str]]) -> Optional[Tuple[int, int, int, int]]:
     """Находит ●●●○ или ○●●●."""
-    rows, cols = len(board), len(board[0])
-    
-    for r in range(rows):
-        for c in range(cols - 3):
-            if all(board[r][c+i] == '●' for i in range(3)) and board[r][c+3] == '○':
-                return (r, c, 0, 1)
-            if board[r][c] == '○' and all(board[r][c+i] == '●' for i in range(1, 4)):
-                return (r, c+3, 0, -1)
-    
-    for c in range(cols):
-        for r in range(rows - 3):
-            if all(board[r+i][c] == '●' for i in range(3)) and board[r+3][c] == '○':
-                return (r, c, 1, 0)
-            if board[r][c] == '○' and all(board[r+i][c] == '●' for i in range(1, 4)):
-                return (r+3, c, -1, 0)
-    
+    pegs, holes = _board_to_bits(board)
+    pegs_t, holes_t = _board_to_bits(board, transpose=True)
+    return _match_four_bits(pegs, holes, pegs_t, holes_t, len(board), len(board[0]))
+
+
+def _match_patterns_bits(pegs: int, holes: int, pegs_t: int, holes_t: int,
+                         rows: int, cols: int) -> Optional[Match]:
+    """
+    match_patterns на уже закодированной сетке.
+
+    Линии из четырёх и из трёх проверяются за один проход: сдвиги pegs
+    и пары ●● считаются один раз и общие для обоих шаблонов. Порядок
+    как у _match_four_bits, затем _match_three_bits.
+    """
+    stride, stride_t = cols + 2, rows + 2
+    p1, p2 = pegs >> 1, pegs >> 2
+    t1, t2 = pegs_t >> 1, pegs_t >> 2
+    # ●● с началом в клетке и ●● со сдвигом на одну клетку
+    pair, pair_t = pegs & p1, pegs_t & t1
+    mid, mid_t = p1 & p2, t1 & t2
+
+    found = _first_line(pair & p2 & (holes >> 3), holes & mid & (pegs >> 3), stride, 4)
+    if found:
+        r, c, step = found
+        return (r, c, 0, step)
+    found = _first_line(pair_t & t2 & (holes_t >> 3), holes_t & mid_t & (pegs_t >> 3), stride_t, 4)
+    if found:
+        c, r, step = found
+        return (r, c, step, 0)
+
+    found = _first_line(pair & (holes >> 2), holes & mid, stride, 3)
+    if found:
+        r, c, step = found
+        return (r, c, 0, step)
+    found = _first_line(pair_t & (holes_t >> 2), holes_t & mid_t, stride_t, 3)
+    if found:
+        c, r, step = found
+        return (r, c, step, 0)
+
     return None
 
 
 def match_patterns(board: List[List[str]]) -> Optional[Tuple[int, int, int, int]]:
     """Ищет любой подходящий паттерн."""
-    patterns = [match_line_of_four, match_line_of_three]
-    
-    for pattern_fn in patterns:
-        result = pattern_fn(board)
-        if result:
-            return result
-    
-    return None
+    pegs, holes = _board_to_bits(board)
+    pegs_t, holes_t = _board_to_bits(board, transpose=True)
+    return _match_patterns_bits(pegs, holes, pegs_t, holes_t, len(board), len(board[0]))
 
 
 def apply_pattern_sequence(board: List[List[str]]) -> Optional[List[str]]:
     """
     Жадно применяет паттерны пока возможно.
     Возвращает список ходов если решено, иначе None.
+
+    Работает на битовых масках: исходная доска не изменяется и не копируется.
     """
     path = []
-    board = deepcopy(board)
+    rows, cols = len(board), len(board[0])
+    stride, stride_t = cols + 2, rows + 2
+    pegs, holes = _board_to_bits(board)
+    pegs_t, holes_t = _board_to_bits(board, transpose=True)
     
     while True:
-        match = match_patterns(board)
+        match = _match_patterns_bits(pegs, holes, pegs_t, holes_t, rows, cols)
         if not match:
             break
         
         r, c, dr, dc = match
-        # Применяем ход
+        # Применяем ход: from и jumped становятся дырками, to — колышком
+        r1, c1 = r + dr, c + dc
         r2, c2 = r + 2*dr, c + 2*dc
-        board[r][c] = '○'
-        board[r + dr][c + dc] = '○'
-        board[r2][c2] = '●'
+        cleared = (1 << (r * stride + c)) | (1 << (r1 * stride + c1))
+        placed = 1 << (r2 * stride + c2)
+        pegs = (pegs & ~cleared) | placed
+        holes = (holes | cleared) & ~placed
+        
+        cleared_t = (1 << (c * stride_t + r)) | (1 << (c1 * stride_t + r1))
+        placed_t = 1 << (c2 * stride_t + r2)
+        pegs_t = (pegs_t & ~cleared_t) | placed_t
+        holes_t = (holes_t | cleared_t) & ~placed_t
         
-        from core.utils import index_to_pos
         move_str = f"{index_to_pos(r, c)} → {index_to_pos(r2, c2)}"
         path.append(move_str)
     
-    peg_count = sum(row.count('●') for row in board)
-    return path if peg_count == 1 else None
+    return path if pegs.bit_count() == 1 else None
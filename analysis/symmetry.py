@@ -2,51 +2,136 @@
 analysis/symmetry.py
 
 Работа с симметриями доски.
+
+Внутри позиции хранятся как битовые маски (бит r * size + c),
+преобразования применяются через побайтовые таблицы (LUT).
+В frozenset позиции переводятся только на границе API.
 """
 
-from typing import FrozenSet, Tuple
+from functools import lru_cache
+from typing import Callable, FrozenSet, List, Tuple
 
 Position = Tuple[int, int]
 
+# Таблица для одного байта: image[byte] — маска образа этих 8 клеток
+ByteLUT = Tuple[Tuple[int, ...], ...]
+
+
+def _set_to_bits(positions: FrozenSet[Position], size: int) -> int:
+    """Множество клеток → битовая маска."""
+    bits = 0
+    for r, c in positions:
+        bits |= 1 << (r * size + c)
+    return bits
+
+
+def _bits_to_set(bits: int, size: int) -> FrozenSet[Position]:
+    """Битовая маска → множество клеток."""
+    cells = []
+    while bits:
+        low = bits & -bits
+        cells.append(divmod(low.bit_length() - 1, size))
+        bits ^= low
+    return frozenset(cells)
+
+
+def _build_lut(transform: Callable[[int, int, int], Position], size: int) -> ByteLUT:
+    """Побайтовая таблица перестановки клеток для доски size x size."""
+    images = []
+    for pos in range(size * size):
+        r, c = transform(*divmod(pos, size), size)
+        images.append(1 << (r * size + c))
+
+    luts = []
+    for base in range(0, size * size, 8):
+        chunk = images[base:base + 8]
+        table = [0] * (1 << len(chunk))
+        for byte in range(1, len(table)):
+            low = byte & -byte
+            table[byte] = table[byte ^ low] | chunk[low.bit_length() - 1]
+        luts.append(tuple(table))
+    return tuple(luts)
+
+
+@lru_cache(maxsize=None)
+def _rotate_lut(size: int) -> ByteLUT:
+    return _build_lut(lambda r, c, n: (c, n - 1 - r), size)
+
+
+@lru_cache(maxsize=None)
+def _flip_h_lut(size: int) -> ByteLUT:
+    return _build_lut(lambda r, c, n: (r, n - 1 - c), size)
+
+
+@lru_cache(maxsize=None)
+def _flip_v_lut(size: int) -> ByteLUT:
+    return _build_lut(lambda r, c, n: (n - 1 - r, c), size)
+
+
+def _apply_lut(bits: int, luts: ByteLUT) -> int:
+    """Применяет перестановку: по одному обращению к таблице на байт."""
+    result = 0
+    for table in luts:
+        result |= table[bits & 0xFF]
+        bits >>= 8
+    return result
+
+
+def _symmetry_bits(bits: int, size: int) -> List[int]:
+    """8 симметрий битовой маски (4 поворота × 2 отражения)."""
+    rotate = _rotate_lut(size)
+    flip = _flip_h_lut(size)
+    symmetries = []
+    for _ in range(4):
+        symmetries.append(bits)
+        symmetries.append(_apply_lut(bits, flip))
+        bits = _apply_lut(bits, rotate)
+    return symmetries
+
 
 def rotate_90(positions: FrozenSet[Position], size: int = 7) -> FrozenSet[Position]:
     """Поворот на 90° по часовой стрелке."""
-    return frozenset((c, size - 1 - r) for r, c in positions)
+    bits = _apply_lut(_set_to_bits(positions, size), _rotate_lut(size))
+    return _bits_to_set(bits, size)
 
 
 def flip_horizontal(positions: FrozenSet[Position], size: int = 7) -> FrozenSet[Position]:
     """Отражение по горизонтали."""
-    return frozenset((r, size - 1 - c) for r, c in positions)
+    bits = _apply_lut(_set_to_bits(positions, size), _flip_h_lut(size))
+    return _bits_to_set(bits, size)
 
 
 def flip_vertical(positions: FrozenSet[Position], size: int = 7) -> FrozenSet[Position]:
     """Отражение по вертикали."""
-    return frozenset((size - 1 - r, c) for r, c in positions)
+    bits = _apply_lut(_set_to_bits(positions, size), _flip_v_lut(size))
+    return _bits_to_set(bits, size)
 
 
-def get_all_symmetries(positions: FrozenSet[Position], size: int = 7) -> list:
+def get_all_symmetries(positions: FrozenSet[Position], size: int = 7) -> List[int]:
     """
     Генерирует все 8 симметрий позиции.
     (4 поворота × 2 отражения)
+
+    Returns:
+        Список битовых масок (бит r * size + c)
     """
-    symmetries = []
-    current = positions
-    
-    for _ in range(4):
-        symmetries.append(current)
-        symmetries.append(flip_horizontal(current, size))
-        current = rotate_90(current, size)
-    
-    return symmetries
+    return _symmetry_bits(_set_to_bits(positions, size), size)
+
+
+def symmetry_canonical_bits(bits: int, size: int = 7) -> int:
+    """
+    Каноническая форма битовой маски (бит r * size + c): минимум из 8
+    симметрий, без перевода в frozenset.
+    """
+    return min(_symmetry_bits(bits, size))
 
 
 def get_symmetry_canonical(positions: FrozenSet[Position], size: int = 7) -> FrozenSet[Position]:
     """
-    Возвращает каноническую форму (минимальную из симметрий).
+    Возвращает каноническую форму (симметрию с минимальной маской).
     Используется для сокращения visited set.
     """
-    symmetries = get_all_symmetries(positions, size)
-    return min(symmetries, key=lambda s: tuple(sorted(s)))
+    return _bits_to_set(symmetry_canonical_bits(_set_to_bits(positions, size), size), size)
 
 
 def count_symmetries(positions: FrozenSet[Position], size: int = 7) -> int:
@@ -54,5 +139,4 @@ def count_symmetries(positions: FrozenSet[Position], size: int = 7) -> int:
     Считает уникальные симметрии позиции.
     Если позиция симметрична, число < 8.
     """
-    symmetries = get_all_symmetries(positions, size)
-    return len(set(tuple(sorted(s)) for s in symmetries))
+    return len(set(get_all_symmetries(positions, size)))
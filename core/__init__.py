@@ -7,7 +7,7 @@ core - Ядро Peg Solitaire
 from .board import Board
 from .bitboard import (
     BitBoard, ENGLISH_VALID_POSITIONS, CENTER_POS,
-    get_valid_positions, is_english_board, get_center_position
+    get_valid_positions, is_english_board, get_center_position, count_isolated_pegs
 )
 from .zobrist import ZobristBitBoard, compute_zobrist_hash, update_zobrist_hash
 from .utils import (
@@ -21,6 +21,7 @@ __all__ = [
     'compute_zobrist_hash', 'update_zobrist_hash',
     'ENGLISH_VALID_POSITIONS', 'CENTER_POS',
     'get_valid_positions', 'is_english_board', 'get_center_position',
+    'count_isolated_pegs',
     'DIRECTIONS', 'PEG', 'HOLE', 'EMPTY',
     'board_to_str', 'index_to_pos', 'pos_to_index', 'count_pegs'
 ]
@@ -5,24 +5,9 @@ core/bitboard.py
 Для английской доски (33 позиции) — один 64-bit int.
 """
 
-import sys
-from typing import List, Tuple, Optional, Set
+from typing import FrozenSet, List, Tuple, Optional
 from functools import lru_cache
 
-# Быстрый popcount (подсчёт битов)
-if sys.version_info >= (3, 10):
-    # Python 3.10+ имеет встроенный bit_count() (использует CPU popcount)
-    def _popcount(x: int) -> int:
-        return x.bit_count()
-else:
-    # Fallback для старых версий Python
-    def _popcount(x: int) -> int:
-        """Быстрый подсчёт битов (popcount) для Python < 3.10."""
-        x = x - ((x >> 1) & 0x5555555555555555)
-        x = (x & 0x3333333333333333) + ((x >> 2) & 0x3333333333333333)
-        x = (x + (x >> 4)) & 0x0F0F0F0F0F0F0F0F
-        return ((x * 0x0101010101010101) >> 56) & 0xFF
-
 # Валидные позиции английской доски (33 клетки)
 ENGLISH_VALID_POSITIONS = frozenset([
     2, 3, 4, 9, 10, 11,
@@ -32,15 +17,155 @@ ENGLISH_VALID_POSITIONS = frozenset([
     37, 38, 39, 44, 45, 46
 ])
 
-VALID_MASK = sum(1 << pos for pos in ENGLISH_VALID_POSITIONS)
+# Маска креста литералом: группы по 7 бит — строки 6..0, в каждой столбцы 6..0
+# (совпадает с sum(1 << pos for pos in ENGLISH_VALID_POSITIONS))
+VALID_MASK = 0b0011100_0011100_1111111_1111111_1111111_0011100_0011100
 CENTER_POS = 24
 ENGLISH_START = VALID_MASK ^ (1 << CENTER_POS)
 ENGLISH_GOAL = 1 << CENTER_POS
 
+# Граничные маски по столбцам/строкам: откуда ход в данном направлении
+# не выходит за пределы 7x7 (и не "переносится" на соседнюю строку)
+COLS_0_TO_4 = sum(1 << (r * 7 + c) for r in range(7) for c in range(5))
+COLS_2_TO_6 = sum(1 << (r * 7 + c) for r in range(7) for c in range(2, 7))
+ROWS_0_TO_4 = sum(1 << (r * 7 + c) for r in range(5) for c in range(7))
+ROWS_2_TO_6 = sum(1 << (r * 7 + c) for r in range(2, 7) for c in range(7))
+# Сдвиг на одну клетку по горизонтали без переноса на соседнюю строку
+COLS_0_TO_5 = sum(1 << (r * 7 + c) for r in range(7) for c in range(6))
+COLS_1_TO_6 = sum(1 << (r * 7 + c) for r in range(7) for c in range(1, 7))
+
+
+@lru_cache(maxsize=256)
+def _move_source_masks(valid_mask: int) -> Tuple[int, int, int, int]:
+    """
+    Маски клеток, из которых возможен ход вправо/влево/вниз/вверх.
+
+    Клетка попадает в маску, если from, jumped и to — валидные клетки
+    одной строки (столбца). Результат кэшируется по valid_mask.
+    """
+    return (
+        valid_mask & (valid_mask >> 1) & (valid_mask >> 2) & COLS_0_TO_4,
+        valid_mask & (valid_mask << 1) & (valid_mask << 2) & COLS_2_TO_6,
+        valid_mask & (valid_mask >> 7) & (valid_mask >> 14) & ROWS_0_TO_4,
+        valid_mask & (valid_mask << 7) & (valid_mask << 14) & ROWS_2_TO_6,
+    )
+
+
+# Маски направлений для английской доски
+ENGLISH_RIGHT_SRC, ENGLISH_LEFT_SRC, ENGLISH_DOWN_SRC, ENGLISH_UP_SRC = (
+    _move_source_masks(VALID_MASK)
+)
+
+
+# Строка и столбец клетки: ROW[pos], COL[pos] (без деления в циклах)
+ROW = tuple(pos // 7 for pos in range(49))
+COL = tuple(pos % 7 for pos in range(49))
+
+# Бит клетки: POS_MASK[pos] == 1 << pos (без создания нового int на каждый сдвиг)
+POS_MASK = tuple(1 << pos for pos in range(49))
+
+# Соседи клетки по 4 направлениям в пределах 7x7 (без переноса на соседнюю строку)
+NEIGHBOR_MASK = tuple(
+    sum(
+        1 << (r * 7 + c)
+        for r, c in ((ROW[pos] - 1, COL[pos]), (ROW[pos] + 1, COL[pos]),
+                     (ROW[pos], COL[pos] - 1), (ROW[pos], COL[pos] + 1))
+        if 0 <= r < 7 and 0 <= c < 7
+    )
+    for pos in range(49)
+)
+
+
+def _build_moves_from() -> Tuple[Tuple[Optional[Tuple[int, int, int]], ...], ...]:
+    """
+    MOVES_FROM[pos] = (→, ←, ↓, ↑): готовые кортежи (from, jumped, to)
+    или None, если ход выходит за пределы 7x7.
+    """
+    table = []
+    for pos in range(49):
+        row, col = ROW[pos], COL[pos]
+        table.append((
+            (pos, pos + 1, pos + 2) if col <= 4 else None,
+            (pos, pos - 1, pos - 2) if col >= 2 else None,
+            (pos, pos + 7, pos + 14) if row <= 4 else None,
+            (pos, pos - 7, pos - 14) if row >= 2 else None,
+        ))
+    return tuple(table)
+
+
+# Таблица ходов по клеткам: get_moves добавляет в список готовые кортежи
+MOVES_FROM = _build_moves_from()
+
+
+def _build_english_moves() -> Tuple[Tuple[int, int, int], ...]:
+    """Все 76 ходов английской доски в порядке get_moves."""
+    return tuple(
+        move
+        for pos in sorted(ENGLISH_VALID_POSITIONS)
+        for move in MOVES_FROM[pos]
+        if move is not None and all((VALID_MASK >> p) & 1 for p in move)
+    )
+
+
+# Номера ходов: ENGLISH_MOVES[move_id] = (from, jumped, to)
+ENGLISH_MOVES = _build_english_moves()
+ENGLISH_MOVE_ID = {move: move_id for move_id, move in enumerate(ENGLISH_MOVES)}
+
+
+def _compile_english_moves(name: str = "_fill_moves_english", literal=repr):
+    """
+    Генерирует развёрнутую функцию ходов для английской доски.
+
+    Форма доски известна заранее, поэтому цикл по клеткам заменяется
+    прямой последовательностью проверок: для каждой из 33 клеток —
+    ``if sources & BIT:`` и внутри только реально возможные направления.
+    Порядок ходов тот же, что в цикле (по позиции, затем →, ←, ↓, ↑).
+    Ходы — литералы, т.е. константы байткода.
+
+    Args:
+        name: имя генерируемой функции
+        literal: move -> исходный код значения, добавляемого в список
+                 (по умолчанию сам кортеж хода)
+    """
+    lines = [
+        f"def {name}(pegs, moves):",
+        f"    holes = {VALID_MASK:#x} & ~pegs",
+        f"    right = pegs & (pegs >> 1) & (holes >> 2) & {ENGLISH_RIGHT_SRC:#x}",
+        f"    left = pegs & (pegs << 1) & (holes << 2) & {ENGLISH_LEFT_SRC:#x}",
+        f"    down = pegs & (pegs >> 7) & (holes >> 14) & {ENGLISH_DOWN_SRC:#x}",
+        f"    up = pegs & (pegs << 7) & (holes << 14) & {ENGLISH_UP_SRC:#x}",
+        "    sources = right | left | down | up",
+        "    append = moves.append",
+    ]
+    directions = (
+        ("right", ENGLISH_RIGHT_SRC), ("left", ENGLISH_LEFT_SRC),
+        ("down", ENGLISH_DOWN_SRC), ("up", ENGLISH_UP_SRC),
+    )
+    for pos in sorted(ENGLISH_VALID_POSITIONS):
+        bit = 1 << pos
+        body = [
+            f"        if {direction} & {bit:#x}: append({literal(MOVES_FROM[pos][d])})"
+            for d, (direction, src) in enumerate(directions) if src & bit
+        ]
+        if body:
+            lines.append(f"    if sources & {bit:#x}:")
+            lines.extend(body)
+
+    namespace: dict = {}
+    exec(compile("\n".join(lines) + "\n", f"<bitboard:{name}>", "exec"), namespace)
+    return namespace[name]
+
+
+_fill_moves_english = _compile_english_moves()
+# То же, но в список добавляются номера ходов (индексы ENGLISH_MOVES)
+_fill_move_ids_english = _compile_english_moves(
+    "_fill_move_ids_english", lambda move: str(ENGLISH_MOVE_ID[move])
+)
+
 
 def pos_to_coords(pos: int) -> Tuple[int, int]:
     """Линейная позиция → (row, col)."""
-    return pos // 7, pos % 7
+    return ROW[pos], COL[pos]
 
 
 def coords_to_pos(row: int, col: int) -> int:
@@ -48,34 +173,153 @@ def coords_to_pos(row: int, col: int) -> int:
     return row * 7 + col
 
 
-def _rotate_90_pegs(pegs: int) -> int:
-    """Поворот на 90° (работает напрямую с pegs, без создания объекта)."""
-    new_pegs = 0
-    for pos in ENGLISH_VALID_POSITIONS:
-        if pegs & (1 << pos):
-            r, c = pos // 7, pos % 7
-            nr, nc = c, 6 - r
-            new_pos = nr * 7 + nc
-            if new_pos in ENGLISH_VALID_POSITIONS:
-                new_pegs |= (1 << new_pos)
-    return new_pegs
-
-
-def _flip_h_pegs(pegs: int) -> int:
-    """Горизонтальное отражение (работает напрямую с pegs, без создания объекта)."""
-    new_pegs = 0
+def _compile_permutation(perm: Tuple[int, ...], name: str):
+    """
+    Компилирует перестановку битов в функцию из нескольких mask-shift операций.
+
+    Биты с одинаковым сдвигом (dst - src) объединяются в одну маску, поэтому
+    вместо цикла по 33 клеткам получается одно выражение вида
+    ``(pegs & M1) << s1 | (pegs & M2) >> s2 | ...``.
+
+    Args:
+        perm: perm[src] = dst (или -1, если бит отбрасывается)
+        name: имя генерируемой функции
+    """
+    groups = {}
+    for src, dst in enumerate(perm):
+        if dst >= 0:
+            groups[dst - src] = groups.get(dst - src, 0) | (1 << src)
+
+    terms = []
+    for shift, mask in sorted(groups.items()):
+        if shift > 0:
+            terms.append(f"((pegs & {mask:#x}) << {shift})")
+        elif shift < 0:
+            terms.append(f"((pegs & {mask:#x}) >> {-shift})")
+        else:
+            terms.append(f"(pegs & {mask:#x})")
+
+    source = f"def {name}(pegs):\n    return {' | '.join(terms) or '0'}\n"
+    namespace: dict = {}
+    exec(compile(source, f"<bitboard:{name}>", "exec"), namespace)
+    return namespace[name]
+
+
+def _build_map(transform) -> Tuple[int, ...]:
+    """Строит таблицу pos → new_pos для преобразования (r, c) → (nr, nc)."""
+    table = [-1] * 49
     for pos in ENGLISH_VALID_POSITIONS:
-        if pegs & (1 << pos):
-            r, c = pos // 7, pos % 7
-            new_pos = r * 7 + (6 - c)
-            if new_pos in ENGLISH_VALID_POSITIONS:
-                new_pegs |= (1 << new_pos)
-    return new_pegs
+        nr, nc = transform(pos // 7, pos % 7)
+        new_pos = nr * 7 + nc
+        if (VALID_MASK >> new_pos) & 1:
+            table[pos] = new_pos
+    return tuple(table)
+
+
+# Таблицы перестановок: ROT_MAP[src] / FLIP_MAP[src] — куда переходит бит src
+ROT_MAP = _build_map(lambda r, c: (c, 6 - r))
+FLIP_MAP = _build_map(lambda r, c: (r, 6 - c))
+
+_rotate_90_pegs = _compile_permutation(ROT_MAP, "_rotate_90_pegs")
+_rotate_90_pegs.__doc__ = "Поворот на 90° (работает напрямую с pegs, без создания объекта)."
+
+_flip_h_pegs = _compile_permutation(FLIP_MAP, "_flip_h_pegs")
+_flip_h_pegs.__doc__ = "Горизонтальное отражение (работает напрямую с pegs, без создания объекта)."
+
+
+def _symmetry_maps() -> Tuple[Tuple[int, ...], ...]:
+    """8 перестановок креста: повороты на 0/90/180/270° и их отражения."""
+    def compose(first, second):
+        return tuple(second[p] if p >= 0 else -1 for p in first)
+
+    identity = tuple(p if (VALID_MASK >> p) & 1 else -1 for p in range(49))
+    maps = []
+    current = identity
+    for _ in range(4):
+        maps.append(current)
+        maps.append(compose(current, FLIP_MAP))
+        current = compose(current, ROT_MAP)
+    return tuple(maps)
+
+
+# SYMMETRY_MAPS[t][src] = dst; SYMMETRY_MAPS[0] — тождественная
+SYMMETRY_MAPS = _symmetry_maps()
+_SYMMETRY_FUNCS = tuple(
+    _compile_permutation(perm, f"_symmetry_{t}") for t, perm in enumerate(SYMMETRY_MAPS)
+)
+
+
+def _prefix_sources() -> Tuple[Tuple[int, ...], ...]:
+    """
+    Для клеток креста от старшей к младшей: бит-источник в pegs,
+    который каждая из 8 симметрий переносит в эту клетку.
+    """
+    rows = []
+    for dst in sorted(ENGLISH_VALID_POSITIONS, reverse=True):
+        rows.append(tuple(1 << perm.index(dst) for perm in SYMMETRY_MAPS))
+    return tuple(rows)
+
+
+_PREFIX_SOURCES = _prefix_sources()
+
+
+@lru_cache(maxsize=1 << 20)
+def _canonical_pegs(pegs: int) -> int:
+    """
+    Минимальная из 8 симметрий английской доски (мемоизировано).
+
+    Симметрии не строятся целиком: клетки сравниваются от старшего бита
+    к младшему, и кандидат с 1 там, где у другого 0, отбрасывается.
+    Обычно после нескольких клеток остаётся один кандидат —
+    применяется только его перестановка.
+
+    Одни и те же позиции постоянно встречаются в разных ветках поиска
+    (транспозиции), поэтому результат кэшируется по pegs.
+    Сброс кэша: ``_canonical_pegs.cache_clear()``.
+    """
+    live = range(8)
+    for sources in _PREFIX_SOURCES:
+        zero = [t for t in live if not pegs & sources[t]]
+        if zero and len(zero) < len(live):
+            if len(zero) == 1:
+                return _SYMMETRY_FUNCS[zero[0]](pegs)
+            live = zero
+    # Оставшиеся кандидаты дают одну и ту же маску
+    return _SYMMETRY_FUNCS[live[0]](pegs)
+
+
+_object_new = object.__new__
+
+# to_string: код клетки (0 — вне доски, 1 — дырка, 2 — фишка) → два символа
+_CELL = ('  ', '○ ', '● ')
+
+
+def _render_pegs(pegs: int, valid_mask: int) -> str:
+    """Текст доски 7x7 по маскам (общий для Python и Cython BitBoard)."""
+    pegs &= valid_mask
+    rows = []
+    for r in range(7):
+        row = "".join([
+            _CELL[(valid_mask >> pos & 1) + (pegs >> pos & 1)]
+            for pos in range(r * 7, r * 7 + 7)
+        ])
+        rows.append(row.rstrip())
+    return "\n".join(rows)
 
 
 class BitBoard:
-    """Битовое представление доски Peg Solitaire."""
-    __slots__ = ('pegs', '_hash', '_count', 'valid_mask')
+    """
+    Битовое представление доски Peg Solitaire.
+
+    Экземпляры неизменяемы по соглашению: english_start()/english_goal()
+    возвращают общие объекты, apply_move() всегда создаёт новую доску.
+    """
+    __slots__ = ('pegs', '_count', 'valid_mask', '_canonical', '_moves', '_dead')
+
+    # Симметричные позиции английской доски равны и имеют один хеш,
+    # поэтому set/dict схлопывают их автоматически. False — сравнение по pegs
+    # (для отладки).
+    USE_SYMMETRY_HASH = True
 
     def __init__(self, pegs: int, valid_mask: int = None):
         """
@@ -87,8 +331,11 @@ class BitBoard:
                        - Иначе → все 49 клеток (произвольная 7x7)
         """
         self.pegs = pegs
-        self._hash = hash(pegs)
-        self._count = _popcount(pegs)
+        self._count = pegs.bit_count()
+        # Ленивые кэши (доска неизменяема): канонические pegs, ходы, тупик
+        self._canonical = None
+        self._moves = None
+        self._dead = None
         
         if valid_mask is None:
             # Автоопределение: если есть фишки вне английского креста → полная 7x7
@@ -99,14 +346,30 @@ class BitBoard:
         else:
             self.valid_mask = valid_mask
 
+    @classmethod
+    def _from_parts(cls, pegs: int, count: int, valid_mask: int) -> 'BitBoard':
+        """Быстрый конструктор без __init__ (count и valid_mask уже известны)."""
+        board = _object_new(cls)
+        board.pegs = pegs
+        board._count = count
+        board.valid_mask = valid_mask
+        board._canonical = None
+        board._moves = None
+        board._dead = None
+        return board
+
     @classmethod
     def english_start(cls) -> 'BitBoard':
-        """Стандартная английская доска."""
+        """Стандартная английская доска (общий экземпляр)."""
+        if cls is BitBoard:
+            return _ENGLISH_START_BOARD
         return cls(ENGLISH_START)
 
     @classmethod
     def english_goal(cls) -> 'BitBoard':
-        """Целевое состояние (1 колышек в центре)."""
+        """Целевое состояние (1 колышек в центре, общий экземпляр)."""
+        if cls is BitBoard:
+            return _ENGLISH_GOAL_BOARD
         return cls(ENGLISH_GOAL)
 
     @classmethod
@@ -121,65 +384,100 @@ class BitBoard:
         return self._count
 
     def has_peg(self, pos: int) -> bool:
-        return bool(self.pegs & (1 << pos))
+        return bool(self.pegs & POS_MASK[pos])
 
     def get_moves(self) -> List[Tuple[int, int, int]]:
         """
         Генерирует все допустимые ходы: (from, jumped, to).
         
         Учитывает valid_mask: ходы возможны только в клетки, которые существуют на доске.
+        Результат кэшируется на экземпляре (повторные вызовы — копия кэша,
+        вызывающий может менять список).
         """
-        moves: List[Tuple[int, int, int]] = []
-        pegs = self.pegs
-        holes = self.valid_mask & ~pegs  # Дырки = валидные клетки без фишек
-
-        # Генерируем ходы, проверяя что все позиции (from, jumped, to) в valid_mask
-        for pos in range(49):
-            if not (pegs >> pos) & 1:
-                continue
-            if not (self.valid_mask >> pos) & 1:
-                continue  # Эта клетка не существует на доске
-            
-            r, c = divmod(pos, 7)
-
-            # Вправо
-            if c <= 4:
-                jumped = pos + 1
-                to = pos + 2
-                if ((self.valid_mask >> jumped) & 1) and ((self.valid_mask >> to) & 1):
-                    if ((pegs >> jumped) & 1) and ((holes >> to) & 1):
-                        moves.append((pos, jumped, to))
-            
-            # Влево
-            if c >= 2:
-                jumped = pos - 1
-                to = pos - 2
-                if ((self.valid_mask >> jumped) & 1) and ((self.valid_mask >> to) & 1):
-                    if ((pegs >> jumped) & 1) and ((holes >> to) & 1):
-                        moves.append((pos, jumped, to))
-            
-            # Вниз
-            if r <= 4:
-                jumped = pos + 7
-                to = pos + 14
-                if ((self.valid_mask >> jumped) & 1) and ((self.valid_mask >> to) & 1):
-                    if ((pegs >> jumped) & 1) and ((holes >> to) & 1):
-                        moves.append((pos, jumped, to))
-            
-            # Вверх
-            if r >= 2:
-                jumped = pos - 7
-                to = pos - 14
-                if ((self.valid_mask >> jumped) & 1) and ((self.valid_mask >> to) & 1):
-                    if ((pegs >> jumped) & 1) and ((holes >> to) & 1):
-                        moves.append((pos, jumped, to))
+        cached = self._moves
+        if cached is not None:
+            return list(cached)
 
+        moves: List[Tuple[int, int, int]] = []
+        if self.valid_mask == VALID_MASK:
+            _fill_moves_english(self.pegs, moves)
+        else:
+            self.fill_moves(moves)
+        self._moves = tuple(moves)
         return moves
 
+    def fill_moves(self, moves: List[Tuple[int, int, int]]) -> int:
+        """
+        Заполняет переданный список ходами (как get_moves), возвращает их число.
+
+        Список очищается перед заполнением — поиск может переиспользовать
+        один буфер на каждую глубину вместо нового списка на узел.
+        """
+        moves.clear()
+        if self._moves is not None:
+            moves.extend(self._moves)
+            return len(moves)
+        pegs = self.pegs
+        valid_mask = self.valid_mask
+        if valid_mask == VALID_MASK:
+            _fill_moves_english(pegs, moves)
+            return len(moves)
+
+        holes = valid_mask & ~pegs  # Дырки = валидные клетки без фишек
+        right_src, left_src, down_src, up_src = _move_source_masks(valid_mask)
+
+        # Маски направлений уже учитывают границы и valid_mask
+        can_right = pegs & (pegs >> 1) & (holes >> 2) & right_src
+        can_left = pegs & (pegs << 1) & (holes << 2) & left_src
+        can_down = pegs & (pegs >> 7) & (holes >> 14) & down_src
+        can_up = pegs & (pegs << 7) & (holes << 14) & up_src
+
+        # Перебираем только клетки, откуда есть хотя бы один ход.
+        # Порядок ходов: по позиции, затем →, ←, ↓, ↑
+        sources = can_right | can_left | can_down | can_up
+        append = moves.append
+        while sources:
+            lsb = sources & -sources
+            sources ^= lsb
+            right, left, down, up = MOVES_FROM[lsb.bit_length() - 1]
+            if can_right & lsb:
+                append(right)
+            if can_left & lsb:
+                append(left)
+            if can_down & lsb:
+                append(down)
+            if can_up & lsb:
+                append(up)
+
+        return len(moves)
+
+    def count_moves(self) -> int:
+        """
+        Число допустимых ходов без построения списка (как len(get_moves())):
+        popcount масок клеток, откуда есть ход в каждом направлении.
+        """
+        if self._moves is not None:
+            return len(self._moves)
+        pegs = self.pegs
+        valid_mask = self.valid_mask
+        holes = valid_mask & ~pegs
+        if valid_mask == VALID_MASK:
+            right_src, left_src, down_src, up_src = (
+                ENGLISH_RIGHT_SRC, ENGLISH_LEFT_SRC, ENGLISH_DOWN_SRC, ENGLISH_UP_SRC
+            )
+        else:
+            right_src, left_src, down_src, up_src = _move_source_masks(valid_mask)
+        return (
+            (pegs & (pegs >> 1) & (holes >> 2) & right_src).bit_count()
+            + (pegs & (pegs << 1) & (holes << 2) & left_src).bit_count()
+            + (pegs & (pegs >> 7) & (holes >> 14) & down_src).bit_count()
+            + (pegs & (pegs << 7) & (holes << 14) & up_src).bit_count()
+        )
+
     def apply_move(self, from_pos: int, jumped: int, to_pos: int) -> 'BitBoard':
         """Применяет ход — O(1) XOR операции. Сохраняет valid_mask."""
-        new_pegs = self.pegs ^ (1 << from_pos) ^ (1 << jumped) ^ (1 << to_pos)
-        return BitBoard(new_pegs, valid_mask=self.valid_mask)
+        new_pegs = self.pegs ^ POS_MASK[from_pos] ^ POS_MASK[jumped] ^ POS_MASK[to_pos]
+        return BitBoard._from_parts(new_pegs, new_pegs.bit_count(), self.valid_mask)
 
     def is_solved(self) -> bool:
         return self._count == 1
@@ -188,55 +486,38 @@ class BitBoard:
         return self.pegs == ENGLISH_GOAL
 
     def is_dead(self) -> bool:
-        """Проверка тупика. Учитывает valid_mask."""
+        """Проверка тупика. Учитывает valid_mask. Результат кэшируется."""
+        dead = self._dead
+        if dead is not None:
+            return dead
         if self._count <= 1:
-            return False
+            dead = False
+        elif self._moves is not None:
+            dead = not self._moves
+        else:
+            dead = self._compute_dead()
+        self._dead = dead
+        return dead
 
+    def _compute_dead(self) -> bool:
         pegs = self.pegs
-        holes = self.valid_mask & ~pegs
-
-        # Проверяем, есть ли хоть один возможный ход
-        for pos in range(49):
-            if not (pegs >> pos) & 1:
-                continue
-            if not (self.valid_mask >> pos) & 1:
-                continue  # Эта клетка не существует
-            
-            r, c = divmod(pos, 7)
-
-            # Вправо
-            if c <= 4:
-                jumped = pos + 1
-                to = pos + 2
-                if ((self.valid_mask >> jumped) & 1) and ((self.valid_mask >> to) & 1):
-                    if ((pegs >> jumped) & 1) and ((holes >> to) & 1):
-                        return False
-            
-            # Влево
-            if c >= 2:
-                jumped = pos - 1
-                to = pos - 2
-                if ((self.valid_mask >> jumped) & 1) and ((self.valid_mask >> to) & 1):
-                    if ((pegs >> jumped) & 1) and ((holes >> to) & 1):
-                        return False
-            
-            # Вниз
-            if r <= 4:
-                jumped = pos + 7
-                to = pos + 14
-                if ((self.valid_mask >> jumped) & 1) and ((self.valid_mask >> to) & 1):
-                    if ((pegs >> jumped) & 1) and ((holes >> to) & 1):
-                        return False
-            
-            # Вверх
-            if r >= 2:
-                jumped = pos - 7
-                to = pos - 14
-                if ((self.valid_mask >> jumped) & 1) and ((self.valid_mask >> to) & 1):
-                    if ((pegs >> jumped) & 1) and ((holes >> to) & 1):
-                        return False
-
-        return True
+        valid_mask = self.valid_mask
+        holes = valid_mask & ~pegs
+
+        if valid_mask == VALID_MASK:
+            right_src, left_src, down_src, up_src = (
+                ENGLISH_RIGHT_SRC, ENGLISH_LEFT_SRC, ENGLISH_DOWN_SRC, ENGLISH_UP_SRC
+            )
+        else:
+            right_src, left_src, down_src, up_src = _move_source_masks(valid_mask)
+
+        # Одно битовое выражение на все 4 направления
+        return not (
+            (pegs & (pegs >> 1) & (holes >> 2) & right_src)
+            | (pegs & (pegs << 1) & (holes << 2) & left_src)
+            | (pegs & (pegs >> 7) & (holes >> 14) & down_src)
+            | (pegs & (pegs << 7) & (holes << 14) & up_src)
+        )
 
     def canonical(self) -> 'BitBoard':
         """
@@ -250,27 +531,7 @@ class BitBoard:
         if self.valid_mask != VALID_MASK:
             return self
 
-        # Оптимизация: вычисляем все варианты напрямую через pegs, без создания объектов
-        variants_pegs = [self.pegs]
-        current_pegs = self.pegs
-        
-        # 3 поворота на 90°
-        for _ in range(3):
-            current_pegs = _rotate_90_pegs(current_pegs)
-            variants_pegs.append(current_pegs)
-        
-        # Отражение
-        flipped_pegs = _flip_h_pegs(self.pegs)
-        variants_pegs.append(flipped_pegs)
-        current_pegs = flipped_pegs
-        
-        # 3 поворота отражённой версии
-        for _ in range(3):
-            current_pegs = _rotate_90_pegs(current_pegs)
-            variants_pegs.append(current_pegs)
-        
-        # Находим минимальный и создаём объект только один раз
-        min_pegs = min(variants_pegs)
+        min_pegs = self._canonical_key()
         if min_pegs == self.pegs:
             return self
         return BitBoard(min_pegs, valid_mask=self.valid_mask)
@@ -290,43 +551,60 @@ class BitBoard:
         - Клетки в valid_mask показываются (● = фишка, ○ = дырка)
         - Клетки вне valid_mask показываются как пробелы (вырезаны из доски)
         """
-        lines = []
-        for r in range(7):
-            row = ""
-            for c in range(7):
-                pos = r * 7 + c
-                if (self.valid_mask >> pos) & 1:
-                    # Клетка существует на доске
-                    row += ("● " if self.has_peg(pos) else "○ ")
-                else:
-                    # Клетка вырезана из доски
-                    row += "  "
-            lines.append(row.rstrip())
-        return "\n".join(lines)
+        return _render_pegs(self.pegs, self.valid_mask)
+
+    def _canonical_key(self) -> int:
+        """Канонические pegs (считаются один раз на экземпляр)."""
+        canonical = self._canonical
+        if canonical is None:
+            canonical = self._canonical = _canonical_pegs(self.pegs)
+        return canonical
+
+    def _key(self) -> int:
+        """Ключ для hash/eq: каноническая форма для английской доски, иначе pegs."""
+        if self.USE_SYMMETRY_HASH and self.valid_mask == VALID_MASK:
+            return self._canonical_key()
+        return self.pegs
 
     def __hash__(self) -> int:
-        return self._hash
+        # Ключ < 2^49 — хеш int совпадает с самим числом (O(1), без обхода цифр).
+        # Zobrist здесь не используется: он не инвариантен к симметриям, а
+        # равные (симметричные) доски обязаны иметь равный хеш. Инкрементальный
+        # Zobrist — в ZobristBitBoard (core/zobrist.py).
+        return self._key()
 
     def __eq__(self, other) -> bool:
-        return isinstance(other, BitBoard) and self.pegs == other.pegs
+        return isinstance(other, BitBoard) and self._key() == other._key()
 
     def __lt__(self, other: 'BitBoard') -> bool:
-        return self.pegs < other.pegs
+        # Порядок согласован с __eq__: сравниваются те же ключи
+        return self._key() < other._key()
 
     def __repr__(self) -> str:
         return f"BitBoard({self._count} pegs)"
 
 
+# Общие экземпляры часто используемых состояний (flyweight)
+_ENGLISH_START_BOARD = BitBoard(ENGLISH_START)
+_ENGLISH_GOAL_BOARD = BitBoard(ENGLISH_GOAL)
+
+
 # =====================================================
 # Утилиты для работы с произвольными досками
 # =====================================================
 
-def get_valid_positions(board: BitBoard) -> Set[int]:
+@lru_cache(maxsize=256)
+def _valid_positions_for_mask(valid_mask: int) -> FrozenSet[int]:
+    return frozenset(pos for pos in range(49) if (valid_mask >> pos) & 1)
+
+
+def get_valid_positions(board: BitBoard) -> FrozenSet[int]:
     """
     Возвращает множество валидных позиций из board.valid_mask.
     
     Замена для ENGLISH_VALID_POSITIONS в коде, который должен работать
-    с произвольными досками.
+    с произвольными досками. Множество кэшируется по valid_mask (форма
+    доски при поиске не меняется).
     
     Args:
         board: BitBoard
@@ -334,12 +612,22 @@ def get_valid_positions(board: BitBoard) -> Set[int]:
     Returns:
         Множество позиций (0..48), которые существуют на доске
     """
-    valid_positions = set()
-    valid_mask = board.valid_mask
-    for pos in range(49):
-        if (valid_mask >> pos) & 1:
-            valid_positions.add(pos)
-    return valid_positions
+    return _valid_positions_for_mask(board.valid_mask)
+
+
+def count_isolated_pegs(board: BitBoard) -> int:
+    """
+    Количество колышков без соседей-колышков (для любой формы доски).
+    
+    Маска клеток, у которых есть сосед, — четыре сдвига pegs; клетки
+    вне valid_mask колышков не содержат и соседями не считаются.
+    """
+    pegs = board.pegs & board.valid_mask
+    has_neighbor = (
+        ((pegs >> 1) & COLS_0_TO_5) | ((pegs << 1) & COLS_1_TO_6)
+        | (pegs >> 7) | (pegs << 7)
+    )
+    return (pegs & ~has_neighbor).bit_count()
 
 
 def is_english_board(board: BitBoard) -> bool:
@@ -387,8 +675,7 @@ def get_center_position(board: BitBoard) -> Optional[int]:
     peg_coords = []
     for pos in valid_positions:
         if (pegs >> pos) & 1:
-            r, c = pos // 7, pos % 7
-            peg_coords.append((r, c))
+            peg_coords.append((ROW[pos], COL[pos]))
     
     if not peg_coords:
         return None
@@ -409,8 +696,7 @@ def get_center_position(board: BitBoard) -> Optional[int]:
     min_dist = float('inf')
     best_pos = None
     for pos in valid_positions:
-        r, c = pos // 7, pos % 7
-        dist = abs(r - center_r) + abs(c - center_c)
+        dist = abs(ROW[pos] - center_r) + abs(COL[pos] - center_c)
         if dist < min_dist:
             min_dist = dist
             best_pos = pos
@@ -0,0 +1,32 @@
+# cython: language_level=3
+"""
+core/bitboard_c.pxd
+
+Объявления cdef class BitBoard для вызова из других Cython-модулей
+без Python-диспетчеризации:
+
+    from core.bitboard_c cimport BitBoard
+"""
+
+from libc.stdint cimport uint64_t
+
+
+cdef class BitBoard:
+    cdef readonly uint64_t pegs
+    cdef readonly int _count
+    cdef readonly uint64_t valid_mask
+
+    cpdef int peg_count(self)
+    cpdef bint has_peg(self, int pos)
+    cpdef list get_moves(self)
+    cpdef int fill_moves(self, list moves)
+    cpdef int count_moves(self)
+    cpdef BitBoard apply_move(self, int from_pos, int jumped, int to_pos)
+    cpdef bint is_solved(self)
+    cpdef bint is_goal(self)
+    cpdef bint is_dead(self)
+    cpdef BitBoard canonical(self)
+    cdef uint64_t _key(self)
+
+
+cdef BitBoard make_board(uint64_t pegs, uint64_t valid_mask)
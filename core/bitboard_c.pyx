@@ -0,0 +1,206 @@
+# cython: language_level=3
+# cython: boundscheck=False
+# cython: wraparound=False
+# cython: cdivision=True
+"""
+core/bitboard_c.pyx
+
+BitBoard на Cython: pegs и valid_mask — uint64_t, без Python int в
+горячих путях (get_moves, apply_move, is_dead).
+
+API совпадает с core.bitboard.BitBoard; таблицы ходов, симметрии и
+to_string берутся из чистого Python модуля, который остаётся fallback.
+Выбор реализации — core.fast.BitBoard.
+"""
+
+from libc.stdint cimport uint64_t
+
+from . import bitboard as _py
+
+cdef extern from *:
+    int __builtin_popcountll(unsigned long long x) nogil
+    int __builtin_ctzll(unsigned long long x) nogil
+
+
+cdef uint64_t VALID_MASK = _py.VALID_MASK
+cdef uint64_t FULL_MASK = (1ULL << 49) - 1
+cdef uint64_t ENGLISH_START = _py.ENGLISH_START
+cdef uint64_t ENGLISH_GOAL = _py.ENGLISH_GOAL
+
+cdef uint64_t COLS_0_TO_4 = _py.COLS_0_TO_4
+cdef uint64_t COLS_2_TO_6 = _py.COLS_2_TO_6
+cdef uint64_t ROWS_0_TO_4 = _py.ROWS_0_TO_4
+cdef uint64_t ROWS_2_TO_6 = _py.ROWS_2_TO_6
+
+# Готовые кортежи ходов по клеткам: (→, ←, ↓, ↑)
+cdef tuple MOVES_FROM = _py.MOVES_FROM
+
+_canonical_pegs = _py._canonical_pegs
+_PyBitBoard = _py.BitBoard
+_render_pegs = _py._render_pegs
+
+
+cdef inline int popcount64(uint64_t x) noexcept nogil:
+    return __builtin_popcountll(x)
+
+
+cdef inline void move_masks(uint64_t pegs, uint64_t valid_mask,
+                            uint64_t* right, uint64_t* left,
+                            uint64_t* down, uint64_t* up) noexcept nogil:
+    """Маски клеток, откуда есть ход в каждом направлении."""
+    cdef uint64_t holes = valid_mask & ~pegs
+    cdef uint64_t valid = pegs & valid_mask
+    right[0] = (valid & (pegs >> 1) & (holes >> 2) & COLS_0_TO_4
+                & (valid_mask >> 1) & (valid_mask >> 2))
+    left[0] = (valid & (pegs << 1) & (holes << 2) & COLS_2_TO_6
+               & (valid_mask << 1) & (valid_mask << 2))
+    down[0] = (valid & (pegs >> 7) & (holes >> 14) & ROWS_0_TO_4
+               & (valid_mask >> 7) & (valid_mask >> 14))
+    up[0] = (valid & (pegs << 7) & (holes << 14) & ROWS_2_TO_6
+             & (valid_mask << 7) & (valid_mask << 14))
+
+
+cdef BitBoard make_board(uint64_t pegs, uint64_t valid_mask):
+    """Быстрый конструктор без __init__."""
+    cdef BitBoard board = BitBoard.__new__(BitBoard)
+    board.pegs = pegs
+    board._count = popcount64(pegs)
+    board.valid_mask = valid_mask
+    return board
+
+
+cdef class BitBoard:
+    """
+    Битовое представление доски Peg Solitaire (Cython).
+
+    Экземпляры неизменяемы: apply_move() всегда создаёт новую доску.
+    """
+
+    def __init__(self, uint64_t pegs, valid_mask=None):
+        self.pegs = pegs
+        self._count = popcount64(pegs)
+        if valid_mask is None:
+            # Фишки вне английского креста → полная 7x7
+            self.valid_mask = FULL_MASK if pegs & ~VALID_MASK else VALID_MASK
+        else:
+            self.valid_mask = valid_mask
+
+    @classmethod
+    def english_start(cls):
+        """Стандартная английская доска."""
+        return make_board(ENGLISH_START, VALID_MASK)
+
+    @classmethod
+    def english_goal(cls):
+        """Целевое состояние (1 колышек в центре)."""
+        return make_board(ENGLISH_GOAL, VALID_MASK)
+
+    @classmethod
+    def from_positions(cls, positions):
+        """Создаёт доску из списка координат."""
+        cdef uint64_t pegs = 0
+        for row, col in positions:
+            pegs |= 1ULL << (row * 7 + col)
+        return cls(pegs)
+
+    cpdef int peg_count(self):
+        return self._count
+
+    cpdef bint has_peg(self, int pos):
+        return (self.pegs >> pos) & 1
+
+    cpdef list get_moves(self):
+        """Все допустимые ходы: (from, jumped, to)."""
+        cdef list moves = []
+        self.fill_moves(moves)
+        return moves
+
+    cpdef int fill_moves(self, list moves):
+        """Заполняет переданный список ходами, возвращает их число."""
+        cdef uint64_t right, left, down, up, sources, lsb
+        cdef int pos
+        cdef tuple cell
+
+        del moves[:]
+        move_masks(self.pegs, self.valid_mask, &right, &left, &down, &up)
+
+        # Порядок ходов: по позиции, затем →, ←, ↓, ↑
+        sources = right | left | down | up
+        while sources:
+            lsb = sources & (~sources + 1)
+            sources ^= lsb
+            pos = __builtin_ctzll(lsb)
+            cell = <tuple>MOVES_FROM[pos]
+            if right & lsb:
+                moves.append(cell[0])
+            if left & lsb:
+                moves.append(cell[1])
+            if down & lsb:
+                moves.append(cell[2])
+            if up & lsb:
+                moves.append(cell[3])
+        return len(moves)
+
+    cpdef int count_moves(self):
+        """Число допустимых ходов без построения списка."""
+        cdef uint64_t right, left, down, up
+        move_masks(self.pegs, self.valid_mask, &right, &left, &down, &up)
+        return popcount64(right) + popcount64(left) + popcount64(down) + popcount64(up)
+
+    cpdef BitBoard apply_move(self, int from_pos, int jumped, int to_pos):
+        """Применяет ход — 3 XOR."""
+        return make_board(
+            self.pegs ^ (1ULL << from_pos) ^ (1ULL << jumped) ^ (1ULL << to_pos),
+            self.valid_mask
+        )
+
+    cpdef bint is_solved(self):
+        return self._count == 1
+
+    cpdef bint is_goal(self):
+        return self.pegs == ENGLISH_GOAL
+
+    cpdef bint is_dead(self):
+        """Проверка тупика. Учитывает valid_mask."""
+        cdef uint64_t right, left, down, up
+        if self._count <= 1:
+            return False
+        move_masks(self.pegs, self.valid_mask, &right, &left, &down, &up)
+        return (right | left | down | up) == 0
+
+    cpdef BitBoard canonical(self):
+        """Каноническая форма (только для английской доски)."""
+        cdef uint64_t min_pegs
+        if self.valid_mask != VALID_MASK:
+            return self
+        min_pegs = _canonical_pegs(self.pegs)
+        if min_pegs == self.pegs:
+            return self
+        return make_board(min_pegs, self.valid_mask)
+
+    def to_string(self):
+        """Текстовое представление доски."""
+        return _render_pegs(self.pegs, self.valid_mask)
+
+    cdef uint64_t _key(self):
+        if _PyBitBoard.USE_SYMMETRY_HASH and self.valid_mask == VALID_MASK:
+            return _canonical_pegs(self.pegs)
+        return self.pegs
+
+    def __hash__(self):
+        return self._key()
+
+    def __eq__(self, other):
+        if not isinstance(other, BitBoard):
+            return False
+        return self._key() == (<BitBoard>other)._key()
+
+    def __lt__(self, BitBoard other):
+        # Порядок согласован с __eq__: сравниваются те же ключи
+        return self._key() < other._key()
+
+    def __reduce__(self):
+        return (BitBoard, (self.pegs, self.valid_mask))
+
+    def __repr__(self):
+        return f"BitBoard({self._count} pegs)"
@@ -0,0 +1,174 @@
+"""
+core/bitboard_nb.py
+
+Numba-ядра для BitBoard: генерация ходов, тупики, каноническая форма и DFS.
+
+Состояние — один int64 (49 бит доски 7x7), valid_mask передаётся явно,
+поэтому ядра работают и для английской, и для произвольной доски.
+Используется int64, а не uint64: 49 бит помещаются, а смешение uint64/int64
+в Numba приводит к float64.
+
+Если Numba не установлена — NUMBA_AVAILABLE = False, ядра не определяются.
+"""
+
+try:
+    import numpy as np
+    from numba import njit, types
+    from numba.typed import Dict
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+from .bitboard import (
+    VALID_MASK, SYMMETRY_MAPS,
+    COLS_0_TO_4, COLS_2_TO_6, ROWS_0_TO_4, ROWS_2_TO_6
+)
+
+# Максимум ходов из одной позиции 7x7 (4 направления на клетку)
+MAX_MOVES = 4 * 49
+
+
+if NUMBA_AVAILABLE:
+    _SYM_TABLES = np.array(SYMMETRY_MAPS, dtype=np.int64)
+    _ENGLISH_MASK = np.int64(VALID_MASK)
+
+    @njit(cache=True, nogil=True)
+    def popcount_nb(x):
+        """Подсчёт битов (SWAR, компилируется в несколько инструкций)."""
+        x = x - ((x >> 1) & 0x5555555555555555)
+        x = (x & 0x3333333333333333) + ((x >> 2) & 0x3333333333333333)
+        x = (x + (x >> 4)) & 0x0F0F0F0F0F0F0F0F
+        return (x * 0x0101010101010101) >> 56
+
+    @njit(cache=True, nogil=True)
+    def apply_move_nb(pegs, from_pos, jumped, to_pos):
+        """Применяет ход — 3 XOR."""
+        return pegs ^ (1 << from_pos) ^ (1 << jumped) ^ (1 << to_pos)
+
+    @njit(cache=True, nogil=True)
+    def _move_masks_nb(pegs, valid_mask):
+        holes = valid_mask & ~pegs
+        right = (pegs & (pegs >> 1) & (holes >> 2) & COLS_0_TO_4
+                 & valid_mask & (valid_mask >> 1) & (valid_mask >> 2))
+        left = (pegs & (pegs << 1) & (holes << 2) & COLS_2_TO_6
+                & valid_mask & (valid_mask << 1) & (valid_mask << 2))
+        down = (pegs & (pegs >> 7) & (holes >> 14) & ROWS_0_TO_4
+                & valid_mask & (valid_mask >> 7) & (valid_mask >> 14))
+        up = (pegs & (pegs << 7) & (holes << 14) & ROWS_2_TO_6
+              & valid_mask & (valid_mask << 7) & (valid_mask << 14))
+        return right, left, down, up
+
+    @njit(cache=True, nogil=True)
+    def get_moves_nb(pegs, valid_mask, out):
+        """
+        Записывает ходы в out[k] = (from, jumped, to), возвращает их количество.
+
+        Порядок ходов совпадает с BitBoard.get_moves (по позиции, затем →, ←, ↓, ↑).
+        out — предвыделенный буфер int64[MAX_MOVES, 3].
+        """
+        right, left, down, up = _move_masks_nb(pegs, valid_mask)
+        sources = right | left | down | up
+        n = 0
+        for pos in range(49):
+            if not (sources >> pos) & 1:
+                continue
+            if (right >> pos) & 1:
+                out[n, 0] = pos
+                out[n, 1] = pos + 1
+                out[n, 2] = pos + 2
+                n += 1
+            if (left >> pos) & 1:
+                out[n, 0] = pos
+                out[n, 1] = pos - 1
+                out[n, 2] = pos - 2
+                n += 1
+            if (down >> pos) & 1:
+                out[n, 0] = pos
+                out[n, 1] = pos + 7
+                out[n, 2] = pos + 14
+                n += 1
+            if (up >> pos) & 1:
+                out[n, 0] = pos
+                out[n, 1] = pos - 7
+                out[n, 2] = pos - 14
+                n += 1
+        return n
+
+    @njit(cache=True, nogil=True)
+    def is_dead_nb(pegs, valid_mask):
+        """Тупик: больше одного колышка и нет ходов."""
+        if popcount_nb(pegs) <= 1:
+            return False
+        right, left, down, up = _move_masks_nb(pegs, valid_mask)
+        return (right | left | down | up) == 0
+
+    @njit(cache=True, nogil=True)
+    def canonical_nb(pegs):
+        """Минимальная из 8 симметрий (только для английской доски)."""
+        best = pegs
+        for s in range(1, 8):
+            variant = 0
+            for pos in range(49):
+                if (pegs >> pos) & 1:
+                    dst = _SYM_TABLES[s, pos]
+                    if dst >= 0:
+                        variant |= 1 << dst
+            if variant < best:
+                best = variant
+        return best
+
+    @njit(cache=True, nogil=True)
+    def dfs_solve_nb(start_pegs, valid_mask, use_symmetry):
+        """
+        Итеративный DFS с мемоизацией неудачных состояний.
+
+        Returns:
+            int64[n, 3] — ходы решения; массив формы (0, 3) если решения нет
+            или доска уже решена. Второе значение — число посещённых узлов.
+        """
+        max_depth = popcount_nb(start_pegs)
+        moves = np.empty((max_depth + 1, MAX_MOVES, 3), dtype=np.int64)
+        n_moves = np.zeros(max_depth + 1, dtype=np.int64)
+        idx = np.zeros(max_depth + 1, dtype=np.int64)
+        states = np.empty(max_depth + 1, dtype=np.int64)
+        failed = Dict.empty(key_type=types.int64, value_type=types.int8)
+        symmetric = use_symmetry and valid_mask == _ENGLISH_MASK
+
+        nodes = 1
+        if max_depth <= 1:
+            return np.empty((0, 3), dtype=np.int64), nodes
+
+        states[0] = start_pegs
+        n_moves[0] = get_moves_nb(start_pegs, valid_mask, moves[0])
+        depth = 0
+
+        while depth >= 0:
+            if idx[depth] >= n_moves[depth]:
+                # Все ходы перебраны — запоминаем неудачу
+                pegs = states[depth]
+                failed[canonical_nb(pegs) if symmetric else pegs] = np.int8(1)
+                depth -= 1
+                continue
+
+            k = idx[depth]
+            idx[depth] += 1
+            child = apply_move_nb(states[depth], moves[depth, k, 0],
+                                  moves[depth, k, 1], moves[depth, k, 2])
+            nodes += 1
+
+            if popcount_nb(child) == 1:
+                path = np.empty((depth + 1, 3), dtype=np.int64)
+                for d in range(depth + 1):
+                    path[d, :] = moves[d, idx[d] - 1, :]
+                return path, nodes
+
+            key = canonical_nb(child) if symmetric else child
+            if key in failed:
+                continue
+
+            depth += 1
+            states[depth] = child
+            n_moves[depth] = get_moves_nb(child, valid_mask, moves[depth])
+            idx[depth] = 0
+
+        return np.empty((0, 3), dtype=np.int64), nodes
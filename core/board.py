@@ -4,18 +4,50 @@ core/board.py
 Представление доски через frozenset.
 """
 
-from typing import FrozenSet, Tuple, Optional, List
+from functools import lru_cache
+from typing import Dict, FrozenSet, Tuple, Optional, List
+from .bitboard import BitBoard
 from .utils import DIRECTIONS, PEG, HOLE, EMPTY, index_to_pos
 
 Position = Tuple[int, int]
+# (перепрыгиваемая клетка, клетка назначения, dr, dc)
+Jump = Tuple[Position, Position, int, int]
+
+
+class _JumpTable(dict):
+    """
+    Прыжки из каждой клетки доски rows x cols (только не выходящие за край).
+    Для клеток вне сетки считаются на лету без отсечения по границам.
+    """
+
+    def __missing__(self, pos: Position) -> Tuple[Jump, ...]:
+        r, c = pos
+        return tuple(((r + dr, c + dc), (r + 2 * dr, c + 2 * dc), dr, dc)
+                     for dr, dc in DIRECTIONS)
+
+
+@lru_cache(maxsize=None)
+def _jump_table(rows: int, cols: int) -> Dict[Position, Tuple[Jump, ...]]:
+    table = _JumpTable()
+    for r in range(rows):
+        for c in range(cols):
+            table[(r, c)] = tuple(
+                ((r + dr, c + dc), (r + 2 * dr, c + 2 * dc), dr, dc)
+                for dr, dc in DIRECTIONS
+                if 0 <= r + 2 * dr < rows and 0 <= c + 2 * dc < cols
+            )
+    return table
 
 
 class Board:
     """
     Иммутабельное представление доски через frozenset.
-    Хранит только позиции колышков — эффективно по памяти.
+
+    Устарело: решатели работают с BitBoard (int-маски вместо множеств
+    кортежей, в десятки раз меньше памяти на состояние). Для перехода
+    используйте to_bitboard().
     """
-    __slots__ = ('pegs', 'holes', 'rows', 'cols', '_hash')
+    __slots__ = ('pegs', 'holes', 'rows', 'cols')
 
     def __init__(self, pegs: FrozenSet[Position], holes: FrozenSet[Position],
                  rows: int = 7, cols: int = 7):
@@ -23,7 +55,6 @@ class Board:
         self.holes = holes
         self.rows = rows
         self.cols = cols
-        self._hash = hash(self.pegs)
 
     @classmethod
     def from_matrix(cls, matrix: List[List[str]]) -> 'Board':
@@ -40,6 +71,23 @@ class Board:
                     holes.add((r, c))
         return cls(frozenset(pegs), frozenset(holes), rows, cols)
 
+    def to_bitboard(self) -> BitBoard:
+        """
+        Переводит доску в BitBoard: колышки → pegs, колышки и дырки → valid_mask.
+
+        Raises:
+            ValueError: если доска больше 7x7
+        """
+        if self.rows > 7 or self.cols > 7:
+            raise ValueError(f"BitBoard поддерживает доски до 7x7, получено {self.rows}x{self.cols}")
+        pegs = 0
+        for r, c in self.pegs:
+            pegs |= 1 << (r * 7 + c)
+        valid_mask = pegs
+        for r, c in self.holes:
+            valid_mask |= 1 << (r * 7 + c)
+        return BitBoard(pegs, valid_mask)
+
     def to_matrix(self) -> List[List[str]]:
         """Конвертирует обратно в матрицу."""
         matrix = [[EMPTY for _ in range(self.cols)] for _ in range(self.rows)]
@@ -74,10 +122,13 @@ class Board:
     def get_all_moves(self) -> List[Tuple[int, int, int, int]]:
         """Генерирует все допустимые ходы."""
         moves = []
-        for r, c in self.pegs:
-            for dr, dc in DIRECTIONS:
-                if self.is_valid_move(r, c, dr, dc):
-                    moves.append((r, c, dr, dc))
+        pegs = self.pegs
+        holes = self.holes
+        jumps = _jump_table(self.rows, self.cols)
+        for pos in pegs:
+            for jumped, to, dr, dc in jumps[pos]:
+                if jumped in pegs and to in holes:
+                    moves.append((pos[0], pos[1], dr, dc))
         return moves
 
     def reverse_move(self, r: int, c: int, dr: int, dc: int) -> Optional['Board']:
@@ -91,7 +142,9 @@ class Board:
         return Board(new_pegs, new_holes, self.rows, self.cols)
 
     def __hash__(self) -> int:
-        return self._hash
+        # frozenset кэширует свой хеш: считается при первом обращении,
+        # а не для каждой созданной (и часто сразу отброшенной) доски
+        return hash(self.pegs)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Board):
@@ -34,6 +34,22 @@ except ImportError:
     )
     USING_CYTHON = False
 
+try:
+    # BitBoard на Cython (uint64_t вместо Python int)
+    from .bitboard_c import BitBoard
+    USING_CYTHON_BITBOARD = True
+except ImportError:
+    from .bitboard import BitBoard
+    USING_CYTHON_BITBOARD = False
+
+try:
+    # ZobristBitBoard на Cython (uint64_t pegs и хеш)
+    from .zobrist_c import ZobristBitBoard
+    USING_CYTHON_ZOBRIST = True
+except ImportError:
+    from .zobrist import ZobristBitBoard
+    USING_CYTHON_ZOBRIST = False
+
 
 def get_implementation_info() -> str:
     """Возвращает информацию о текущей реализации."""
@@ -52,6 +68,10 @@ __all__ = [
     'fast_zobrist_hash',
     'fast_update_zobrist',
     'FastBitBoard',
+    'BitBoard',
+    'ZobristBitBoard',
     'USING_CYTHON',
+    'USING_CYTHON_BITBOARD',
+    'USING_CYTHON_ZOBRIST',
     'get_implementation_info'
 ]
@@ -13,6 +13,14 @@ from libc.stdint cimport uint64_t, int32_t
 from cpython cimport array
 import array
 
+from .bitboard import MOVES_FROM as _MOVES_FROM
+
+cdef extern from *:
+    int __builtin_ctzll(unsigned long long x) nogil
+
+# Готовые кортежи ходов по клеткам: (→, ←, ↓, ↑)
+cdef tuple MOVES_FROM = _MOVES_FROM
+
 # Валидные позиции английской доски (вычисляется)
 # Позиции: 2,3,4, 9,10,11, 14-20, 21-27, 28-34, 37,38,39, 44,45,46
 cdef uint64_t VALID_MASK = (
@@ -26,6 +34,14 @@ cdef uint64_t VALID_MASK = (
 )
 cdef int CENTER_POS = 24
 
+# Клетки, откуда ход не выходит за доску и не переносится через край строки
+cdef uint64_t COLS_0_TO_4 = 0x7cf9f3e7cf9f
+cdef uint64_t COLS_2_TO_6 = 0x1f3e7cf9f3e7c
+cdef uint64_t RIGHT_EDGE_MASK = VALID_MASK & (VALID_MASK >> 1) & (VALID_MASK >> 2) & COLS_0_TO_4
+cdef uint64_t LEFT_EDGE_MASK = VALID_MASK & (VALID_MASK << 1) & (VALID_MASK << 2) & COLS_2_TO_6
+cdef uint64_t DOWN_EDGE_MASK = VALID_MASK & (VALID_MASK >> 7) & (VALID_MASK >> 14)
+cdef uint64_t UP_EDGE_MASK = VALID_MASK & (VALID_MASK << 7) & (VALID_MASK << 14)
+
 # Позиции для быстрой генерации ходов (33 позиции)
 cdef int[33] VALID_POSITIONS = [
     2, 3, 4, 9, 10, 11,
@@ -66,52 +82,34 @@ cpdef uint64_t fast_apply_move(uint64_t pegs, int from_pos, int jumped, int to_p
 
 cpdef list fast_get_moves(uint64_t pegs):
     """
-    Генерирует все допустимые ходы.
+    Генерирует все допустимые ходы (по позиции, затем →, ←, ↓, ↑).
     
     Returns:
-        Список кортежей (from, jumped, to)
+        Список кортежей (from, jumped, to) — готовые кортежи из MOVES_FROM
     """
     cdef list moves = []
     cdef uint64_t holes = VALID_MASK & ~pegs
-    cdef uint64_t can_right, can_left, can_down, can_up
-    cdef int pos, to_pos
-    cdef int i
-    
-    # Горизонтальные ходы
-    can_right = pegs & (pegs >> 1) & (holes >> 2)
-    can_left = pegs & (pegs << 1) & (holes << 2)
-    
-    # Вертикальные ходы
-    can_down = pegs & (pegs >> 7) & (holes >> 14)
-    can_up = pegs & (pegs << 7) & (holes << 14)
-    
-    i = 0
-    while i < 33:
-        pos = VALID_POSITIONS[i]
-        
-        # Вправо
-        if (can_right >> pos) & 1:
-            if pos % 7 <= 4:
-                moves.append((pos, pos + 1, pos + 2))
-        
-        # Влево
-        if (can_left >> pos) & 1:
-            if pos % 7 >= 2:
-                moves.append((pos, pos - 1, pos - 2))
-        
-        # Вниз
-        if (can_down >> pos) & 1:
-            if pos // 7 <= 4:
-                to_pos = pos + 14
-                moves.append((pos, pos + 7, to_pos))
-        
-        # Вверх
-        if (can_up >> pos) & 1:
-            if pos // 7 >= 2:
-                to_pos = pos - 14
-                moves.append((pos, pos - 7, to_pos))
-        
-        i += 1
+    cdef uint64_t can_right, can_left, can_down, can_up, sources, lsb
+    cdef tuple cell
+    
+    can_right = pegs & (pegs >> 1) & (holes >> 2) & RIGHT_EDGE_MASK
+    can_left = pegs & (pegs << 1) & (holes << 2) & LEFT_EDGE_MASK
+    can_down = pegs & (pegs >> 7) & (holes >> 14) & DOWN_EDGE_MASK
+    can_up = pegs & (pegs << 7) & (holes << 14) & UP_EDGE_MASK
+    
+    sources = can_right | can_left | can_down | can_up
+    while sources:
+        lsb = sources & (~sources + 1)
+        sources ^= lsb
+        cell = <tuple>MOVES_FROM[__builtin_ctzll(lsb)]
+        if can_right & lsb:
+            moves.append(cell[0])
+        if can_left & lsb:
+            moves.append(cell[1])
+        if can_down & lsb:
+            moves.append(cell[2])
+        if can_up & lsb:
+            moves.append(cell[3])
     
     return moves
 
@@ -122,26 +120,14 @@ cpdef bint fast_is_dead(uint64_t pegs):
         return False
     
     cdef uint64_t holes = VALID_MASK & ~pegs
-    cdef uint64_t can_move
-    
-    # Проверяем, есть ли хоть один ход
-    can_move = pegs & (pegs >> 1) & (holes >> 2)  # right
-    if can_move:
-        return False
     
-    can_move = pegs & (pegs << 1) & (holes << 2)  # left
-    if can_move:
-        return False
-    
-    can_move = pegs & (pegs >> 7) & (holes >> 14)  # down
-    if can_move:
-        return False
-    
-    can_move = pegs & (pegs << 7) & (holes << 14)  # up
-    if can_move:
-        return False
-    
-    return True
+    # Одно выражение на 4 направления; маски краёв — без переноса через строку
+    return not (
+        (pegs & (pegs >> 1) & (holes >> 2) & RIGHT_EDGE_MASK)
+        | (pegs & (pegs << 1) & (holes << 2) & LEFT_EDGE_MASK)
+        | (pegs & (pegs >> 7) & (holes >> 14) & DOWN_EDGE_MASK)
+        | (pegs & (pegs << 7) & (holes << 14) & UP_EDGE_MASK)
+    )
 
 
 # =====================================================
@@ -166,12 +152,13 @@ init_zobrist()
 cpdef uint64_t fast_zobrist_hash(uint64_t pegs):
     """Вычисляет Zobrist хеш."""
     cdef uint64_t h = 0
-    cdef int i = 0
     
-    while VALID_POSITIONS[i] >= 0:
-        if (pegs >> VALID_POSITIONS[i]) & 1:
-            h ^= ZOBRIST_TABLE[VALID_POSITIONS[i]]
-        i += 1
+    # Только установленные биты (в массиве VALID_POSITIONS нет
+    # терминатора, поэтому проход по нему с проверкой >= 0 выходил за край)
+    pegs &= VALID_MASK
+    while pegs:
+        h ^= ZOBRIST_TABLE[__builtin_ctzll(pegs)]
+        pegs &= pegs - 1
     
     return h
 
@@ -190,20 +177,27 @@ cdef class FastBitBoard:
     Быстрый BitBoard на Cython.
     """
     cdef public uint64_t pegs
-    cdef public uint64_t zobrist_hash
+    cdef uint64_t _zobrist
     cdef public int count
     
     def __init__(self, uint64_t pegs, uint64_t zobrist_hash=0):
         self.pegs = pegs
         self.count = popcount64(pegs)
-        if zobrist_hash == 0:
-            self.zobrist_hash = fast_zobrist_hash(pegs)
-        else:
-            self.zobrist_hash = zobrist_hash
+        # 0 — ещё не посчитан: полный хеш только при первом обращении
+        self._zobrist = zobrist_hash
+    
+    cdef inline uint64_t _get_zobrist(self):
+        if self._zobrist == 0:
+            self._zobrist = fast_zobrist_hash(self.pegs)
+        return self._zobrist
+    
+    @property
+    def zobrist_hash(self):
+        return self._get_zobrist()
     
     cpdef FastBitBoard apply_move(self, int from_pos, int jumped, int to_pos):
         cdef uint64_t new_pegs = fast_apply_move(self.pegs, from_pos, jumped, to_pos)
-        cdef uint64_t new_hash = fast_update_zobrist(self.zobrist_hash, from_pos, jumped, to_pos)
+        cdef uint64_t new_hash = fast_update_zobrist(self._get_zobrist(), from_pos, jumped, to_pos)
         return FastBitBoard(new_pegs, new_hash)
     
     cpdef list get_moves(self):
@@ -216,7 +210,7 @@ cdef class FastBitBoard:
         return fast_is_dead(self.pegs)
     
     def __hash__(self):
-        return self.zobrist_hash
+        return self._get_zobrist()
     
     def __eq__(self, other):
         if not isinstance(other, FastBitBoard):
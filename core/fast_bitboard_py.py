@@ -9,44 +9,32 @@ core/fast_bitboard_py.py
     python setup.py build_ext --inplace
 """
 
-import sys
 from typing import List, Tuple
 
-# Быстрый popcount (подсчёт битов)
-if sys.version_info >= (3, 10):
-    # Python 3.10+ имеет встроенный bit_count() (использует CPU popcount)
-    def _popcount(x: int) -> int:
-        return x.bit_count()
-else:
-    # Fallback для старых версий Python
-    def _popcount(x: int) -> int:
-        """Быстрый подсчёт битов (popcount) для Python < 3.10."""
-        x = x - ((x >> 1) & 0x5555555555555555)
-        x = (x & 0x3333333333333333) + ((x >> 2) & 0x3333333333333333)
-        x = (x + (x >> 4)) & 0x0F0F0F0F0F0F0F0F
-        return ((x * 0x0101010101010101) >> 56) & 0xFF
-
-# Валидная маска английской доски
-VALID_MASK = sum(1 << pos for pos in [
-    2, 3, 4, 9, 10, 11,
-    14, 15, 16, 17, 18, 19, 20,
-    21, 22, 23, 24, 25, 26, 27,
-    28, 29, 30, 31, 32, 33, 34,
-    37, 38, 39, 44, 45, 46
-])
-
-VALID_POSITIONS = [
-    2, 3, 4, 9, 10, 11,
-    14, 15, 16, 17, 18, 19, 20,
-    21, 22, 23, 24, 25, 26, 27,
-    28, 29, 30, 31, 32, 33, 34,
-    37, 38, 39, 44, 45, 46
-]
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+from .bitboard import (
+    VALID_MASK, ENGLISH_VALID_POSITIONS, COLS_0_TO_4, COLS_2_TO_6, MOVES_FROM
+)
+
+VALID_POSITIONS = sorted(ENGLISH_VALID_POSITIONS)
+
+# Клетки, откуда ход в направлении не выходит за доску: from, jumped и to
+# валидны и в одной строке (столбце) — без "переноса" через край строки
+RIGHT_EDGE_MASK = VALID_MASK & (VALID_MASK >> 1) & (VALID_MASK >> 2) & COLS_0_TO_4
+LEFT_EDGE_MASK = VALID_MASK & (VALID_MASK << 1) & (VALID_MASK << 2) & COLS_2_TO_6
+DOWN_EDGE_MASK = VALID_MASK & (VALID_MASK >> 7) & (VALID_MASK >> 14)
+UP_EDGE_MASK = VALID_MASK & (VALID_MASK << 7) & (VALID_MASK << 14)
 
 
 def fast_peg_count(pegs: int) -> int:
     """Подсчёт колышков."""
-    return _popcount(pegs)
+    return pegs.bit_count()
 
 
 def fast_has_peg(pegs: int, pos: int) -> bool:
@@ -60,51 +48,51 @@ def fast_apply_move(pegs: int, from_pos: int, jumped: int, to_pos: int) -> int:
 
 
 def fast_get_moves(pegs: int) -> List[Tuple[int, int, int]]:
-    """Генерирует все допустимые ходы."""
+    """Генерирует все допустимые ходы (по позиции, затем →, ←, ↓, ↑)."""
     moves = []
     holes = VALID_MASK & ~pegs
     
     # Горизонтальные
-    can_right = pegs & (pegs >> 1) & (holes >> 2)
-    can_left = pegs & (pegs << 1) & (holes << 2)
+    can_right = pegs & (pegs >> 1) & (holes >> 2) & RIGHT_EDGE_MASK
+    can_left = pegs & (pegs << 1) & (holes << 2) & LEFT_EDGE_MASK
     
     # Вертикальные
-    can_down = pegs & (pegs >> 7) & (holes >> 14)
-    can_up = pegs & (pegs << 7) & (holes << 14)
+    can_down = pegs & (pegs >> 7) & (holes >> 14) & DOWN_EDGE_MASK
+    can_up = pegs & (pegs << 7) & (holes << 14) & UP_EDGE_MASK
     
-    for pos in VALID_POSITIONS:
-        if can_right & (1 << pos) and pos % 7 <= 4:
-            moves.append((pos, pos + 1, pos + 2))
-        
-        if can_left & (1 << pos) and pos % 7 >= 2:
-            moves.append((pos, pos - 1, pos - 2))
-        
-        if can_down & (1 << pos) and pos // 7 <= 4:
-            moves.append((pos, pos + 7, pos + 14))
-        
-        if can_up & (1 << pos) and pos // 7 >= 2:
-            moves.append((pos, pos - 7, pos - 14))
+    # Обходим только клетки, откуда есть ход (x & -x — младший бит).
+    # Кортежи ходов готовые (MOVES_FROM) — на ход не создаётся новый объект
+    sources = can_right | can_left | can_down | can_up
+    append = moves.append
+    while sources:
+        lsb = sources & -sources
+        sources ^= lsb
+        right, left, down, up = MOVES_FROM[lsb.bit_length() - 1]
+        if can_right & lsb:
+            append(right)
+        if can_left & lsb:
+            append(left)
+        if can_down & lsb:
+            append(down)
+        if can_up & lsb:
+            append(up)
     
     return moves
 
 
 def fast_is_dead(pegs: int) -> bool:
-    """Проверка тупика."""
-    if _popcount(pegs) <= 1:
+    """Проверка тупика: больше одного колышка и ни одного хода."""
+    if pegs.bit_count() <= 1:
         return False
     
     holes = VALID_MASK & ~pegs
-    
-    if pegs & (pegs >> 1) & (holes >> 2):
-        return False
-    if pegs & (pegs << 1) & (holes << 2):
-        return False
-    if pegs & (pegs >> 7) & (holes >> 14):
-        return False
-    if pegs & (pegs << 7) & (holes << 14):
-        return False
-    
-    return True
+    # Маски краёв исключают "ходы" через край строки
+    return not (
+        (pegs & (pegs >> 1) & (holes >> 2) & RIGHT_EDGE_MASK)
+        | (pegs & (pegs << 1) & (holes << 2) & LEFT_EDGE_MASK)
+        | (pegs & (pegs >> 7) & (holes >> 14) & DOWN_EDGE_MASK)
+        | (pegs & (pegs << 7) & (holes << 14) & UP_EDGE_MASK)
+    )
 
 
 # Zobrist таблица
@@ -113,28 +101,89 @@ random.seed(42)
 ZOBRIST_TABLE = {pos: random.getrandbits(64) for pos in VALID_POSITIONS}
 
 
+# (бит клетки, ключ) — без сдвига 1 << pos на каждой итерации
+_ZOBRIST_PAIRS = tuple((1 << pos, ZOBRIST_TABLE[pos]) for pos in VALID_POSITIONS)
+# Ключи по номеру бита (0 вне доски)
+_ZOBRIST_BY_BIT = tuple(ZOBRIST_TABLE.get(pos, 0) for pos in range(49))
+
+
 def fast_zobrist_hash(pegs: int) -> int:
     """Вычисляет Zobrist хеш."""
     h = 0
-    for pos in VALID_POSITIONS:
-        if pegs & (1 << pos):
-            h ^= ZOBRIST_TABLE[pos]
+    pegs &= VALID_MASK
+    if pegs.bit_count() > 12:
+        for bit, key in _ZOBRIST_PAIRS:
+            if pegs & bit:
+                h ^= key
+        return h
+    # Мало колышков: обходим только установленные биты
+    while pegs:
+        lsb = pegs & -pegs
+        h ^= _ZOBRIST_BY_BIT[lsb.bit_length() - 1]
+        pegs ^= lsb
     return h
 
 
 def fast_update_zobrist(current_hash: int, from_pos: int, jumped: int, to_pos: int) -> int:
     """Инкрементальное обновление."""
-    return current_hash ^ ZOBRIST_TABLE[from_pos] ^ ZOBRIST_TABLE[jumped] ^ ZOBRIST_TABLE[to_pos]
+    return current_hash ^ _ZOBRIST_BY_BIT[from_pos] ^ _ZOBRIST_BY_BIT[jumped] ^ _ZOBRIST_BY_BIT[to_pos]
+
+
+if NUMBA_AVAILABLE:
+    # JIT-ядра: ходы/тупики общие с core.bitboard_nb, Zobrist — по таблице uint64.
+    # fast_is_dead и fast_zobrist_hash заменяются JIT-версиями с тем же API,
+    # fast_get_moves остаётся Python (список кортежей из Numba не вернуть
+    # дёшево) — для Numba-кода есть fast_get_moves_nb с буфером.
+    from .bitboard_nb import get_moves_nb, is_dead_nb
+
+    _ZOBRIST_ARRAY = np.zeros(49, dtype=np.uint64)
+    for _pos, _value in ZOBRIST_TABLE.items():
+        _ZOBRIST_ARRAY[_pos] = _value
+
+    @njit(cache=True, nogil=True)
+    def fast_get_moves_nb(pegs, out):
+        """
+        Записывает ходы в out[k] = (from, jumped, to), возвращает их количество.
+
+        out — предвыделенный буфер формы (bitboard_nb.MAX_MOVES, 3), порядок ходов как
+        у fast_get_moves.
+        """
+        return get_moves_nb(pegs, VALID_MASK, out)
+
+    @njit(cache=True, nogil=True)
+    def zobrist_hash_nb(pegs, table):
+        """Zobrist хеш: XOR table[pos] по всем колышкам."""
+        h = np.uint64(0)
+        for pos in range(49):
+            if (pegs >> pos) & 1:
+                h ^= table[pos]
+        return h
+
+    def fast_is_dead(pegs: int) -> bool:
+        """Проверка тупика (Numba)."""
+        return is_dead_nb(pegs, VALID_MASK)
+
+    def fast_zobrist_hash(pegs: int) -> int:
+        """Вычисляет Zobrist хеш (Numba)."""
+        return int(zobrist_hash_nb(pegs, _ZOBRIST_ARRAY))
 
 
 class FastBitBoard:
     """Быстрый BitBoard (Python fallback)."""
-    __slots__ = ('pegs', 'zobrist_hash', 'count')
+    __slots__ = ('pegs', '_zobrist', 'count')
     
     def __init__(self, pegs: int, zobrist_hash: int = 0):
         self.pegs = pegs
-        self.count = fast_peg_count(pegs)
-        self.zobrist_hash = zobrist_hash or fast_zobrist_hash(pegs)
+        self.count = pegs.bit_count()
+        # 0 — ещё не посчитан: полный хеш только при первом обращении
+        self._zobrist = zobrist_hash
+    
+    @property
+    def zobrist_hash(self) -> int:
+        h = self._zobrist
+        if not h:
+            h = self._zobrist = fast_zobrist_hash(self.pegs)
+        return h
     
     def apply_move(self, from_pos: int, jumped: int, to_pos: int) -> 'FastBitBoard':
         new_pegs = fast_apply_move(self.pegs, from_pos, jumped, to_pos)
@@ -16,9 +16,16 @@ try:
         rust_is_dead,
         rust_pagoda_value,
         rust_evaluate_position,
-        rust_evaluate_batch
+        rust_evaluate_batch as _rust_evaluate_batch_arrays
     )
+    import numpy as np
     USING_RUST = True
+
+    def rust_evaluate_batch(pegs_list, moves_list):
+        """Пакетная оценка: списки переводятся в NumPy массивы один раз на границе."""
+        pegs_arr = np.fromiter(pegs_list, dtype=np.uint64)
+        moves_arr = np.fromiter(moves_list, dtype=np.int64, count=len(pegs_arr))
+        return _rust_evaluate_batch_arrays(pegs_arr, moves_arr).tolist()
 except ImportError:
     # Fallback на Cython/Python
     from .fast import (
@@ -28,16 +35,16 @@ except ImportError:
         fast_get_moves as rust_get_moves,
         fast_is_dead as rust_is_dead,
     )
-    from heuristics.fast_pagoda import pagoda_value_fast as rust_pagoda_value
+    from heuristics.fast_pagoda import (
+        pagoda_value_fast as rust_pagoda_value,
+        evaluate_batch_fast as rust_evaluate_batch,
+    )
     USING_RUST = False
     
     # Заглушки для функций, которых нет в Cython
     def rust_evaluate_position(pegs: int, num_moves: int) -> float:
         from heuristics.fast_pagoda import evaluate_position_fast
         return evaluate_position_fast(pegs, num_moves)
-    
-    def rust_evaluate_batch(pegs_list, moves_list):
-        return [rust_evaluate_position(p, m) for p, m in zip(pegs_list, moves_list)]
 
 
 def get_implementation_info() -> str:
@@ -17,7 +17,7 @@ EMPTY = '▫'     # Недоступная клетка
 
 def board_to_str(board: List[List[str]]) -> str:
     """Преобразует доску в строку для хеширования."""
-    return ''.join(''.join(row) for row in board)
+    return ''.join(map(''.join, board))
 
 
 def str_to_board(s: str, rows: int, cols: int) -> List[List[str]]:
@@ -39,7 +39,11 @@ def pos_to_index(pos: str) -> Tuple[int, int]:
 
 def count_pegs(board: List[List[str]]) -> int:
     """Подсчёт количества колышков на доске."""
-    return sum(row.count(PEG) for row in board)
+    # Простой цикл: без генератора и sum() (строки могут быть и str, и list)
+    count = 0
+    for row in board:
+        count += row.count(PEG)
+    return count
 
 
 def is_valid_position(r: int, c: int, rows: int, cols: int) -> bool:
@@ -0,0 +1,116 @@
+"""
+core/visited_set.py
+
+Компактное множество посещённых состояний (pegs: int).
+
+Открытая адресация с линейным пробированием в плоском массиве uint64:
+8 байт на слот вместо ~60-100 байт на элемент Python set (объект int +
+слот хеш-таблицы). При больших поисках таблица остаётся в кэше CPU.
+
+Хранится pegs + 1, поэтому 0 — признак пустого слота (пустая доска
+тоже допустимый ключ). Ключи < 2^49.
+
+Массив — numpy.ndarray[uint64], если NumPy установлен, иначе array('Q').
+"""
+
+from array import array
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Мультипликативное (фибоначчиево) хеширование: берём старшие биты произведения
+_GOLDEN = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+_MAX_LOAD = 0.75
+
+
+def _new_table(size: int):
+    if NUMPY_AVAILABLE:
+        return np.zeros(size, dtype=np.uint64)
+    return array('Q', bytes(8 * size))
+
+
+class VisitedSet:
+    """
+    Хеш-множество int-ключей в массиве uint64.
+
+    Поддерживает ``add``, ``in``, ``len`` и ``clear`` — может заменить
+    ``Set[int]`` в мемо решателей.
+    """
+
+    __slots__ = ('_bits', '_shift', '_mask', '_table', '_get', '_size', '_limit')
+
+    def __init__(self, expected: int = 1 << 16):
+        """
+        Args:
+            expected: ожидаемое число состояний (таблица растёт при
+                      заполнении больше чем на 75%)
+        """
+        bits = 4
+        while (1 << bits) * _MAX_LOAD < expected:
+            bits += 1
+        self._allocate(bits)
+
+    def _allocate(self, bits: int) -> None:
+        self._bits = bits
+        self._shift = 64 - bits
+        self._mask = (1 << bits) - 1
+        self._table = _new_table(1 << bits)
+        self._get = self._table.item if NUMPY_AVAILABLE else self._table.__getitem__
+        self._size = 0
+        self._limit = int((1 << bits) * _MAX_LOAD)
+
+    def __contains__(self, pegs: int) -> bool:
+        stored = pegs + 1
+        get = self._get
+        mask = self._mask
+        idx = ((stored * _GOLDEN) & _MASK64) >> self._shift
+        while True:
+            value = get(idx)
+            if value == stored:
+                return True
+            if value == 0:
+                return False
+            idx = (idx + 1) & mask
+
+    def add(self, pegs: int) -> None:
+        stored = pegs + 1
+        get = self._get
+        mask = self._mask
+        idx = ((stored * _GOLDEN) & _MASK64) >> self._shift
+        while True:
+            value = get(idx)
+            if value == stored:
+                return
+            if value == 0:
+                break
+            idx = (idx + 1) & mask
+
+        self._table[idx] = stored
+        self._size += 1
+        if self._size > self._limit:
+            self._grow()
+
+    def _grow(self) -> None:
+        """Удваивает таблицу и переносит ключи."""
+        old_get = self._get
+        old_len = len(self._table)
+        self._allocate(self._bits + 1)
+        for i in range(old_len):
+            stored = old_get(i)
+            if stored:
+                self.add(stored - 1)
+
+    def clear(self) -> None:
+        self._allocate(self._bits)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """Размер таблицы в байтах."""
+        return 8 * len(self._table)
@@ -9,23 +9,13 @@ Zobrist Hashing — инкрементальное хеширование сос
 - Идеально для DFS/IDA* с backtracking
 """
 
-import sys
 import random
-from typing import Dict, Tuple
-
-from .bitboard import ENGLISH_VALID_POSITIONS
-
-# Быстрый popcount (подсчёт битов)
-if sys.version_info >= (3, 10):
-    def _popcount(x: int) -> int:
-        return x.bit_count()
-else:
-    def _popcount(x: int) -> int:
-        """Быстрый подсчёт битов (popcount) для Python < 3.10."""
-        x = x - ((x >> 1) & 0x5555555555555555)
-        x = (x & 0x3333333333333333) + ((x >> 2) & 0x3333333333333333)
-        x = (x + (x >> 4)) & 0x0F0F0F0F0F0F0F0F
-        return ((x * 0x0101010101010101) >> 56) & 0xFF
+from typing import Dict, List, Tuple
+
+from .bitboard import (
+    ENGLISH_VALID_POSITIONS, ENGLISH_MOVES, POS_MASK,
+    _fill_moves_english, _fill_move_ids_english
+)
 
 # Инициализация генератора для воспроизводимости
 random.seed(42)
@@ -36,11 +26,36 @@ ZOBRIST_TABLE: Dict[int, int] = {
     pos: random.getrandbits(64) for pos in ENGLISH_VALID_POSITIONS
 }
 
+# Те же ключи кортежем по номеру клетки 0..48 (0 вне доски):
+# индексирование кортежа без хеширования ключа словаря
+ZOBRIST_BY_POS: Tuple[int, ...] = tuple(ZOBRIST_TABLE.get(pos, 0) for pos in range(49))
+
+
+def _build_byte_tables() -> Tuple[Tuple[int, ...], ...]:
+    """
+    Побайтовые таблицы хеша: tables[k][byte] — XOR ключей клеток 8k..8k+7,
+    занятых в byte (клетки вне доски дают 0).
+    """
+    keys = ZOBRIST_BY_POS + (0,) * 7
+    tables = []
+    for base in range(0, 56, 8):
+        table = [0] * 256
+        for byte in range(1, 256):
+            low = byte & -byte
+            table[byte] = table[byte ^ low] ^ keys[base + low.bit_length() - 1]
+        tables.append(tuple(table))
+    return tuple(tables)
+
+
+_ZOBRIST_BYTE_TABLES = _build_byte_tables()
+
 
 def compute_zobrist_hash(pegs: int) -> int:
     """
     Вычисляет Zobrist хеш для битовой маски колышков.
     
+    7 обращений к побайтовым таблицам вместо проверки 33 клеток.
+    
     Args:
         pegs: битовая маска позиций колышков
         
@@ -48,9 +63,9 @@ def compute_zobrist_hash(pegs: int) -> int:
         64-bit Zobrist хеш
     """
     h = 0
-    for pos in ENGLISH_VALID_POSITIONS:
-        if pegs & (1 << pos):
-            h ^= ZOBRIST_TABLE[pos]
+    for table in _ZOBRIST_BYTE_TABLES:
+        h ^= table[pegs & 0xFF]
+        pegs >>= 8
     return h
 
 
@@ -73,12 +88,29 @@ def update_zobrist_hash(current_hash: int, from_pos: int, jumped_pos: int, to_po
         Новый хеш
     """
     new_hash = current_hash
-    new_hash ^= ZOBRIST_TABLE[from_pos]   # убираем
-    new_hash ^= ZOBRIST_TABLE[jumped_pos] # убираем
-    new_hash ^= ZOBRIST_TABLE[to_pos]     # добавляем
+    new_hash ^= ZOBRIST_BY_POS[from_pos]   # убираем
+    new_hash ^= ZOBRIST_BY_POS[jumped_pos] # убираем
+    new_hash ^= ZOBRIST_BY_POS[to_pos]     # добавляем
     return new_hash
 
 
+# MOVE_ZOBRIST_DELTA[(from, jumped, to)] — XOR трёх ключей хода (76 ходов)
+MOVE_ZOBRIST_DELTA: Dict[Tuple[int, int, int], int] = {
+    move: ZOBRIST_BY_POS[move[0]] ^ ZOBRIST_BY_POS[move[1]] ^ ZOBRIST_BY_POS[move[2]]
+    for move in ENGLISH_MOVES
+}
+
+# По номеру хода (индекс ENGLISH_MOVES): XOR-маска pegs и дельта хеша
+MOVE_PEGS_XOR = tuple(POS_MASK[f] ^ POS_MASK[j] ^ POS_MASK[t] for f, j, t in ENGLISH_MOVES)
+MOVE_HASH_XOR = tuple(MOVE_ZOBRIST_DELTA[move] for move in ENGLISH_MOVES)
+
+# Дельта хеша по индексу from * 49 + to (jumped однозначно задан концами
+# хода): apply_move(from, jumped, to) без сборки и хеширования кортежа-ключа
+_MOVE_DELTA_BY_ENDS = [0] * (49 * 49)
+for (_from, _jumped, _to), _delta in MOVE_ZOBRIST_DELTA.items():
+    _MOVE_DELTA_BY_ENDS[_from * 49 + _to] = _delta
+
+
 class ZobristBitBoard:
     """
     BitBoard с Zobrist хешированием.
@@ -88,9 +120,15 @@ class ZobristBitBoard:
     """
     __slots__ = ('pegs', 'zobrist_hash', '_count')
     
-    def __init__(self, pegs: int, zobrist_hash: int = None):
+    def __init__(self, pegs: int, zobrist_hash: int = None, peg_count: int = None):
+        """
+        Args:
+            pegs: битовая маска колышков
+            zobrist_hash: готовый хеш (иначе считается с нуля)
+            peg_count: готовое число колышков (иначе popcount)
+        """
         self.pegs = pegs
-        self._count = _popcount(pegs)
+        self._count = pegs.bit_count() if peg_count is None else peg_count
         
         if zobrist_hash is None:
             self.zobrist_hash = compute_zobrist_hash(pegs)
@@ -107,46 +145,41 @@ class ZobristBitBoard:
         return self._count
     
     def has_peg(self, pos: int) -> bool:
-        return bool(self.pegs & (1 << pos))
+        return bool(self.pegs & POS_MASK[pos])
     
     def apply_move(self, from_pos: int, jumped: int, to_pos: int) -> 'ZobristBitBoard':
         """
-        Применяет ход с инкрементальным обновлением хеша.
+        Применяет ход с инкрементальным обновлением хеша
+        (одна XOR с готовой дельтой хода английской доски).
         """
-        new_pegs = self.pegs ^ (1 << from_pos) ^ (1 << jumped) ^ (1 << to_pos)
-        new_hash = update_zobrist_hash(self.zobrist_hash, from_pos, jumped, to_pos)
-        return ZobristBitBoard(new_pegs, new_hash)
+        new_pegs = self.pegs ^ POS_MASK[from_pos] ^ POS_MASK[jumped] ^ POS_MASK[to_pos]
+        new_hash = self.zobrist_hash ^ _MOVE_DELTA_BY_ENDS[from_pos * 49 + to_pos]
+        # Ход всегда снимает ровно один колышек
+        return ZobristBitBoard(new_pegs, new_hash, self._count - 1)
+    
+    def apply_move_by_id(self, move_id: int) -> 'ZobristBitBoard':
+        """Применяет ход по номеру (см. get_move_ids): две XOR с готовыми масками."""
+        return ZobristBitBoard(
+            self.pegs ^ MOVE_PEGS_XOR[move_id],
+            self.zobrist_hash ^ MOVE_HASH_XOR[move_id],
+            self._count - 1
+        )
+    
+    def get_move_ids(self) -> List[int]:
+        """Номера допустимых ходов (ENGLISH_MOVES[id]), порядок как у get_moves."""
+        move_ids: List[int] = []
+        _fill_move_ids_english(self.pegs, move_ids)
+        return move_ids
     
     def get_moves(self):
-        """Генерирует все допустимые ходы."""
-        from .bitboard import VALID_MASK
-        
+        """
+        Генерирует все допустимые ходы (по позиции, затем →, ←, ↓, ↑).
+
+        Общий с BitBoard сгенерированный код: маски направлений и готовые
+        кортежи ходов, перебор только клеток, откуда есть ход.
+        """
         moves = []
-        pegs = self.pegs
-        holes = VALID_MASK & ~pegs
-        
-        # Горизонтальные
-        can_right = pegs & (pegs >> 1) & (holes >> 2)
-        can_left = pegs & (pegs << 1) & (holes << 2)
-        for pos in ENGLISH_VALID_POSITIONS:
-            if can_right & (1 << pos) and pos % 7 <= 4:
-                moves.append((pos, pos + 1, pos + 2))
-            if can_left & (1 << pos) and pos % 7 >= 2:
-                moves.append((pos, pos - 1, pos - 2))
-        
-        # Вертикальные
-        can_down = pegs & (pegs >> 7) & (holes >> 14)
-        can_up = pegs & (pegs << 7) & (holes << 14)
-        for pos in ENGLISH_VALID_POSITIONS:
-            if can_down & (1 << pos) and pos // 7 <= 4:
-                to = pos + 14
-                if to in ENGLISH_VALID_POSITIONS:
-                    moves.append((pos, pos + 7, to))
-            if can_up & (1 << pos) and pos // 7 >= 2:
-                to = pos - 14
-                if to in ENGLISH_VALID_POSITIONS:
-                    moves.append((pos, pos - 7, to))
-        
+        _fill_moves_english(self.pegs, moves)
         return moves
     
     def is_solved(self) -> bool:
@@ -159,8 +192,8 @@ class ZobristBitBoard:
     def __eq__(self, other) -> bool:
         if not isinstance(other, ZobristBitBoard):
             return False
-        # Сначала сравниваем хеши (быстро), потом pegs (на случай коллизии)
-        return self.zobrist_hash == other.zobrist_hash and self.pegs == other.pegs
+        # Хеш — функция pegs: равенство pegs влечёт равенство хешей
+        return self.pegs == other.pegs
     
     def __repr__(self) -> str:
         return f"ZobristBitBoard({self._count} pegs, hash={self.zobrist_hash:016x})"
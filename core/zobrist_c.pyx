@@ -0,0 +1,200 @@
+# cython: language_level=3
+# cython: boundscheck=False
+# cython: wraparound=False
+# cython: cdivision=True
+"""
+core/zobrist_c.pyx
+
+ZobristBitBoard на Cython: pegs и хеш — uint64_t, ходы — обход битов
+через ctz, без Python int в горячих путях (get_moves, apply_move).
+
+API совпадает с core.zobrist.ZobristBitBoard; ключи Zobrist и номера
+ходов берутся из чистого Python модуля, который остаётся fallback.
+Выбор реализации — core.fast.ZobristBitBoard.
+"""
+
+from libc.stdint cimport uint64_t
+
+from . import bitboard as _bb
+from . import zobrist as _py
+
+cdef extern from *:
+    int __builtin_popcountll(unsigned long long x) nogil
+    int __builtin_ctzll(unsigned long long x) nogil
+
+
+cdef uint64_t VALID_MASK = _bb.VALID_MASK
+cdef uint64_t ENGLISH_START = _bb.ENGLISH_START
+cdef uint64_t RIGHT_SRC = _bb.ENGLISH_RIGHT_SRC
+cdef uint64_t LEFT_SRC = _bb.ENGLISH_LEFT_SRC
+cdef uint64_t DOWN_SRC = _bb.ENGLISH_DOWN_SRC
+cdef uint64_t UP_SRC = _bb.ENGLISH_UP_SRC
+
+# Готовые кортежи ходов: (→, ←, ↓, ↑) по клеткам и по номеру хода
+cdef tuple MOVES_FROM = _bb.MOVES_FROM
+cdef tuple ENGLISH_MOVES = _bb.ENGLISH_MOVES
+
+cdef uint64_t ZOBRIST[49]
+cdef uint64_t MOVE_PEGS_XOR[76]
+cdef uint64_t MOVE_HASH_XOR[76]
+# MOVE_IDS_FROM[pos][d] — номер хода из pos в направлении d (→, ←, ↓, ↑)
+cdef int MOVE_IDS_FROM[49][4]
+# Дельта хеша по from * 49 + to (для apply_move по кортежу)
+cdef uint64_t DELTA_BY_ENDS[49 * 49]
+
+
+cdef void _init_tables():
+    cdef int pos, d, move_id
+    for pos in range(49):
+        ZOBRIST[pos] = _py.ZOBRIST_BY_POS[pos]
+        for d in range(4):
+            MOVE_IDS_FROM[pos][d] = -1
+    for pos in range(49 * 49):
+        DELTA_BY_ENDS[pos] = 0
+    for move_id, move in enumerate(ENGLISH_MOVES):
+        MOVE_PEGS_XOR[move_id] = _py.MOVE_PEGS_XOR[move_id]
+        MOVE_HASH_XOR[move_id] = _py.MOVE_HASH_XOR[move_id]
+        DELTA_BY_ENDS[move[0] * 49 + move[2]] = _py.MOVE_HASH_XOR[move_id]
+        MOVE_IDS_FROM[move[0]][MOVES_FROM[move[0]].index(move)] = move_id
+
+
+_init_tables()
+
+
+cdef inline uint64_t compute_hash(uint64_t pegs) noexcept nogil:
+    """Полный Zobrist хеш: XOR ключей по установленным битам."""
+    cdef uint64_t h = 0
+    pegs &= VALID_MASK
+    while pegs:
+        h ^= ZOBRIST[__builtin_ctzll(pegs)]
+        pegs &= pegs - 1
+    return h
+
+
+cdef inline void move_masks(uint64_t pegs, uint64_t* right, uint64_t* left,
+                            uint64_t* down, uint64_t* up) noexcept nogil:
+    """Маски клеток, откуда есть ход в каждом направлении."""
+    cdef uint64_t holes = VALID_MASK & ~pegs
+    right[0] = pegs & (pegs >> 1) & (holes >> 2) & RIGHT_SRC
+    left[0] = pegs & (pegs << 1) & (holes << 2) & LEFT_SRC
+    down[0] = pegs & (pegs >> 7) & (holes >> 14) & DOWN_SRC
+    up[0] = pegs & (pegs << 7) & (holes << 14) & UP_SRC
+
+
+cdef ZobristBitBoard make_board(uint64_t pegs, uint64_t zobrist_hash, int count):
+    """Быстрый конструктор без __init__."""
+    cdef ZobristBitBoard board = ZobristBitBoard.__new__(ZobristBitBoard)
+    board.pegs = pegs
+    board.zobrist_hash = zobrist_hash
+    board._count = count
+    return board
+
+
+cdef class ZobristBitBoard:
+    """
+    BitBoard с Zobrist хешированием (Cython).
+
+    Хеш обновляется инкрементально при каждом ходе.
+    """
+
+    cdef readonly uint64_t pegs
+    cdef readonly uint64_t zobrist_hash
+    cdef int _count
+
+    def __init__(self, uint64_t pegs, zobrist_hash=None, peg_count=None):
+        self.pegs = pegs
+        self._count = __builtin_popcountll(pegs) if peg_count is None else peg_count
+        self.zobrist_hash = compute_hash(pegs) if zobrist_hash is None else zobrist_hash
+
+    @classmethod
+    def english_start(cls):
+        """Стандартная английская доска."""
+        return make_board(ENGLISH_START, compute_hash(ENGLISH_START),
+                          __builtin_popcountll(ENGLISH_START))
+
+    cpdef int peg_count(self):
+        return self._count
+
+    cpdef bint has_peg(self, int pos):
+        return (self.pegs >> pos) & 1
+
+    cpdef ZobristBitBoard apply_move(self, int from_pos, int jumped, int to_pos):
+        """Применяет ход с инкрементальным обновлением хеша."""
+        return make_board(
+            self.pegs ^ (1ULL << from_pos) ^ (1ULL << jumped) ^ (1ULL << to_pos),
+            self.zobrist_hash ^ DELTA_BY_ENDS[from_pos * 49 + to_pos],
+            self._count - 1
+        )
+
+    cpdef ZobristBitBoard apply_move_by_id(self, int move_id):
+        """Применяет ход по номеру (см. get_move_ids)."""
+        return make_board(
+            self.pegs ^ MOVE_PEGS_XOR[move_id],
+            self.zobrist_hash ^ MOVE_HASH_XOR[move_id],
+            self._count - 1
+        )
+
+    cpdef list get_move_ids(self):
+        """Номера допустимых ходов, порядок как у get_moves."""
+        cdef uint64_t right, left, down, up, sources, lsb
+        cdef int pos
+        cdef list move_ids = []
+
+        move_masks(self.pegs, &right, &left, &down, &up)
+        sources = right | left | down | up
+        while sources:
+            lsb = sources & (~sources + 1)
+            sources ^= lsb
+            pos = __builtin_ctzll(lsb)
+            if right & lsb:
+                move_ids.append(MOVE_IDS_FROM[pos][0])
+            if left & lsb:
+                move_ids.append(MOVE_IDS_FROM[pos][1])
+            if down & lsb:
+                move_ids.append(MOVE_IDS_FROM[pos][2])
+            if up & lsb:
+                move_ids.append(MOVE_IDS_FROM[pos][3])
+        return move_ids
+
+    cpdef list get_moves(self):
+        """Генерирует все допустимые ходы (по позиции, затем →, ←, ↓, ↑)."""
+        cdef uint64_t right, left, down, up, sources, lsb
+        cdef tuple cell
+        cdef list moves = []
+
+        move_masks(self.pegs, &right, &left, &down, &up)
+        sources = right | left | down | up
+        while sources:
+            lsb = sources & (~sources + 1)
+            sources ^= lsb
+            cell = <tuple>MOVES_FROM[__builtin_ctzll(lsb)]
+            if right & lsb:
+                moves.append(cell[0])
+            if left & lsb:
+                moves.append(cell[1])
+            if down & lsb:
+                moves.append(cell[2])
+            if up & lsb:
+                moves.append(cell[3])
+        return moves
+
+    cpdef bint is_solved(self):
+        return self._count == 1
+
+    def __hash__(self):
+        # Как у Python версии: значения больше 2^63 - 1 Python сводит через hash(int)
+        if self.zobrist_hash >> 63:
+            return hash(<object>self.zobrist_hash)
+        return <Py_hash_t>self.zobrist_hash
+
+    def __eq__(self, other):
+        if not isinstance(other, ZobristBitBoard):
+            return False
+        # Хеш — функция pegs: равенство pegs влечёт равенство хешей
+        return self.pegs == (<ZobristBitBoard>other).pegs
+
+    def __reduce__(self):
+        return (ZobristBitBoard, (self.pegs, self.zobrist_hash, self._count))
+
+    def __repr__(self):
+        return f"ZobristBitBoard({self._count} pegs, hash={self.zobrist_hash:016x})"
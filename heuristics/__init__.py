@@ -26,6 +26,7 @@ from .advanced import (
 from .pattern_db import (
     PatternDatabase,
     pattern_heuristic,
+    pattern_heuristic_batch,
     combined_pattern_heuristic,
     get_pattern_db
 )
@@ -44,6 +45,7 @@ __all__ = [
     'heuristic_edge_penalty',
     'PatternDatabase',
     'pattern_heuristic',
+    'pattern_heuristic_batch',
     'combined_pattern_heuristic',
     'get_pattern_db',
     'evaluate_position'
@@ -4,7 +4,7 @@ heuristics/advanced.py
 Продвинутые эвристики для оценки позиций.
 """
 
-from core.bitboard import BitBoard, ENGLISH_VALID_POSITIONS
+from core.bitboard import BitBoard, VALID_MASK, COLS_0_TO_5, COLS_1_TO_6
 
 
 def heuristic_mobility(board: BitBoard) -> int:
@@ -12,53 +12,36 @@ def heuristic_mobility(board: BitBoard) -> int:
     Количество доступных ходов (мобильность).
     Больше ходов = больше гибкости = лучше.
     """
-    return len(board.get_moves())
+    return board.count_moves()
 
 
 def heuristic_isolated(board: BitBoard) -> int:
     """
     Количество изолированных колышков (без соседей).
     Изолированные колышки — проблема.
+
+    SWAR: маска клеток, у которых есть сосед-колышек, — четыре сдвига pegs.
     """
-    count = 0
-    for pos in ENGLISH_VALID_POSITIONS:
-        if not board.has_peg(pos):
-            continue
-        
-        r, c = pos // 7, pos % 7
-        has_neighbor = False
-        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            nr, nc = r + dr, c + dc
-            neighbor_pos = nr * 7 + nc
-            if neighbor_pos in ENGLISH_VALID_POSITIONS and board.has_peg(neighbor_pos):
-                has_neighbor = True
-                break
-        
-        if not has_neighbor:
-            count += 1
-    
-    return count
+    pegs = board.pegs & VALID_MASK
+    has_neighbor = (
+        ((pegs >> 1) & COLS_0_TO_5) | ((pegs << 1) & COLS_1_TO_6)
+        | (pegs >> 7) | (pegs << 7)
+    )
+    return (pegs & ~has_neighbor).bit_count()
 
 
 def heuristic_cluster(board: BitBoard) -> int:
     """
     Подсчёт соседних пар колышков (кластеризация).
     Больше пар = лучше (колышки рядом легче убирать).
+
+    Пары вправо и вниз (каждая считается один раз) — два сдвига и popcount.
     """
-    pairs = 0
-    for pos in ENGLISH_VALID_POSITIONS:
-        if not board.has_peg(pos):
-            continue
-        
-        r, c = pos // 7, pos % 7
-        # Считаем только вправо и вниз (чтобы не дублировать)
-        for dr, dc in [(0, 1), (1, 0)]:
-            nr, nc = r + dr, c + dc
-            neighbor_pos = nr * 7 + nc
-            if neighbor_pos in ENGLISH_VALID_POSITIONS and board.has_peg(neighbor_pos):
-                pairs += 1
-    
-    return pairs
+    pegs = board.pegs & VALID_MASK
+    return (
+        (pegs & (pegs >> 1) & COLS_0_TO_5).bit_count()
+        + (pegs & (pegs >> 7)).bit_count()
+    )
 
 
 def heuristic_edge_penalty(board: BitBoard) -> int:
@@ -70,7 +53,7 @@ def heuristic_edge_penalty(board: BitBoard) -> int:
     edge_positions = {2, 4, 9, 11, 14, 20, 21, 27, 28, 34, 37, 39, 44, 46}
     
     for pos in edge_positions:
-        if board.has_peg(pos):
+        if (board.pegs >> pos) & 1:
             penalty += 1
     
     return penalty
@@ -4,7 +4,19 @@ heuristics/basic.py
 Базовые эвристические функции.
 """
 
-from core.bitboard import BitBoard, ENGLISH_VALID_POSITIONS
+from core.bitboard import BitBoard, ENGLISH_VALID_POSITIONS, VALID_MASK, ROW, COL
+
+# Манхэттенское расстояние клетки английской доски до центра (3, 3)
+DISTANCE_TO_CENTER = tuple(
+    abs(ROW[pos] - 3) + abs(COL[pos] - 3) if pos in ENGLISH_VALID_POSITIONS else 0
+    for pos in range(49)
+)
+
+# Клетки на расстоянии 1..4 от центра: сумма расстояний — четыре popcount
+_DIST_1, _DIST_2, _DIST_3, _DIST_4 = (
+    sum(1 << pos for pos in ENGLISH_VALID_POSITIONS if DISTANCE_TO_CENTER[pos] == d)
+    for d in range(1, 5)
+)
 
 
 def heuristic_peg_count(board: BitBoard) -> int:
@@ -20,12 +32,23 @@ def heuristic_distance_to_center(board: BitBoard, center: tuple = (3, 3)) -> flo
     Суммарное манхэттенское расстояние колышков до центра.
     Чем ближе к центру — тем лучше.
     """
+    pegs = board.pegs & VALID_MASK
+    if center == (3, 3):
+        return (
+            (pegs & _DIST_1).bit_count()
+            + 2 * (pegs & _DIST_2).bit_count()
+            + 3 * (pegs & _DIST_3).bit_count()
+            + 4 * (pegs & _DIST_4).bit_count()
+        )
+    
+    # Другой центр: обход только установленных битов
     cr, cc = center
     total = 0
-    for pos in ENGLISH_VALID_POSITIONS:
-        if board.has_peg(pos):
-            r, c = pos // 7, pos % 7
-            total += abs(r - cr) + abs(c - cc)
+    while pegs:
+        lsb = pegs & -pegs
+        pos = lsb.bit_length() - 1
+        total += abs(ROW[pos] - cr) + abs(COL[pos] - cc)
+        pegs ^= lsb
     return total
 
 
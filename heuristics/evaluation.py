@@ -23,7 +23,7 @@ def evaluate_position(board: 'BitBoard', num_moves: int = None) -> float:
         оценка позиции (меньше = лучше)
     """
     if num_moves is None:
-        num_moves = len(board.get_moves())
+        num_moves = board.count_moves()
     
     # Пробуем использовать Rust версию
     try:
@@ -39,29 +39,24 @@ def evaluate_position(board: 'BitBoard', num_moves: int = None) -> float:
     except ImportError:
         pass
     
-    # Fallback на оригинальную версию
-    from core.bitboard import ENGLISH_VALID_POSITIONS, CENTER_POS
-    from .pagoda import PAGODA_WEIGHTS
+    # Fallback на чистый Python: число колышков хранится в доске, расстояние
+    # до центра и Pagoda — взвешенные popcount по маскам (без обхода клеток)
+    from core.bitboard import CENTER_POS
+    from .basic import heuristic_distance_to_center
+    from .pagoda import PAGODA_WEIGHTS, pagoda_value
     
-    score = board.peg_count() * 10.0
+    peg_count = board.peg_count()
+    score = peg_count * 10.0
     
     # Расстояние до центра
-    center_row, center_col = 3, 3
-    for pos in ENGLISH_VALID_POSITIONS:
-        if board.has_peg(pos):
-            r, c = pos // 7, pos % 7
-            score += abs(r - center_row) + abs(c - center_col)
+    score += heuristic_distance_to_center(board)
     
     # Мобильность
     score -= num_moves * 2.0
     
     # Pagoda проверка
-    from .pagoda import pagoda_value
-    current_pagoda = pagoda_value(board)
-    target_pagoda = PAGODA_WEIGHTS.get(CENTER_POS, 0)
-    
-    if board.peg_count() > 15:
-        if current_pagoda < target_pagoda:
+    if peg_count > 15:
+        if pagoda_value(board) < PAGODA_WEIGHTS[CENTER_POS]:
             score += 1000.0
     
     return score
@@ -6,8 +6,8 @@ Numba-оптимизированные версии эвристик Pagoda.
 """
 
 try:
-    from numba import jit, types
-    from numba.typed import Dict
+    import numpy as np
+    from numba import jit, prange
     NUMBA_AVAILABLE = True
 except ImportError:
     NUMBA_AVAILABLE = False
@@ -18,148 +18,142 @@ except ImportError:
         return decorator
 
 
-# Конвертируем PAGODA_WEIGHTS в формат для Numba
-if NUMBA_AVAILABLE:
-    _PAGODA_DICT = Dict.empty(key_type=types.int64, value_type=types.int64)
-    PAGODA_WEIGHTS_PY = {
-        2: 1, 3: 2, 4: 1,
-        9: 2, 10: 4, 11: 2,
-        14: 1, 15: 2, 16: 3, 17: 4, 18: 3, 19: 2, 20: 1,
-        21: 2, 22: 4, 23: 4, 24: 6, 25: 4, 26: 4, 27: 2,
-        28: 1, 29: 2, 30: 3, 31: 4, 32: 3, 33: 2, 34: 1,
-        37: 2, 38: 4, 39: 2,
-        44: 1, 45: 2, 46: 1,
-    }
-    for k, v in PAGODA_WEIGHTS_PY.items():
-        _PAGODA_DICT[k] = v
-else:
-    PAGODA_WEIGHTS_PY = {
-        2: 1, 3: 2, 4: 1,
-        9: 2, 10: 4, 11: 2,
-        14: 1, 15: 2, 16: 3, 17: 4, 18: 3, 19: 2, 20: 1,
-        21: 2, 22: 4, 23: 4, 24: 6, 25: 4, 26: 4, 27: 2,
-        28: 1, 29: 2, 30: 3, 31: 4, 32: 3, 33: 2, 34: 1,
-        37: 2, 38: 4, 39: 2,
-        44: 1, 45: 2, 46: 1,
-    }
-    _PAGODA_DICT = None
+PAGODA_WEIGHTS_PY = {
+    2: 1, 3: 2, 4: 1,
+    9: 2, 10: 4, 11: 2,
+    14: 1, 15: 2, 16: 3, 17: 4, 18: 3, 19: 2, 20: 1,
+    21: 2, 22: 4, 23: 4, 24: 6, 25: 4, 26: 4, 27: 2,
+    28: 1, 29: 2, 30: 3, 31: 4, 32: 3, 33: 2, 34: 1,
+    37: 2, 38: 4, 39: 2,
+    44: 1, 45: 2, 46: 1,
+}
+
+# Валидные позиции английской доски и веса по номеру клетки 0..48
+# (0 вне доски): вес берётся одним индексированием, без словаря
+_VALID_POSITIONS = tuple(sorted(PAGODA_WEIGHTS_PY))
+_PAGODA_BY_POS = tuple(PAGODA_WEIGHTS_PY.get(pos, 0) for pos in range(49))
 
 
 if NUMBA_AVAILABLE:
+    # Глобальные массивы Numba подставляет в ядра как константы
+    _VALID_POSITIONS_ARRAY = np.array(_VALID_POSITIONS, dtype=np.int64)
+    _PAGODA_ARRAY = np.array(_PAGODA_BY_POS, dtype=np.int64)
+
     @jit(nopython=True, cache=True)
-    def fast_pagoda_value_numba(pegs: int, pagoda_dict) -> int:
+    def fast_pagoda_value_numba(pegs: int, pagoda) -> int:
         """
         Вычисляет значение Pagoda функции (Numba версия).
         
         Args:
             pegs: битовая маска колышков
-            pagoda_dict: словарь весов Pagoda (numba.typed.Dict)
+            pagoda: веса Pagoda по номеру клетки (массив из 49 int64)
         
         Returns:
             сумма весов всех колышков
         """
         total = 0
-        # Валидные позиции английской доски
-        valid_positions = [2, 3, 4, 9, 10, 11,
-                          14, 15, 16, 17, 18, 19, 20,
-                          21, 22, 23, 24, 25, 26, 27,
-                          28, 29, 30, 31, 32, 33, 34,
-                          37, 38, 39, 44, 45, 46]
-        
-        for pos in valid_positions:
+        for i in range(_VALID_POSITIONS_ARRAY.shape[0]):
+            pos = _VALID_POSITIONS_ARRAY[i]
             if (pegs >> pos) & 1:  # Проверка наличия колышка
-                if pos in pagoda_dict:
-                    total += pagoda_dict[pos]
-        
+                total += pagoda[pos]
         return total
     
     @jit(nopython=True, cache=True)
     def fast_popcount64(x: int) -> int:
-        """Быстрый подсчёт битов (popcount) — встроенный в Numba."""
-        return bin(x).count('1')  # Numba оптимизирует это
+        """
+        Подсчёт битов (SWAR). bin() в nopython-режиме не компилируется,
+        а этот шаблон LLVM сворачивает в одну инструкцию popcnt.
+        """
+        x = x - ((x >> 1) & 0x5555555555555555)
+        x = (x & 0x3333333333333333) + ((x >> 2) & 0x3333333333333333)
+        x = (x + (x >> 4)) & 0x0F0F0F0F0F0F0F0F
+        return (x * 0x0101010101010101) >> 56
     
     @jit(nopython=True, cache=True)
-    def fast_evaluate_position(pegs: int, num_moves: int, pagoda_dict) -> float:
+    def fast_evaluate_position(pegs: int, num_moves: int, pagoda) -> float:
         """
         Быстрая оценка позиции (Numba версия).
         
         Args:
             pegs: битовая маска колышков
             num_moves: количество доступных ходов
-            pagoda_dict: словарь весов Pagoda
+            pagoda: веса Pagoda по номеру клетки (массив из 49 int64)
         
         Returns:
             оценка позиции (меньше = лучше)
         """
-        # Подсчёт колышков
+        # Подсчёт колышков, расстояния до центра и Pagoda за один проход
         peg_count = 0
         distance_sum = 0
-        valid_positions = [2, 3, 4, 9, 10, 11,
-                          14, 15, 16, 17, 18, 19, 20,
-                          21, 22, 23, 24, 25, 26, 27,
-                          28, 29, 30, 31, 32, 33, 34,
-                          37, 38, 39, 44, 45, 46]
-        center_row, center_col = 3, 3
-        
-        for pos in valid_positions:
+        pagoda_val = 0
+        for i in range(_VALID_POSITIONS_ARRAY.shape[0]):
+            pos = _VALID_POSITIONS_ARRAY[i]
             if (pegs >> pos) & 1:
                 peg_count += 1
-                r, c = pos // 7, pos % 7
-                distance_sum += abs(r - center_row) + abs(c - center_col)
+                distance_sum += abs(pos // 7 - 3) + abs(pos % 7 - 3)
+                pagoda_val += pagoda[pos]
         
         score = peg_count * 10.0
         score += distance_sum
         score -= num_moves * 2.0
         
-        # Pagoda проверка
-        pagoda_val = fast_pagoda_value_numba(pegs, pagoda_dict)
-        target_pagoda = pagoda_dict.get(24, 0)  # CENTER_POS = 24
-        
+        # Pagoda проверка: цель — колышек в центре (CENTER_POS = 24)
         if peg_count > 15:
-            if pagoda_val < target_pagoda:
+            if pagoda_val < pagoda[24]:
                 score += 1000.0
         
         return score
+
+    @jit(nopython=True, parallel=True, cache=True)
+    def _evaluate_batch_nb(pegs_arr, moves_arr, valid_positions, pagoda, out):
+        """
+        Пакетная оценка позиций: то же, что fast_evaluate_position,
+        для каждого элемента массива (параллельно по prange).
+        """
+        target_pagoda = pagoda[24]  # CENTER_POS = 24
+        for i in prange(pegs_arr.shape[0]):
+            pegs = pegs_arr[i]
+            peg_count = 0
+            distance_sum = 0
+            pagoda_val = 0
+            for j in range(valid_positions.shape[0]):
+                pos = valid_positions[j]
+                if (pegs >> pos) & 1:
+                    peg_count += 1
+                    distance_sum += abs(pos // 7 - 3) + abs(pos % 7 - 3)
+                    pagoda_val += pagoda[pos]
+
+            score = peg_count * 10.0 + distance_sum - moves_arr[i] * 2.0
+            if peg_count > 15 and pagoda_val < target_pagoda:
+                score += 1000.0
+            out[i] = score
 else:
     # Fallback версии без Numba
-    def fast_pagoda_value_numba(pegs: int, pagoda_dict) -> int:
+    _PAGODA_ARRAY = _PAGODA_BY_POS
+
+    def fast_pagoda_value_numba(pegs: int, pagoda) -> int:
         total = 0
-        valid_positions = [2, 3, 4, 9, 10, 11,
-                          14, 15, 16, 17, 18, 19, 20,
-                          21, 22, 23, 24, 25, 26, 27,
-                          28, 29, 30, 31, 32, 33, 34,
-                          37, 38, 39, 44, 45, 46]
-        for pos in valid_positions:
+        for pos in _VALID_POSITIONS:
             if (pegs >> pos) & 1:
-                if pos in pagoda_dict:
-                    total += pagoda_dict[pos]
+                total += pagoda[pos]
         return total
     
-    def fast_evaluate_position(pegs: int, num_moves: int, pagoda_dict) -> float:
+    def fast_evaluate_position(pegs: int, num_moves: int, pagoda) -> float:
         peg_count = 0
         distance_sum = 0
-        valid_positions = [2, 3, 4, 9, 10, 11,
-                          14, 15, 16, 17, 18, 19, 20,
-                          21, 22, 23, 24, 25, 26, 27,
-                          28, 29, 30, 31, 32, 33, 34,
-                          37, 38, 39, 44, 45, 46]
-        center_row, center_col = 3, 3
-        
-        for pos in valid_positions:
+        pagoda_val = 0
+        for pos in _VALID_POSITIONS:
             if (pegs >> pos) & 1:
                 peg_count += 1
-                r, c = pos // 7, pos % 7
-                distance_sum += abs(r - center_row) + abs(c - center_col)
+                distance_sum += abs(pos // 7 - 3) + abs(pos % 7 - 3)
+                pagoda_val += pagoda[pos]
         
         score = peg_count * 10.0
         score += distance_sum
         score -= num_moves * 2.0
         
-        pagoda_val = fast_pagoda_value_numba(pegs, pagoda_dict)
-        target_pagoda = pagoda_dict.get(24, 0)
-        
         if peg_count > 15:
-            if pagoda_val < target_pagoda:
+            if pagoda_val < pagoda[24]:
                 score += 1000.0
         
         return score
@@ -168,15 +162,25 @@ else:
 # Обёртки для удобного использования
 def pagoda_value_fast(pegs: int) -> int:
     """Быстрая версия pagoda_value."""
-    if NUMBA_AVAILABLE and _PAGODA_DICT is not None:
-        return fast_pagoda_value_numba(pegs, _PAGODA_DICT)
-    else:
-        return fast_pagoda_value_numba(pegs, PAGODA_WEIGHTS_PY)
+    return fast_pagoda_value_numba(pegs, _PAGODA_ARRAY)
 
 
 def evaluate_position_fast(pegs: int, num_moves: int) -> float:
     """Быстрая оценка позиции."""
-    if NUMBA_AVAILABLE and _PAGODA_DICT is not None:
-        return fast_evaluate_position(pegs, num_moves, _PAGODA_DICT)
-    else:
-        return fast_evaluate_position(pegs, num_moves, PAGODA_WEIGHTS_PY)
+    return fast_evaluate_position(pegs, num_moves, _PAGODA_ARRAY)
+
+
+def evaluate_batch_fast(pegs_list, moves_list) -> list:
+    """
+    Пакетная оценка позиций: один вызов ядра на весь список
+    вместо Python-вызова на каждую позицию.
+    """
+    if not NUMBA_AVAILABLE:
+        return [evaluate_position_fast(p, m) for p, m in zip(pegs_list, moves_list)]
+
+    # int64, а не uint64: иначе сдвиги в Numba уходят во float
+    pegs_arr = np.fromiter(pegs_list, dtype=np.int64)
+    moves_arr = np.fromiter(moves_list, dtype=np.int64, count=len(pegs_arr))
+    out = np.empty(len(pegs_arr), dtype=np.float64)
+    _evaluate_batch_nb(pegs_arr, moves_arr, _VALID_POSITIONS_ARRAY, _PAGODA_ARRAY, out)
+    return out.tolist()
@@ -11,25 +11,26 @@ Pattern Database (PDB) — предвычисленные эвристики.
 Это даёт очень сильную нижнюю границу!
 """
 
-import sys
-from typing import Dict, List, Tuple, Set, Optional
-from collections import deque
+from functools import lru_cache
+from typing import Callable, Dict, List, Tuple, Set, Optional
 import pickle
 import os
 
 from core.bitboard import ENGLISH_VALID_POSITIONS, CENTER_POS
 
-# Быстрый popcount (подсчёт битов)
-if sys.version_info >= (3, 10):
-    def _popcount(x: int) -> int:
-        return x.bit_count()
-else:
-    def _popcount(x: int) -> int:
-        """Быстрый подсчёт битов (popcount) для Python < 3.10."""
-        x = x - ((x >> 1) & 0x5555555555555555)
-        x = (x & 0x3333333333333333) + ((x >> 2) & 0x3333333333333333)
-        x = (x + (x >> 4)) & 0x0F0F0F0F0F0F0F0F
-        return ((x * 0x0101010101010101) >> 56) & 0xFF
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    # Cython версия get_heuristic (PEXT + таблицы без Python int)
+    from .pattern_db_c import PatternLookup
+    USING_CYTHON_PDB = True
+except ImportError:
+    USING_CYTHON_PDB = False
+
 
 # =====================================================
 # РАЗБИЕНИЕ ДОСКИ НА РЕГИОНЫ
@@ -64,6 +65,35 @@ REGION_CENTER = frozenset([16, 17, 18, 23, 24, 25, 30, 31, 32])
 REGIONS = [REGION_TOP, REGION_BOTTOM, REGION_LEFT, REGION_RIGHT, REGION_CENTER]
 REGION_NAMES = ["TOP", "BOTTOM", "LEFT", "RIGHT", "CENTER"]
 
+# Файл БД по умолчанию и его сигнатура (старый формат — pattern_db.pkl)
+PATTERN_DB_PATH = "pattern_db.bin"
+_LEGACY_PATTERN_DB_PATH = "pattern_db.pkl"
+_FILE_MAGIC = b"PDB1"
+
+
+@lru_cache(maxsize=None)
+def _region_runs(region: frozenset) -> Tuple[Tuple[int, int], ...]:
+    """
+    Непрерывные серии клеток региона как пары (сдвиг, маска).
+
+    Серия из k соседних битов pegs переносится в состояние одним сдвигом
+    и AND (программный PEXT): регионы английской доски — 2-3 серии
+    вместо 6-9 проверок отдельных битов.
+    """
+    positions = sorted(region)
+    runs = []
+    start = 0
+    while start < len(positions):
+        end = start
+        while end + 1 < len(positions) and positions[end + 1] == positions[end] + 1:
+            end += 1
+        # Биты positions[start..end] → биты start..end состояния
+        shift = positions[start] - start
+        mask = ((1 << (end - start + 1)) - 1) << start
+        runs.append((shift, mask))
+        start = end + 1
+    return tuple(runs)
+
 
 def extract_region_state(pegs: int, region: frozenset) -> int:
     """
@@ -71,17 +101,38 @@ def extract_region_state(pegs: int, region: frozenset) -> int:
     
     Returns:
         Битовая маска только для позиций в регионе
+        (i-й бит — i-я по порядку клетка региона)
     """
     state = 0
-    for i, pos in enumerate(sorted(region)):
-        if pegs & (1 << pos):
-            state |= (1 << i)
+    for shift, mask in _region_runs(region):
+        state |= (pegs >> shift) & mask
     return state
 
 
+def _compile_lookup(lookup) -> Callable[[int], int]:
+    """
+    Компилирует сумму по регионам в одно выражение без циклов:
+    ``t0[(pegs >> s) & m | ...] + t1[...] + ...``.
+
+    Таблицы передаются аргументами по умолчанию (локальные переменные
+    вместо глобальных); серии битов — константы в коде.
+    """
+    terms = []
+    params = ["pegs"]
+    namespace = {}
+    for i, (runs, table) in enumerate(lookup):
+        namespace[f"t{i}"] = table
+        params.append(f"t{i}=t{i}")
+        index = " | ".join(f"((pegs >> {shift}) & {mask:#x})" for shift, mask in runs)
+        terms.append(f"t{i}[{index}]")
+    source = f"def _lookup_heuristic({', '.join(params)}):\n    return {' + '.join(terms) or '0'}\n"
+    exec(compile(source, "<pattern_db:_lookup_heuristic>", "exec"), namespace)
+    return namespace["_lookup_heuristic"]
+
+
 def region_peg_count(state: int, region_size: int) -> int:
     """Количество колышков в состоянии региона."""
-    return _popcount(state)
+    return state.bit_count()
 
 
 # =====================================================
@@ -98,6 +149,31 @@ class PatternDatabase:
     def __init__(self):
         self.databases: Dict[str, Dict[int, int]] = {}
         self.regions = dict(zip(REGION_NAMES, REGIONS))
+        # (серии битов региона, плотная таблица state → cost) для get_heuristic
+        self._lookup: List[Tuple[Tuple[Tuple[int, int], ...], bytes]] = []
+        # Сумма по _lookup: PatternLookup (Cython) или _compile_lookup
+        self._lookup_heuristic = _compile_lookup(self._lookup)
+    
+    def _build_lookup(self) -> None:
+        """
+        Плотные таблицы по регионам: bytes длины 2^size, индекс — состояние
+        региона (отсутствующие состояния — 0, как .get(state, 0)).
+        """
+        lookup = []
+        for name in REGION_NAMES:
+            db = self.databases.get(name)
+            if db is None:
+                continue
+            region = self.regions[name]
+            table = bytearray(1 << len(region))
+            for state, cost in db.items():
+                table[state] = cost
+            lookup.append((_region_runs(region), bytes(table)))
+        self._lookup = lookup
+        if USING_CYTHON_PDB:
+            self._lookup_heuristic = PatternLookup(lookup)
+        else:
+            self._lookup_heuristic = _compile_lookup(lookup)
     
     def build_region_db(self, region_name: str, verbose: bool = True) -> Dict[int, int]:
         """
@@ -107,39 +183,22 @@ class PatternDatabase:
         добавляя колышки через "обратные ходы".
         """
         region = self.regions[region_name]
-        region_list = sorted(region)
         region_size = len(region)
         
         if verbose:
             print(f"  Building {region_name} ({region_size} positions)...")
         
-        db: Dict[int, int] = {}
-        
-        # BFS от пустого состояния
-        # Пустое состояние = 0, требует 0 ходов
-        db[0] = 0
-        queue = deque([0])
-        
-        while queue:
-            state = queue.popleft()
-            current_cost = db[state]
-            
-            # Генерируем "обратные ходы" — добавляем колышки
-            for i in range(region_size):
-                if state & (1 << i):
-                    continue  # уже есть колышек
-                
-                # Добавляем колышек на позицию i
-                new_state = state | (1 << i)
-                
-                if new_state not in db:
-                    db[new_state] = current_cost + 1
-                    queue.append(new_state)
+        # Обратный BFS от пустого состояния: обратный ход добавляет один
+        # колышек в любую пустую клетку, поэтому уровень BFS состояния —
+        # ровно число колышков в нём. Все 2^size состояний достижимы,
+        # таблица заполняется сразу, без очереди и словаря посещённых.
+        db: Dict[int, int] = {state: state.bit_count() for state in range(1 << region_size)}
         
         if verbose:
             print(f"    States: {len(db)}, Max cost: {max(db.values())}")
         
         self.databases[region_name] = db
+        self._build_lookup()
         return db
     
     def build_all(self, verbose: bool = True) -> None:
@@ -159,31 +218,106 @@ class PatternDatabase:
         Вычисляет эвристику как сумму по всем регионам.
         
         Это admissible (допустимая) эвристика!
+        
+        Состояние региона собирается сериями битов, стоимость — индекс
+        в плотной таблице; сумма развёрнута в одно выражение
+        (без словарей и циклов на горячем пути A*).
         """
-        total = 0
-        for name, region in self.regions.items():
-            if name not in self.databases:
-                continue
-            
-            state = extract_region_state(pegs, region)
-            cost = self.databases[name].get(state, 0)
-            total += cost
+        return self._lookup_heuristic(pegs)
+    
+    def get_heuristic_batch(self, pegs_list) -> list:
+        """
+        get_heuristic для набора позиций за один векторный проход NumPy.
+        
+        Окупается на десятках позиций и больше (фронт beam/BFS уровня);
+        для горстки детей одного узла A* скалярный get_heuristic быстрее.
+        Без NumPy — поэлементный get_heuristic.
+        """
+        if not NUMPY_AVAILABLE:
+            return [self.get_heuristic(pegs) for pegs in pegs_list]
         
-        return total
+        pegs_arr = np.asarray(pegs_list, dtype=np.uint64)
+        total = np.zeros(len(pegs_arr), dtype=np.uint8)
+        for runs, table in self._lookup:
+            state = np.zeros(len(pegs_arr), dtype=np.uint64)
+            for shift, mask in runs:
+                state |= (pegs_arr >> np.uint64(shift)) & np.uint64(mask)
+            total += np.frombuffer(table, dtype=np.uint8)[state]
+        return total.tolist()
     
-    def save(self, filepath: str = "pattern_db.pkl") -> None:
-        """Сохраняет БД на диск."""
+    def save(self, filepath: str = PATTERN_DB_PATH) -> None:
+        """
+        Сохраняет БД на диск в бинарном формате: плотные таблицы регионов
+        как есть (по байту на состояние, ~700 байт на всю БД).
+        
+        Формат: _FILE_MAGIC, число регионов, затем для каждого региона —
+        длина имени, имя (ASCII), размер региона, таблица 2^size байт.
+        """
+        chunks = [_FILE_MAGIC, bytes([len(self._lookup)])]
+        for name in REGION_NAMES:
+            db = self.databases.get(name)
+            if db is None:
+                continue
+            size = len(self.regions[name])
+            table = bytearray(1 << size)
+            for state, cost in db.items():
+                table[state] = cost
+            encoded = name.encode('ascii')
+            chunks += [bytes([len(encoded)]), encoded, bytes([size]), bytes(table)]
         with open(filepath, 'wb') as f:
-            pickle.dump(self.databases, f)
+            f.write(b''.join(chunks))
         print(f"Saved to {filepath}")
     
-    def load(self, filepath: str = "pattern_db.pkl") -> bool:
-        """Загружает БД с диска."""
+    def load(self, filepath: str = PATTERN_DB_PATH) -> bool:
+        """
+        Загружает БД с диска (бинарный формат save()).
+        
+        Файлы .pkl старого формата (pickle словаря словарей) тоже
+        читаются — поддержка устарела, пересохраните через save().
+        """
         if not os.path.exists(filepath):
             return False
         
         with open(filepath, 'rb') as f:
-            self.databases = pickle.load(f)
+            data = f.read()
+        
+        if not data.startswith(_FILE_MAGIC):
+            if not filepath.endswith('.pkl'):
+                return False
+            self.databases = pickle.loads(data)
+            self._build_lookup()
+            return True
+        
+        # Обрезанный или испорченный файл → False (get_pattern_db перестроит БД)
+        if len(data) <= len(_FILE_MAGIC):
+            return False
+        databases: Dict[str, Dict[int, int]] = {}
+        offset = len(_FILE_MAGIC) + 1
+        for _ in range(data[len(_FILE_MAGIC)]):
+            if offset >= len(data):
+                return False
+            name_len = data[offset]
+            # Имя и байт размера должны поместиться целиком
+            if offset + 2 + name_len > len(data):
+                return False
+            try:
+                name = data[offset + 1:offset + 1 + name_len].decode('ascii')
+            except UnicodeDecodeError:
+                return False
+            size = data[offset + 1 + name_len]
+            offset += name_len + 2
+            if name not in self.regions or len(self.regions[name]) != size:
+                return False
+            table = data[offset:offset + (1 << size)]
+            if len(table) != 1 << size:
+                return False
+            offset += 1 << size
+            databases[name] = dict(enumerate(table))
+        if offset != len(data):
+            return False
+        
+        self.databases = databases
+        self._build_lookup()
         return True
 
 
@@ -202,50 +336,63 @@ def get_pattern_db() -> PatternDatabase:
     if _pattern_db is None:
         _pattern_db = PatternDatabase()
         
-        # Пробуем загрузить с диска
+        # Пробуем загрузить с диска (старый pickle — с пересохранением)
         if not _pattern_db.load():
-            # Строим заново
-            _pattern_db.build_all(verbose=True)
+            if not _pattern_db.load(_LEGACY_PATTERN_DB_PATH):
+                # Строим заново
+                _pattern_db.build_all(verbose=True)
             _pattern_db.save()
     
     return _pattern_db
 
 
+@lru_cache(maxsize=1 << 20)
 def pattern_heuristic(pegs: int) -> int:
     """
     Эвристика на основе Pattern Database.
     
     Возвращает нижнюю границу числа ходов до решения.
+    Кэшируется по pegs (A* многократно оценивает одни и те же позиции);
+    сброс — pattern_heuristic.cache_clear().
     """
-    db = get_pattern_db()
+    # БД уже загружена почти всегда: без вызова get_pattern_db()
+    db = _pattern_db
+    if db is None:
+        db = get_pattern_db()
     return db.get_heuristic(pegs)
 
 
+def pattern_heuristic_batch(pegs_list) -> list:
+    """pattern_heuristic для списка позиций (см. get_heuristic_batch)."""
+    return get_pattern_db().get_heuristic_batch(pegs_list)
+
+
+@lru_cache(maxsize=1 << 20)
+def _combined_h(pegs: int) -> int:
+    """h(n) = max(pattern_heuristic, peg_count - 1) — не зависит от steps."""
+    # Берём максимум (обе admissible → max тоже admissible)
+    return max(pegs.bit_count() - 1, pattern_heuristic(pegs))
+
+
 # =====================================================
 # КОМБИНИРОВАННАЯ ЭВРИСТИКА
 # =====================================================
 
-def combined_pattern_heuristic(pegs: int, steps: int) -> float:
+def combined_pattern_heuristic(pegs: int, steps: int,
+                               peg_count: Optional[int] = None) -> float:
     """
     Комбинированная эвристика для A*.
     
     f(n) = g(n) + h(n)
     h(n) = max(pattern_heuristic, peg_count - 1)
-    """
-    from .pagoda import pagoda_value, PAGODA_WEIGHTS
-    from core.bitboard import BitBoard
-    
-    # Базовая эвристика
-    peg_count = _popcount(pegs)
-    base_h = peg_count - 1
-    
-    # Pattern heuristic
-    pattern_h = pattern_heuristic(pegs)
     
-    # Берём максимум (обе admissible → max тоже admissible)
-    h = max(base_h, pattern_h)
-    
-    return steps + h
+    h(n) кэшируется по pegs, steps прибавляется к готовому значению.
+    Если решатель ведёт число колышков сам (−1 за ход), его можно
+    передать в peg_count — тогда popcount не пересчитывается.
+    """
+    if peg_count is None:
+        return steps + _combined_h(pegs)
+    return steps + max(peg_count - 1, pattern_heuristic(pegs))
 
 
 # =====================================================
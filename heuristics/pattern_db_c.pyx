@@ -0,0 +1,95 @@
+# cython: language_level=3
+# cython: boundscheck=False
+# cython: wraparound=False
+# cython: cdivision=True
+"""
+heuristics/pattern_db_c.pyx
+
+Горячий путь PatternDatabase.get_heuristic на Cython: извлечение
+состояний регионов и сумма по плотным таблицам без Python int.
+
+Состояние региона — PEXT по маске региона (BMI2, если компилятор его
+включил через -march=native), иначе те же серии (сдвиг, маска), что и
+в чистом Python. Таблицы — bytes из PatternDatabase._lookup.
+Выбор реализации — heuristics.pattern_db.USING_CYTHON_PDB.
+"""
+
+from libc.stdint cimport uint64_t
+
+cdef extern from *:
+    """
+    #ifdef __BMI2__
+    #include <immintrin.h>
+    #define PDB_HAVE_PEXT 1
+    static inline unsigned long long pdb_pext(unsigned long long x, unsigned long long m) {
+        return _pext_u64(x, m);
+    }
+    #else
+    #define PDB_HAVE_PEXT 0
+    static inline unsigned long long pdb_pext(unsigned long long x, unsigned long long m) {
+        return 0;
+    }
+    #endif
+    """
+    bint PDB_HAVE_PEXT
+    unsigned long long pdb_pext(unsigned long long x, unsigned long long m) nogil
+
+cdef enum:
+    MAX_REGIONS = 8
+    MAX_RUNS = 8
+
+HAVE_PEXT = PDB_HAVE_PEXT
+
+
+cdef class PatternLookup:
+    """
+    Вызываемый объект pegs → сумма стоимостей по регионам.
+
+    Args:
+        lookup: список (серии битов региона, таблица bytes) —
+                PatternDatabase._lookup
+    """
+
+    cdef int n_regions
+    cdef uint64_t region_masks[MAX_REGIONS]
+    cdef int n_runs[MAX_REGIONS]
+    cdef int run_shifts[MAX_REGIONS][MAX_RUNS]
+    cdef uint64_t run_masks[MAX_REGIONS][MAX_RUNS]
+    cdef const unsigned char* tables[MAX_REGIONS]
+    # Держим ссылки на bytes: tables указывает в их буферы
+    cdef tuple _tables
+
+    def __init__(self, lookup):
+        cdef int i, j
+        cdef bytes table
+        if len(lookup) > MAX_REGIONS:
+            raise ValueError(f"Слишком много регионов: {len(lookup)}")
+        self._tables = tuple(bytes(table) for _, table in lookup)
+        self.n_regions = len(lookup)
+        for i, (runs, _) in enumerate(lookup):
+            if len(runs) > MAX_RUNS:
+                raise ValueError(f"Слишком много серий в регионе: {len(runs)}")
+            table = self._tables[i]
+            self.tables[i] = table
+            self.n_runs[i] = len(runs)
+            self.region_masks[i] = 0
+            for j, (shift, mask) in enumerate(runs):
+                self.run_shifts[i][j] = shift
+                self.run_masks[i][j] = mask
+                self.region_masks[i] |= (<uint64_t>mask) << shift
+
+    cdef inline int lookup(self, uint64_t pegs) noexcept nogil:
+        cdef int i, j, total = 0
+        cdef uint64_t state
+        for i in range(self.n_regions):
+            if PDB_HAVE_PEXT:
+                state = pdb_pext(pegs, self.region_masks[i])
+            else:
+                state = 0
+                for j in range(self.n_runs[i]):
+                    state |= (pegs >> self.run_shifts[i][j]) & self.run_masks[i][j]
+            total += self.tables[i][state]
+        return total
+
+    def __call__(self, uint64_t pegs):
+        return self.lookup(pegs)
@@ -40,19 +40,18 @@ def solve_matrix_board(board_matrix, solver_name='hybrid'):
     # Конвертируем матрицу в BitBoard: валидные клетки = PEG или HOLE
     pegs_bits = 0
     valid_mask = 0
-    rows = len(board_matrix)
-    cols = len(board_matrix[0]) if rows > 0 else 0
 
-    for r in range(rows):
-        for c in range(cols):
-            pos = r * 7 + c
-            cell = board_matrix[r][c]
+    for r, row in enumerate(board_matrix):
+        # Бит клетки (r, c) = 1 << (r * 7 + c): сдвигаем его вдоль строки
+        bit = 1 << (r * 7)
+        for cell in row:
             if cell == '●':  # PEG
-                pegs_bits |= (1 << pos)
-                valid_mask |= (1 << pos)
+                pegs_bits |= bit
+                valid_mask |= bit
             elif cell == '○':  # HOLE
-                valid_mask |= (1 << pos)
+                valid_mask |= bit
             # '▫' считаем вырезанной клеткой (вне valid_mask)
+            bit <<= 1
 
     bitboard = BitBoard(pegs_bits, valid_mask=valid_mask if valid_mask else None)
     return solve_bitboard(bitboard, solver_name, initial_matrix=board_matrix)
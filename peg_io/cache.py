@@ -2,42 +2,183 @@
 io/cache.py
 
 Кэширование решений на диск.
+
+Формат — JSON Lines: одна запись {"key": ..., "moves": [...]} на строку.
+save_solution дописывает строку в конец файла (O(1) на сохранение),
+при чтении более поздняя запись ключа побеждает. Когда строк становится
+вдвое больше, чем ключей, файл переписывается (compact).
+
+Дописывание и перезапись файла разделяются блокировкой fcntl.flock на
+CACHE_FILE + ".lock" (разделяемой и эксклюзивной): compact перечитывает
+файл под блокировкой, поэтому строки других процессов не теряются.
+Без fcntl (Windows) перезапись безопасна только при одном писателе.
+
+Старый solutions_cache.json (один словарь) читается, если .jsonl ещё нет;
+первое сохранение переводит кэш в новый формат.
 """
 
 import json
 import os
-from typing import Dict, List, Optional
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
 
 from core.utils import board_to_str
 
-CACHE_FILE = "solutions_cache.json"
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+CACHE_FILE = "solutions_cache.jsonl"
+_LEGACY_CACHE_FILE = "solutions_cache.json"
+
+# Разобранный кэш, число строк в файле и «отпечаток» файла (путь,
+# mtime_ns, размер), из которого он прочитан: пока файл не изменился,
+# он не перечитывается
+_solutions: Optional[Dict[str, List[str]]] = None
+_solutions_lines = 0
+_solutions_stamp: Optional[Tuple[str, int, int]] = None
+
+
+def _file_stamp(path: str) -> Tuple[str, int, int]:
+    st = os.stat(path)
+    return path, st.st_mtime_ns, st.st_size
+
+
+@contextmanager
+def _cache_lock(exclusive: bool):
+    """Блокировка кэша между процессами (no-op без fcntl)."""
+    if not FCNTL_AVAILABLE:
+        yield
+        return
+    with open(CACHE_FILE + ".lock", 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _encode_record(key: str, moves: List[str]) -> bytes:
+    """Строка JSONL: компактно, символы доски в UTF-8 (без \\uXXXX)."""
+    record = {"key": key, "moves": moves}
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record) + b"\n"
+    return (json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n").encode()
+
+
+_decode_record = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def _legacy_path() -> Optional[str]:
+    """Старый JSON рядом с CACHE_FILE (только для пути по умолчанию)."""
+    return _LEGACY_CACHE_FILE if CACHE_FILE == "solutions_cache.jsonl" else None
+
+
+def _read_lines(path: str) -> Tuple[Dict[str, List[str]], int]:
+    """Читает JSONL: последняя запись ключа побеждает, битые строки пропускаются."""
+    solutions = {}
+    lines = 0
+    with open(path, 'rb') as f:
+        for line in f:
+            lines += 1
+            try:
+                record = _decode_record(line)
+                solutions[record["key"]] = record["moves"]
+            except (ValueError, KeyError, TypeError):
+                # Недописанная строка (прерванная запись, в т.ч. оборванная
+                # посреди UTF-8 символа — UnicodeDecodeError) — пропускаем
+                continue
+    return solutions, lines
 
 
 def load_solutions() -> Dict[str, List[str]]:
-    """Загружает все решения из кэша."""
-    if not os.path.exists(CACHE_FILE):
+    """
+    Загружает все решения из кэша.
+
+    Файл разбирается заново только после изменения на диске; иначе
+    возвращается тот же словарь (изменения в нём сохраняет save_solutions).
+    """
+    global _solutions, _solutions_lines, _solutions_stamp
+
+    try:
+        stamp = _file_stamp(CACHE_FILE)
+    except OSError:
+        return _load_legacy()
+    if stamp == _solutions_stamp:
+        return _solutions
+
+    try:
+        solutions, lines = _read_lines(CACHE_FILE)
+    except IOError:
+        return {}
+
+    _solutions, _solutions_lines, _solutions_stamp = solutions, lines, stamp
+    return solutions
+
+
+def _load_legacy() -> Dict[str, List[str]]:
+    """Словарь из старого solutions_cache.json (или пустой)."""
+    legacy = _legacy_path()
+    if legacy is None or not os.path.exists(legacy):
         return {}
-    
+
     try:
-        with open(CACHE_FILE, 'r') as f:
+        with open(legacy, 'r', encoding='utf-8') as f:
             return json.load(f)
     except (json.JSONDecodeError, IOError):
         return {}
 
 
 def save_solutions(solutions: Dict[str, List[str]]) -> None:
-    """Сохраняет все решения в кэш."""
-    with open(CACHE_FILE, 'w') as f:
-        json.dump(solutions, f, indent=2)
+    """Переписывает кэш целиком: по строке на ключ (атомарно через os.replace)."""
+    with _cache_lock(exclusive=True):
+        _rewrite(solutions)
+
+
+def _rewrite(solutions: Dict[str, List[str]]) -> None:
+    """Перезапись файла; вызывается под эксклюзивной блокировкой."""
+    global _solutions, _solutions_lines, _solutions_stamp
+
+    tmp_path = CACHE_FILE + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        for key, moves in solutions.items():
+            f.write(_encode_record(key, moves))
+    os.replace(tmp_path, CACHE_FILE)
+    _solutions, _solutions_lines, _solutions_stamp = (
+        solutions, len(solutions), _file_stamp(CACHE_FILE)
+    )
+
+
+def compact() -> None:
+    """
+    Убирает перезаписанные ключи: по одной строке на ключ.
+
+    Файл перечитывается под эксклюзивной блокировкой — строки, дописанные
+    другими процессами после нашего чтения, сохраняются.
+    """
+    with _cache_lock(exclusive=True):
+        try:
+            solutions, _ = _read_lines(CACHE_FILE)
+        except OSError:
+            return
+        _rewrite(solutions)
 
 
 def get_cached_solution(board: List[List[str]]) -> Optional[List[str]]:
     """
     Получает решение из кэша.
-    
+
     Args:
         board: доска
-        
+
     Returns:
         Список ходов или None
     """
@@ -49,12 +190,54 @@ def get_cached_solution(board: List[List[str]]) -> Optional[List[str]]:
 def save_solution(board: List[List[str]], moves: List[str]) -> None:
     """
     Сохраняет решение в кэш.
-    
+
+    Дописывает одну строку в конец файла; O_APPEND делает запись
+    атомарной относительно других процессов, пишущих в тот же кэш,
+    а разделяемая блокировка не даёт compact потерять её при перезаписи.
+
     Args:
         board: начальная позиция
         moves: список ходов
     """
+    global _solutions_lines, _solutions_stamp
+
     db = load_solutions()
     key = board_to_str(board)
     db[key] = moves
-    save_solutions(db)
+
+    if not os.path.exists(CACHE_FILE):
+        # Первое сохранение (или переход со старого JSON) — пишем всё
+        save_solutions(db)
+        return
+
+    line = _encode_record(key, moves)
+    with _cache_lock(exclusive=False):
+        # O_BINARY (только Windows) — без перевода \n в \r\n
+        fd = os.open(CACHE_FILE, os.O_RDWR | os.O_APPEND | os.O_CREAT
+                     | getattr(os, 'O_BINARY', 0))
+        try:
+            st = os.fstat(fd)
+            fresh = (CACHE_FILE, st.st_mtime_ns, st.st_size) == _solutions_stamp
+            # Последний байт: lseek + read переносимы (os.pread — только POSIX);
+            # запись с O_APPEND всё равно идёт в конец файла
+            if st.st_size:
+                os.lseek(fd, -1, os.SEEK_END)
+                if os.read(fd, 1) != b"\n":
+                    # Хвост от прерванной записи — начинаем с новой строки,
+                    # иначе наша запись склеится с битой строкой
+                    line = b"\n" + line
+            os.write(fd, line)
+            after = os.fstat(fd)
+        finally:
+            os.close(fd)
+
+    # Между нашим чтением и записью файл мог дописать другой процесс
+    if not fresh or after.st_size != st.st_size + len(line):
+        # Файл менялся извне — при следующем чтении разберём заново
+        _solutions_stamp = None
+        return
+    _solutions_lines += 1
+    _solutions_stamp = (CACHE_FILE, after.st_mtime_ns, after.st_size)
+
+    if _solutions_lines > 2 * len(db):
+        compact()
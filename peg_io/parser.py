@@ -4,8 +4,7 @@ io/parser.py
 Парсинг входных данных.
 """
 
-import re
-from typing import List
+from typing import List, Tuple
 
 from core.utils import PEG, HOLE, EMPTY
 
@@ -15,6 +14,8 @@ def parse_input(text: str) -> List[List[str]]:
     Парсит текстовый формат описания позиции.
     
     Формат: size=7x7 pegs=A2,A6,... empty=D4
+    Поля разделяются пробелами или ';'. Размеры — положительные целые,
+    списки pegs и empty не пустые.
     
     Args:
         text: строка с описанием
@@ -22,18 +23,18 @@ def parse_input(text: str) -> List[List[str]]:
     Returns:
         Игровое поле в матричном представлении
     """
-    size_match = re.search(r'size=(\d+)x(\d+)', text)
-    pegs_match = re.search(r'pegs=([\w,]+)', text)
-    empty_match = re.search(r'empty=([\w,]+)', text)
-    
-    if not size_match or not pegs_match or not empty_match:
+    # Пары key=value — один проход split() вместо трёх regex
+    fields = dict(token.partition('=')[::2] for token in text.replace(';', ' ').split())
+    try:
+        rows, cols = map(int, fields['size'].split('x'))
+        pegs = fields['pegs'].split(',')
+        empty = fields['empty'].split(',')
+        if rows <= 0 or cols <= 0 or not fields['pegs'] or not fields['empty']:
+            raise ValueError
+    except (KeyError, ValueError):
         raise ValueError(
             "Неверный формат. Ожидается: size=NxM pegs=A1,A2,... empty=D4"
-        )
-    
-    rows, cols = int(size_match.group(1)), int(size_match.group(2))
-    pegs = pegs_match.group(1).split(',')
-    empty = empty_match.group(1).split(',')
+        ) from None
     
     board = [[EMPTY for _ in range(cols)] for _ in range(rows)]
     
@@ -58,30 +59,28 @@ def parse_input(text: str) -> List[List[str]]:
     return board
 
 
-def create_english_board() -> List[List[str]]:
+def _english_template() -> tuple:
+    """Английская доска 7x7 без пустой клетки: кортеж строк (неизменяемый)."""
+    return tuple(
+        tuple(PEG if 2 <= r <= 4 or 2 <= c <= 4 else EMPTY for c in range(7))
+        for r in range(7)
+    )
+
+
+_ENGLISH_TEMPLATE = _english_template()
+
+
+def create_english_board(hole: Tuple[int, int] = (3, 3)) -> List[List[str]]:
     """
-    Создаёт стандартную английскую доску 7x7 с пустым центром.
+    Создаёт стандартную английскую доску 7x7 с пустой клеткой hole
+    (по умолчанию — центр). Копия готового шаблона.
+
+    Raises:
+        ValueError: hole вне креста английской доски
     """
-    mask = [
-        [0, 0, 1, 1, 1, 0, 0],
-        [0, 0, 1, 1, 1, 0, 0],
-        [1, 1, 1, 1, 1, 1, 1],
-        [1, 1, 1, 1, 1, 1, 1],
-        [1, 1, 1, 1, 1, 1, 1],
-        [0, 0, 1, 1, 1, 0, 0],
-        [0, 0, 1, 1, 1, 0, 0],
-    ]
-    
-    board = []
-    for r in range(7):
-        row = []
-        for c in range(7):
-            if mask[r][c] == 0:
-                row.append(EMPTY)
-            elif r == 3 and c == 3:
-                row.append(HOLE)
-            else:
-                row.append(PEG)
-        board.append(row)
-    
+    r, c = hole
+    if not (0 <= r < 7 and 0 <= c < 7) or _ENGLISH_TEMPLATE[r][c] != PEG:
+        raise ValueError(f"Клетка {hole} не на английской доске")
+    board = [list(row) for row in _ENGLISH_TEMPLATE]
+    board[r][c] = HOLE
     return board
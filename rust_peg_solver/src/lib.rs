@@ -7,7 +7,10 @@
  * Использование SIMD инструкций и оптимизаций компилятора Rust.
  */
 
+use numpy::{IntoPyArray, PyArray1, PyReadonlyArray1};
+use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
+use rayon::prelude::*;
 
 // Валидные позиции английской доски (33 позиции)
 const VALID_POSITIONS: [u8; 33] = [
@@ -20,12 +23,79 @@ const VALID_POSITIONS: [u8; 33] = [
 
 const VALID_MASK: u64 = 0b0000000_0000000_1111111_1111111_1111111_1111111_1111111_0000111_0000111_0000000_0000111;
 
+// Веса Pagoda в порядке VALID_POSITIONS
+const PAGODA_WEIGHTS: [u8; 33] = [
+    1, 2, 1,  // 2, 3, 4
+    2, 4, 2,  // 9, 10, 11
+    1, 2, 3, 4, 3, 2, 1,  // 14-20
+    2, 4, 4, 6, 4, 4, 2,  // 21-27
+    1, 2, 3, 4, 3, 2, 1,  // 28-34
+    2, 4, 2,  // 37, 38, 39
+    1, 2, 1,  // 44, 45, 46
+];
+
+// Маски клеток по расстоянию до центра: DISTANCE_MASKS[d] — клетки с |dr| + |dc| = d
+const DISTANCE_MASKS: [u64; 5] = distance_masks();
+
+// Маски клеток по весу Pagoda: PAGODA_MASKS[w] — клетки с весом w
+const PAGODA_MASKS: [u64; 7] = pagoda_masks();
+
+const fn distance_masks() -> [u64; 5] {
+    let mut masks = [0u64; 5];
+    let mut i = 0;
+    while i < VALID_POSITIONS.len() {
+        let pos = VALID_POSITIONS[i];
+        let d = (pos as i32 / 7 - 3).abs() + (pos as i32 % 7 - 3).abs();
+        masks[d as usize] |= 1u64 << pos;
+        i += 1;
+    }
+    masks
+}
+
+const fn pagoda_masks() -> [u64; 7] {
+    let mut masks = [0u64; 7];
+    let mut i = 0;
+    while i < VALID_POSITIONS.len() {
+        masks[PAGODA_WEIGHTS[i] as usize] |= 1u64 << VALID_POSITIONS[i];
+        i += 1;
+    }
+    masks
+}
+
 // Быстрый popcount используя встроенную функцию CPU
 #[inline(always)]
 fn popcount64(x: u64) -> u32 {
     x.count_ones()
 }
 
+/// Сумма весов колышков: sum(w * popcount(pegs & masks[w])).
+/// Без ветвлений — в пакетной оценке LLVM векторизует popcount.
+#[inline(always)]
+fn weighted_popcount(pegs: u64, masks: &[u64]) -> u32 {
+    let mut total = 0u32;
+    for (weight, &mask) in masks.iter().enumerate() {
+        total += weight as u32 * popcount64(pegs & mask);
+    }
+    total
+}
+
+/// Оценка позиции (общая для одиночного и пакетного вызова)
+#[inline(always)]
+fn evaluate(pegs: u64, num_moves: f64) -> f64 {
+    let peg_count = popcount64(pegs);
+    let distance_sum = weighted_popcount(pegs, &DISTANCE_MASKS);
+
+    let mut score = peg_count as f64 * 10.0 + distance_sum as f64;
+    score -= num_moves * 2.0;
+
+    // Pagoda проверка: CENTER_POS = 24, weight = 6
+    if peg_count > 15 && weighted_popcount(pegs, &PAGODA_MASKS) < 6 {
+        score += 1000.0;
+    }
+
+    score
+}
+
 /// Подсчёт колышков — O(1) через popcount
 #[pyfunction]
 fn rust_peg_count(pegs: u64) -> PyResult<u32> {
@@ -126,69 +196,39 @@ fn rust_is_dead(pegs: u64) -> PyResult<bool> {
 /// Pagoda функция (быстрая Rust версия)
 #[pyfunction]
 fn rust_pagoda_value(pegs: u64) -> PyResult<u32> {
-    let weights: [u32; 33] = [
-        1, 2, 1,  // 2, 3, 4
-        2, 4, 2,  // 9, 10, 11
-        1, 2, 3, 4, 3, 2, 1,  // 14-20
-        2, 4, 4, 6, 4, 4, 2,  // 21-27
-        1, 2, 3, 4, 3, 2, 1,  // 28-34
-        2, 4, 2,  // 37, 38, 39
-        1, 2, 1,  // 44, 45, 46
-    ];
-    
-    let mut total = 0u32;
-    for (i, &pos) in VALID_POSITIONS.iter().enumerate() {
-        if (pegs >> pos) & 1 != 0 {
-            total += weights[i];
-        }
-    }
-    
-    Ok(total)
+    Ok(weighted_popcount(pegs, &PAGODA_MASKS))
 }
 
 /// Быстрая оценка позиции (Rust версия)
 #[pyfunction]
 fn rust_evaluate_position(pegs: u64, num_moves: usize) -> PyResult<f64> {
-    let peg_count = popcount64(pegs) as f64;
-    let mut distance_sum = 0u32;
-    let center_row = 3u8;
-    let center_col = 3u8;
-    
-    for &pos in &VALID_POSITIONS {
-        if (pegs >> pos) & 1 != 0 {
-            let r = pos / 7;
-            let c = pos % 7;
-            distance_sum += (r as i32 - center_row as i32).abs() as u32 +
-                           (c as i32 - center_col as i32).abs() as u32;
-        }
-    }
-    
-    let mut score = peg_count * 10.0 + distance_sum as f64;
-    score -= num_moves as f64 * 2.0;
-    
-    // Pagoda проверка
-    let pagoda_val = rust_pagoda_value(pegs).unwrap();
-    let target_pagoda = 6u32; // CENTER_POS = 24, weight = 6
-    
-    if peg_count > 15.0 {
-        if pagoda_val < target_pagoda {
-            score += 1000.0;
-        }
-    }
-    
-    Ok(score)
+    Ok(evaluate(pegs, num_moves as f64))
 }
 
 /// Batch оценка нескольких позиций (параллельная обработка)
+///
+/// Принимает непрерывные NumPy массивы (pegs: uint64, moves: int64) без
+/// копирования в Vec; позиции считаются параллельно (rayon) без GIL.
 #[pyfunction]
-fn rust_evaluate_batch(pegs_list: Vec<u64>, moves_list: Vec<usize>) -> PyResult<Vec<f64>> {
-    let mut results = Vec::with_capacity(pegs_list.len());
-    
-    for (pegs, &num_moves) in pegs_list.iter().zip(moves_list.iter()) {
-        results.push(rust_evaluate_position(*pegs, num_moves).unwrap());
+fn rust_evaluate_batch<'py>(
+    py: Python<'py>,
+    pegs: PyReadonlyArray1<'py, u64>,
+    moves: PyReadonlyArray1<'py, i64>,
+) -> PyResult<Bound<'py, PyArray1<f64>>> {
+    let pegs = pegs.as_slice()?;
+    let moves = moves.as_slice()?;
+    if pegs.len() != moves.len() {
+        return Err(PyValueError::new_err("pegs and moves must have the same length"));
     }
-    
-    Ok(results)
+
+    let results: Vec<f64> = py.allow_threads(|| {
+        pegs.par_iter()
+            .zip(moves.par_iter())
+            .map(|(&p, &m)| evaluate(p, m as f64))
+            .collect()
+    });
+
+    Ok(results.into_pyarray_bound(py))
 }
 
 #[pymodule]
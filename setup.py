@@ -21,6 +21,21 @@ extensions = [
         ["core/fast_bitboard.pyx"],
         extra_compile_args=["-O3", "-march=native"],
     ),
+    Extension(
+        "core.bitboard_c",
+        ["core/bitboard_c.pyx"],
+        extra_compile_args=["-O3", "-march=native"],
+    ),
+    Extension(
+        "core.zobrist_c",
+        ["core/zobrist_c.pyx"],
+        extra_compile_args=["-O3", "-march=native"],
+    ),
+    Extension(
+        "heuristics.pattern_db_c",
+        ["heuristics/pattern_db_c.pyx"],
+        extra_compile_args=["-O3", "-march=native"],
+    ),
 ]
 
 setup(
@@ -35,5 +50,6 @@ setup(
             "wraparound": False,
         }
     ),
+    python_requires=">=3.10",
     zip_safe=False,
 )
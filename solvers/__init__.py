@@ -3,6 +3,7 @@ solvers - Все решатели Peg Solitaire
 
 Экспортирует:
 - DFSSolver: поиск в глубину с мемоизацией
+- NumbaDFSSolver: DFS в скомпилированном Numba-ядре
 - AStarSolver: A* с эвристиками
 - IDAStarSolver: IDA* (экономия памяти)
 - BeamSolver: Beam Search (быстрый, неполный)
@@ -13,6 +14,7 @@ solvers - Все решатели Peg Solitaire
 
 from .dfs import DFSSolver
 from .zobrist_dfs import ZobristDFSSolver
+from .numba_dfs import NumbaDFSSolver
 from .astar import AStarSolver, IDAStarSolver
 from .beam import BeamSolver
 from .parallel import ParallelSolver
@@ -29,6 +31,7 @@ from .brute_force import BruteForceSolver
 __all__ = [
     'DFSSolver',
     'ZobristDFSSolver',
+    'NumbaDFSSolver',
     'AStarSolver', 
     'IDAStarSolver',
     'BeamSolver',
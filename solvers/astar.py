@@ -9,7 +9,7 @@ from heapq import heappush, heappop
 
 from .base import BaseSolver, SolverStats
 from core.bitboard import (
-    BitBoard, CENTER_POS,
+    BitBoard, CENTER_POS, ROW, COL,
     is_english_board, get_center_position
 )
 from heuristics import combined_heuristic, pagoda_value, PAGODA_WEIGHTS
@@ -160,11 +160,11 @@ class IDAStarSolver(BaseSolver):
         # Сортировка по расстоянию до центра
         center_pos = get_center_position(board)
         if center_pos is not None:
-            center_r, center_c = center_pos // 7, center_pos % 7
-            moves.sort(key=lambda m: abs(m[2] // 7 - center_r) + abs(m[2] % 7 - center_c))
+            center_r, center_c = ROW[center_pos], COL[center_pos]
+            moves.sort(key=lambda m: abs(ROW[m[2]] - center_r) + abs(COL[m[2]] - center_c))
         else:
             # Fallback: расстояние до центра доски (3, 3)
-            moves.sort(key=lambda m: abs(m[2] // 7 - 3) + abs(m[2] % 7 - 3))
+            moves.sort(key=lambda m: abs(ROW[m[2]] - 3) + abs(COL[m[2]] - 3))
         
         min_threshold = float('inf')
         for move in moves:
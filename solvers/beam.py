@@ -9,7 +9,7 @@ from typing import List, Tuple, Optional
 from .base import BaseSolver, SolverStats
 from core.bitboard import (
     BitBoard, ENGLISH_VALID_POSITIONS, CENTER_POS,
-    get_valid_positions, is_english_board, get_center_position
+    get_valid_positions, is_english_board, get_center_position, count_isolated_pegs
 )
 from heuristics import pagoda_value, PAGODA_WEIGHTS
 from .optimized_utils import evaluate_position_optimized
@@ -106,7 +106,7 @@ class BeamSolver(BaseSolver):
             center_r, center_c = center_pos // 7, center_pos % 7
             valid_positions = get_valid_positions(board)
             for pos in valid_positions:
-                if board.has_peg(pos):
+                if (board.pegs >> pos) & 1:
                     r, c = pos // 7, pos % 7
                     score += abs(r - center_r) + abs(c - center_c)
         
@@ -133,27 +133,5 @@ class BeamSolver(BaseSolver):
         return score
     
     def _count_isolated(self, board: BitBoard) -> int:
-        """Количество изолированных колышков (оптимизированная версия)."""
-        count = 0
-        pegs = board.pegs
-        valid_positions = get_valid_positions(board)
-        
-        # Предвычисляем соседей для каждой позиции
-        for pos in valid_positions:
-            if not (pegs & (1 << pos)):
-                continue
-            
-            r, c = pos // 7, pos % 7
-            # Проверяем соседей битовыми операциями
-            has_neighbor = False
-            for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                nr, nc = r + dr, c + dc
-                neighbor_pos = nr * 7 + nc
-                if neighbor_pos in valid_positions and (pegs & (1 << neighbor_pos)):
-                    has_neighbor = True
-                    break
-            
-            if not has_neighbor:
-                count += 1
-        
-        return count
+        """Количество изолированных колышков."""
+        return count_isolated_pegs(board)
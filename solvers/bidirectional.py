@@ -113,7 +113,7 @@ class BidirectionalSolver(BaseSolver):
             # Проверка встречи с обратным поиском
             if use_any_solved:
                 # Проверяем, является ли состояние решённым (1 колышек)
-                if new_board.is_solved():
+                if new_board.pegs.bit_count() == 1:
                     # Любое решение найдено - возвращаем путь
                     return new_path
                 # Также проверяем точное совпадение
@@ -136,14 +136,14 @@ class BidirectionalSolver(BaseSolver):
         current, path = queue.popleft()
         
         # Если use_any_solved и текущее состояние решено (1 колышек), останавливаемся
-        if use_any_solved and current.is_solved():
+        if use_any_solved and current.pegs.bit_count() == 1:
             return path  # Возвращаем путь до этого состояния
         
         # Генерируем обратные ходы
         # Используем valid_positions вместо ENGLISH_VALID_POSITIONS для произвольных досок
         valid_positions = get_valid_positions(current)
         for pos in valid_positions:
-            if not current.has_peg(pos):  # это hole
+            if not (current.pegs >> pos) & 1:  # это hole
                 for dr, dc in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
                     new_board = self._reverse_move(current, pos, dr, dc)
                     if new_board is None:
@@ -157,7 +157,7 @@ class BidirectionalSolver(BaseSolver):
                     # Проверка встречи с прямым поиском
                     if use_any_solved:
                         # Проверяем, является ли состояние решённым (1 колышек)
-                        if new_board.is_solved():
+                        if new_board.pegs.bit_count() == 1:
                             # Любое решение найдено - возвращаем путь
                             return new_path
                         # Также проверяем точное совпадение
@@ -186,7 +186,7 @@ class BidirectionalSolver(BaseSolver):
         if pos1 not in valid_positions or pos2 not in valid_positions or r not in valid_positions:
             return None
         
-        if board.has_peg(r) or board.has_peg(pos1) or not board.has_peg(pos2):
+        if (board.pegs >> r) & 1 or (board.pegs >> pos1) & 1 or not (board.pegs >> pos2) & 1:
             return None
         
         new_pegs = board.pegs
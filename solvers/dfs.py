@@ -5,13 +5,14 @@ DFS (Depth-First Search) с мемоизацией.
 Dynamic Programming подход.
 """
 
-from typing import List, Tuple, Optional, Set
+from typing import List, Tuple, Optional, Set, Union
 
 from .base import BaseSolver, SolverStats
 from core.bitboard import (
-    BitBoard, CENTER_POS,
+    BitBoard, CENTER_POS, ROW, COL,
     is_english_board, get_center_position
 )
+from core.visited_set import VisitedSet
 from heuristics import pagoda_value, PAGODA_WEIGHTS
 
 
@@ -24,14 +25,19 @@ class DFSSolver(BaseSolver):
     - Сортирует ходы по эвристике
     - Использует Pagoda pruning
     - Учитывает симметрии
+    - compact_memo=True: мемо в массиве uint64 (VisitedSet) — в разы
+      меньше памяти, чем set, ценой более медленного поиска в нём
     """
     
     def __init__(self, use_symmetry: bool = True, sort_moves: bool = True,
-                 use_pagoda: bool = True, verbose: bool = False):
+                 use_pagoda: bool = True, verbose: bool = False,
+                 compact_memo: bool = False):
         super().__init__(use_symmetry, verbose)
         self.sort_moves = sort_moves
         self.use_pagoda = use_pagoda
-        self.memo: Set[int] = set()
+        self.memo: Union[Set[int], VisitedSet] = VisitedSet() if compact_memo else set()
+        # Буферы ходов по глубинам (без сортировки список не копируется)
+        self._move_buffers: List[List[Tuple[int, int, int]]] = []
     
     def solve(self, board: BitBoard) -> Optional[List[Tuple[int, int, int]]]:
         """Запускает DFS с мемоизацией."""
@@ -80,7 +86,14 @@ class DFSSolver(BaseSolver):
                     return None
         
         # Получаем ходы
-        moves = board.get_moves()
+        if self.sort_moves:
+            moves = board.get_moves()
+        else:
+            depth = len(path)
+            if depth == len(self._move_buffers):
+                self._move_buffers.append([])
+            moves = self._move_buffers[depth]
+            board.fill_moves(moves)
         if not moves:
             self.memo.add(key)
             return None
@@ -106,10 +119,10 @@ class DFSSolver(BaseSolver):
         
         def priority(move):
             _, jumped, to_pos = move
-            to_r, to_c = to_pos // 7, to_pos % 7
+            to_r, to_c = ROW[to_pos], COL[to_pos]
             
             if center_pos is not None:
-                center_r, center_c = center_pos // 7, center_pos % 7
+                center_r, center_c = ROW[center_pos], COL[center_pos]
                 center_dist = abs(to_r - center_r) + abs(to_c - center_c)
             else:
                 # Если нет центра, используем расстояние до центра доски (3, 3)
@@ -18,8 +18,8 @@ from .lookup import LookupSolver
 from .parallel_beam import ParallelBeamSolver
 from .parallel import ParallelSolver
 from core.bitboard import (
-    BitBoard, CENTER_POS,
-    get_valid_positions, get_center_position
+    BitBoard, CENTER_POS, ROW, COL,
+    get_center_position
 )
 from heuristics import pagoda_value, PAGODA_WEIGHTS
 
@@ -145,13 +145,13 @@ class GovernorSolver(BaseSolver):
             center_r, center_c = center_pos // 7, center_pos % 7
         
         total_dist = 0
-        # Используем валидные позиции доски
-        valid_positions = get_valid_positions(board)
-        for pos in valid_positions:
-            if board.has_peg(pos):
-                row, col = pos // 7, pos % 7
-                dist = abs(row - center_r) + abs(col - center_c)
-                total_dist += dist
+        # Обходим только колышки на валидных клетках доски
+        pegs = board.pegs & board.valid_mask
+        while pegs:
+            lsb = pegs & -pegs
+            pos = lsb.bit_length() - 1
+            total_dist += abs(ROW[pos] - center_r) + abs(COL[pos] - center_c)
+            pegs ^= lsb
         
         return total_dist / peg_count if peg_count > 0 else 0.0
     
@@ -0,0 +1,60 @@
+"""
+solvers/numba_dfs.py
+
+DFS решатель, полностью работающий в Numba-ядре (core/bitboard_nb.py).
+Весь поиск идёт без Python-объектов; если Numba недоступна —
+используется обычный DFSSolver.
+"""
+
+from typing import List, Tuple, Optional
+
+from .base import BaseSolver, SolverStats
+from .dfs import DFSSolver
+from core.bitboard import BitBoard
+from core.bitboard_nb import NUMBA_AVAILABLE
+
+if NUMBA_AVAILABLE:
+    from core.bitboard_nb import dfs_solve_nb
+
+
+class NumbaDFSSolver(BaseSolver):
+    """
+    DFS с мемоизацией неудачных состояний в скомпилированном ядре.
+
+    Особенности:
+    - Итеративный DFS на int64 без создания BitBoard на каждый узел
+    - Мемо — numba.typed.Dict по (канонической) маске
+    - Без сортировки ходов и Pagoda pruning (порядок ходов как в get_moves)
+    """
+    
+    def __init__(self, use_symmetry: bool = True, verbose: bool = False):
+        super().__init__(use_symmetry, verbose)
+    
+    def solve(self, board: BitBoard) -> Optional[List[Tuple[int, int, int]]]:
+        self.stats = SolverStats()
+        
+        if not NUMBA_AVAILABLE:
+            self._log("Numba not available, falling back to DFS")
+            fallback = DFSSolver(use_symmetry=self.use_symmetry, sort_moves=False,
+                                 use_pagoda=False, verbose=self.verbose)
+            result = fallback.solve(board)
+            self.stats = fallback.stats
+            return result
+        
+        self._log(f"Starting Numba DFS (pegs={board.peg_count()})")
+        
+        if board.peg_count() == 1:
+            return []
+        
+        path, nodes = dfs_solve_nb(board.pegs, board.valid_mask, self.use_symmetry)
+        self.stats.nodes_visited = int(nodes)
+        
+        if len(path) == 0:
+            self._log(f"No solution. {self.stats}")
+            return None
+        
+        result = [(int(f), int(j), int(t)) for f, j, t in path]
+        self.stats.solution_length = len(result)
+        self.stats.max_depth = len(result)
+        self._log(f"Found! {self.stats}")
+        return result
@@ -8,7 +8,7 @@ solvers/optimized_utils.py
 from typing import TYPE_CHECKING
 from core.bitboard import (
     BitBoard, ENGLISH_VALID_POSITIONS, CENTER_POS,
-    get_valid_positions, is_english_board, get_center_position
+    get_valid_positions, is_english_board, get_center_position, count_isolated_pegs
 )
 
 if TYPE_CHECKING:
@@ -27,6 +27,15 @@ except ImportError:
     NUMBA_AVAILABLE = False
     evaluate_position_fast = None
 
+# Реализация выбирается один раз при импорте: в горячем пути нет
+# проверок флагов и try/except. Ошибки Rust/Numba не маскируются.
+if RUST_AVAILABLE:
+    _evaluate_impl = rust_evaluate_position
+elif NUMBA_AVAILABLE:
+    _evaluate_impl = evaluate_position_fast
+else:
+    _evaluate_impl = None
+
 
 def evaluate_position_optimized(board: BitBoard, num_moves: int = None) -> float:
     """
@@ -46,22 +55,8 @@ def evaluate_position_optimized(board: BitBoard, num_moves: int = None) -> float
     """
     if num_moves is None:
         num_moves = len(board.get_moves())
-    
-    # Попытка использовать Rust версию
-    if RUST_AVAILABLE and rust_evaluate_position:
-        try:
-            return rust_evaluate_position(board.pegs, num_moves)
-        except Exception:
-            pass  # Fallback на другие версии
-    
-    # Попытка использовать Numba версию
-    if NUMBA_AVAILABLE and evaluate_position_fast:
-        try:
-            return evaluate_position_fast(board.pegs, num_moves)
-        except Exception:
-            pass  # Fallback на Python
-    
-    # Fallback на Python версию
+    if _evaluate_impl is not None:
+        return _evaluate_impl(board.pegs, num_moves)
     return _evaluate_position_python(board, num_moves)
 
 
@@ -75,7 +70,7 @@ def _evaluate_position_python(board: BitBoard, num_moves: int) -> float:
         center_r, center_c = center_pos // 7, center_pos % 7
         valid_positions = get_valid_positions(board)
         for pos in valid_positions:
-            if board.has_peg(pos):
+            if (board.pegs >> pos) & 1:
                 r, c = pos // 7, pos % 7
                 score += abs(r - center_r) + abs(c - center_c)
     
@@ -83,7 +78,7 @@ def _evaluate_position_python(board: BitBoard, num_moves: int) -> float:
     score -= num_moves * 2
     
     # Изолированные колышки
-    score += _count_isolated_python(board) * 15
+    score += count_isolated_pegs(board) * 15
     
     # Pagoda проверка (только для английской доски)
     if is_english_board(board):
@@ -103,32 +98,6 @@ def _evaluate_position_python(board: BitBoard, num_moves: int) -> float:
     return score
 
 
-def _count_isolated_python(board: BitBoard) -> int:
-    """Подсчёт изолированных колышков (Python версия, оптимизированная)."""
-    count = 0
-    pegs = board.pegs
-    valid_positions = get_valid_positions(board)
-    
-    for pos in valid_positions:
-        if not (pegs & (1 << pos)):
-            continue
-        
-        r, c = pos // 7, pos % 7
-        # Проверяем соседей битовыми операциями
-        has_neighbor = False
-        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            nr, nc = r + dr, c + dc
-            neighbor_pos = nr * 7 + nc
-            if neighbor_pos in valid_positions and (pegs & (1 << neighbor_pos)):
-                has_neighbor = True
-                break
-        
-        if not has_neighbor:
-            count += 1
-    
-    return count
-
-
 def get_optimization_info() -> str:
     """Возвращает информацию о доступных оптимизациях."""
     parts = []
@@ -11,7 +11,7 @@ import multiprocessing
 from .base import BaseSolver, SolverStats
 from core.bitboard import (
     BitBoard, ENGLISH_VALID_POSITIONS, CENTER_POS,
-    get_valid_positions, is_english_board, get_center_position
+    get_valid_positions, is_english_board, get_center_position, count_isolated_pegs
 )
 from heuristics import pagoda_value, PAGODA_WEIGHTS
 from .optimized_utils import evaluate_position_optimized
@@ -45,7 +45,7 @@ def _evaluate_board(state_data: Tuple[int, List]) -> Tuple[float, int, List]:
             center_r, center_c = center_pos // 7, center_pos % 7
             valid_positions = get_valid_positions(board)
             for pos in valid_positions:
-                if board.has_peg(pos):
+                if (board.pegs >> pos) & 1:
                     r, c = pos // 7, pos % 7
                     score += abs(r - center_r) + abs(c - center_c)
         
@@ -167,17 +167,4 @@ class ParallelBeamSolver(BaseSolver):
     
     def _count_isolated(self, board: BitBoard) -> int:
         """Количество изолированных колышков."""
-        count = 0
-        valid_positions = get_valid_positions(board)
-        for pos in valid_positions:
-            if not board.has_peg(pos):
-                continue
-            r, c = pos // 7, pos % 7
-            has_neighbor = any(
-                board.has_peg(nr * 7 + nc)
-                for nr, nc in [(r-1, c), (r+1, c), (r, c-1), (r, c+1)]
-                if (nr * 7 + nc) in valid_positions
-            )
-            if not has_neighbor:
-                count += 1
-        return count
+        return count_isolated_pegs(board)
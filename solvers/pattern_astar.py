@@ -12,7 +12,7 @@ from core.bitboard import (
     BitBoard, CENTER_POS,
     is_english_board
 )
-from heuristics import pattern_heuristic, pagoda_value, PAGODA_WEIGHTS
+from heuristics import combined_pattern_heuristic, pagoda_value, PAGODA_WEIGHTS
 
 
 class PatternAStarSolver(BaseSolver):
@@ -33,7 +33,7 @@ class PatternAStarSolver(BaseSolver):
         
         # Загружаем Pattern DB
         from heuristics import get_pattern_db
-        db = get_pattern_db()
+        get_pattern_db()
         
         # Pagoda check (только для английской доски)
         if is_english_board(board):
@@ -46,8 +46,8 @@ class PatternAStarSolver(BaseSolver):
         visited: Dict[int, Tuple[int, int, Tuple]] = {}
         
         start_key = self._get_key(board)
-        h = self._heuristic(board.pegs, db)
-        heappush(heap, (h, counter, 0, board))
+        f = combined_pattern_heuristic(start_key, 0, board.peg_count())
+        heappush(heap, (f, counter, 0, board))
         visited[start_key] = (0, None, None)
         
         while heap:
@@ -66,6 +66,8 @@ class PatternAStarSolver(BaseSolver):
                 continue
             
             current_key = self._get_key(current)
+            # Каждый ход снимает ровно один колышек
+            child_count = current.peg_count() - 1
             
             for move in current.get_moves():
                 new_board = current.apply_move(*move)
@@ -76,31 +78,15 @@ class PatternAStarSolver(BaseSolver):
                     continue
                 
                 visited[new_key] = (new_steps, current_key, move)
-                h = self._heuristic(new_board.pegs, get_pattern_db())
-                f = new_steps + h
+                # Эвристика инвариантна к симметриям доски: считаем её по
+                # каноническому ключу — симметричные позиции делят кэш
+                f = combined_pattern_heuristic(new_key, new_steps, child_count)
                 counter += 1
                 heappush(heap, (f, counter, new_steps, new_board))
         
         self._log(f"No solution. {self.stats}")
         return None
     
-    def _heuristic(self, pegs: int, db) -> int:
-        """Комбинированная эвристика."""
-        # Используем быстрый popcount
-        import sys
-        if sys.version_info >= (3, 10):
-            peg_count = pegs.bit_count()
-        else:
-            x = pegs
-            x = x - ((x >> 1) & 0x5555555555555555)
-            x = (x & 0x3333333333333333) + ((x >> 2) & 0x3333333333333333)
-            x = (x + (x >> 4)) & 0x0F0F0F0F0F0F0F0F
-            peg_count = ((x * 0x0101010101010101) >> 56) & 0xFF
-        
-        base_h = peg_count - 1
-        pattern_h = db.get_heuristic(pegs)
-        return max(base_h, pattern_h)
-    
     def _reconstruct_path(self, visited: Dict, end: BitBoard, start_key: int) -> List:
         path = []
         key = self._get_key(end)
@@ -8,12 +8,28 @@ DFS решатель с Zobrist хешированием.
 from typing import List, Tuple, Optional, Set
 
 from .base import BaseSolver, SolverStats
-from core.zobrist import ZobristBitBoard
+from core.fast import ZobristBitBoard
+from core.zobrist import (
+    ZobristBitBoard as _PyZobristBitBoard,
+    compute_zobrist_hash, MOVE_PEGS_XOR, MOVE_HASH_XOR
+)
 from core.bitboard import (
-    CENTER_POS,
-    is_english_board, get_center_position
+    CENTER_POS, ROW, COL, ENGLISH_MOVES,
+    is_english_board, _fill_move_ids_english
+)
+from heuristics.pagoda import (
+    PAGODA_WEIGHTS, _MASK_W1, _MASK_W2, _MASK_W3, _MASK_W4, _MASK_W6
 )
-from heuristics.pagoda import pagoda_value, PAGODA_WEIGHTS
+
+
+def _move_priority(move: Tuple[int, int, int]) -> int:
+    """Приоритет хода: расстояние клетки назначения до центра (3, 3)."""
+    to_pos = move[2]
+    return abs(ROW[to_pos] - 3) + abs(COL[to_pos] - 3)
+
+
+# Приоритет по номеру хода (ENGLISH_MOVES) — сортировка без разбора кортежей
+_MOVE_ID_PRIORITY = tuple(_move_priority(move) for move in ENGLISH_MOVES)
 
 
 class ZobristDFSSolver(BaseSolver):
@@ -32,81 +48,89 @@ class ZobristDFSSolver(BaseSolver):
         self.sort_moves = sort_moves
         self.use_pagoda = use_pagoda
         self.visited: Set[int] = set()
+        # Порог pagoda для текущего solve(); None — отсечение выключено
+        self._pagoda_target: Optional[int] = None
     
     def solve(self, board) -> Optional[List[Tuple[int, int, int]]]:
         """Запускает DFS с Zobrist хешированием."""
-        # Конвертируем в ZobristBitBoard если нужно
-        if not isinstance(board, ZobristBitBoard):
+        # ZobristBitBoard — только на границе API: поиск идёт по (pegs, hash, count)
+        if isinstance(board, (ZobristBitBoard, _PyZobristBitBoard)):
+            pegs, h = board.pegs, board.zobrist_hash
+            english = True
+        else:
             from core.bitboard import BitBoard
-            if isinstance(board, BitBoard):
-                zboard = ZobristBitBoard(board.pegs)
-            else:
+            if not isinstance(board, BitBoard):
                 raise TypeError("Expected BitBoard or ZobristBitBoard")
-        else:
-            zboard = board
+            pegs = board.pegs
+            h = compute_zobrist_hash(pegs)
+            english = is_english_board(board)
+        count = pegs.bit_count()
         
         self.stats = SolverStats()
         self.visited.clear()
+        # Pagoda — только для английской доски; решается один раз на solve()
+        self._pagoda_target = (
+            PAGODA_WEIGHTS[CENTER_POS] if self.use_pagoda and english else None
+        )
         
-        self._log(f"Starting Zobrist DFS (pegs={zboard.peg_count()})")
+        self._log(f"Starting Zobrist DFS (pegs={count})")
         
-        result = self._dfs(zboard, [])
+        result = self._dfs(pegs, h, count, [])
         
         self._log(f"Done: {self.stats}")
         return result
     
-    def _dfs(self, board: ZobristBitBoard, path: List) -> Optional[List]:
+    def _dfs(self, pegs: int, h: int, count: int, path: List) -> Optional[List]:
+        """
+        Узел поиска — голые int: pegs, Zobrist хеш и число колышков.
+        Без объекта доски на каждый узел; visited хранит только хеш.
+        """
         self.stats.nodes_visited += 1
         self.stats.max_depth = max(self.stats.max_depth, len(path))
         
         # Победа
-        if board.peg_count() == 1:
+        if count == 1:
             self.stats.solution_length = len(path)
             return path
         
-        # Zobrist хеш — уже вычислен, просто берём
-        h = board.zobrist_hash
+        # Zobrist хеш — уже вычислен инкрементально
         if h in self.visited:
             self.stats.nodes_pruned += 1
             return None
         self.visited.add(h)
         
-        # Pagoda pruning (только для английской доски)
-        if self.use_pagoda:
-            from core.bitboard import BitBoard
-            temp_board = BitBoard(board.pegs)
-            if is_english_board(temp_board):
-                if pagoda_value(temp_board) < PAGODA_WEIGHTS[CENTER_POS]:
-                    self.stats.nodes_pruned += 1
-                    return None
+        # Pagoda pruning: та же сумма, что pagoda_value, но прямо по pegs
+        if self._pagoda_target is not None:
+            pagoda = (
+                (pegs & _MASK_W1).bit_count()
+                + 2 * (pegs & _MASK_W2).bit_count()
+                + 3 * (pegs & _MASK_W3).bit_count()
+                + 4 * (pegs & _MASK_W4).bit_count()
+                + 6 * (pegs & _MASK_W6).bit_count()
+            )
+            if pagoda < self._pagoda_target:
+                self.stats.nodes_pruned += 1
+                return None
         
-        # Получаем ходы
-        moves = board.get_moves()
-        if not moves:
+        # Получаем ходы (номера ходов: маски pegs и хеша — по индексу)
+        move_ids: List[int] = []
+        _fill_move_ids_english(pegs, move_ids)
+        if not move_ids:
             return None
         
         # Сортируем по эвристике
         if self.sort_moves:
-            moves = self._sort_moves(moves)
+            move_ids.sort(key=_MOVE_ID_PRIORITY.__getitem__)
         
-        # Рекурсивный поиск
-        for move in moves:
-            # apply_move возвращает новый ZobristBitBoard с уже вычисленным хешом!
-            new_board = board.apply_move(*move)
-            result = self._dfs(new_board, path + [move])
+        # Рекурсивный поиск: ход — две XOR с готовыми масками
+        for move_id in move_ids:
+            result = self._dfs(
+                pegs ^ MOVE_PEGS_XOR[move_id],
+                h ^ MOVE_HASH_XOR[move_id],
+                count - 1,
+                path + [ENGLISH_MOVES[move_id]]
+            )
             if result is not None:
                 return result
         
         return None
-    
-    def _sort_moves(self, moves: List) -> List:
-        """Сортирует ходы: ближе к центру = лучше."""
-        # Для определения центра нужна доска, но у нас только moves
-        # Используем центр доски (3, 3) как fallback
-        def priority(move):
-            _, jumped, to_pos = move
-            to_r, to_c = to_pos // 7, to_pos % 7
-            # Используем центр доски (3, 3) как приближение
-            return abs(to_r - 3) + abs(to_c - 3)
-        
-        return sorted(moves, key=priority)
@@ -12,7 +12,9 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from typing import List, Tuple
 import pytest
 
-from core.bitboard import BitBoard, get_valid_positions, is_english_board, get_center_position
+from core.bitboard import (
+    BitBoard, get_valid_positions, is_english_board, get_center_position, count_isolated_pegs
+)
 from solutions.verify import verify_bitboard_solution
 from solvers import (
     DFSSolver, AStarSolver, IDAStarSolver, BeamSolver,
@@ -169,6 +171,18 @@ def test_get_center_position():
     assert center == 3 * 7 + 3  # Центр плюса
 
 
+def test_count_isolated_pegs():
+    """Соседство только внутри доски и без переноса строки."""
+    plus_board = make_plus_board()
+    assert count_isolated_pegs(plus_board) == 4  # центр — дырка
+    
+    # (0, 6) и (1, 0) — соседние биты, но не соседние клетки
+    full = (1 << 49) - 1
+    assert count_isolated_pegs(BitBoard((1 << 6) | (1 << 7), valid_mask=full)) == 2
+    # Колышек вне valid_mask не считается соседом
+    assert count_isolated_pegs(BitBoard((1 << 8) | (1 << 9), valid_mask=1 << 8)) == 1
+
+
 # =====================================================
 # Тесты решателей на произвольных досках
 # =====================================================
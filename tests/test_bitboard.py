@@ -0,0 +1,145 @@
+"""
+tests/test_bitboard.py
+
+Тесты битового представления доски:
+- генерация ходов сверяется с наивной реализацией по координатам
+- симметрии английской доски
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from typing import List, Tuple
+
+from core.bitboard import BitBoard, VALID_MASK, ENGLISH_VALID_POSITIONS
+
+
+def _reference_moves(pegs: int, valid_mask: int) -> List[Tuple[int, int, int]]:
+    """Наивная генерация ходов по координатам (эталон)."""
+    moves = []
+    for pos in range(49):
+        if not (pegs >> pos) & 1:
+            continue
+        r, c = divmod(pos, 7)
+        for dr, dc in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
+            r1, c1, r2, c2 = r + dr, c + dc, r + 2 * dr, c + 2 * dc
+            if not (0 <= r2 < 7 and 0 <= c2 < 7):
+                continue
+            jumped, to = r1 * 7 + c1, r2 * 7 + c2
+            if not ((valid_mask >> jumped) & 1 and (valid_mask >> to) & 1):
+                continue
+            if (pegs >> jumped) & 1 and not (pegs >> to) & 1:
+                moves.append((pos, jumped, to))
+    return moves
+
+
+def _random_pegs(rng: random.Random, valid_mask: int) -> int:
+    return rng.getrandbits(49) & valid_mask
+
+
+def test_valid_mask_literal():
+    assert VALID_MASK == sum(1 << pos for pos in ENGLISH_VALID_POSITIONS)
+
+
+def test_get_moves_english_matches_reference():
+    """Ходы на английской доске совпадают с эталоном (включая порядок)."""
+    rng = random.Random(1)
+    for _ in range(2000):
+        pegs = _random_pegs(rng, VALID_MASK)
+        board = BitBoard(pegs, valid_mask=VALID_MASK)
+        assert board.get_moves() == _reference_moves(pegs, VALID_MASK)
+
+
+def test_english_start_moves():
+    """Из стартовой позиции ровно 4 хода — все в центр."""
+    moves = BitBoard.english_start().get_moves()
+    assert len(moves) == 4
+    assert all(to == 24 for _, _, to in moves)
+
+
+def test_canonical_is_symmetry_invariant():
+    """Все 8 симметрий позиции имеют одну каноническую форму."""
+    rng = random.Random(2)
+    for _ in range(200):
+        board = BitBoard(_random_pegs(rng, VALID_MASK), valid_mask=VALID_MASK)
+        canonical = board.canonical().pegs
+        variant = board
+        for _ in range(4):
+            variant = variant._rotate_90()
+            assert variant.canonical().pegs == canonical
+            assert variant._flip_h().canonical().pegs == canonical
+        assert canonical <= board.pegs
+        assert bin(canonical).count('1') == board.peg_count()
+
+
+def test_symmetric_boards_share_hash():
+    """Симметричные английские позиции равны; отключаемо флагом."""
+    board = BitBoard.english_start().apply_move(10, 17, 24)
+    rotated = board._rotate_90()
+    assert rotated.pegs != board.pegs
+    assert rotated == board and hash(rotated) == hash(board)
+    assert len({board, rotated, board._flip_h()}) == 1
+    # Порядок согласован с равенством
+    assert not (rotated < board) and not (board < rotated)
+
+    BitBoard.USE_SYMMETRY_HASH = False
+    try:
+        assert rotated != board
+        assert hash(board) == board.pegs
+        assert (rotated < board) == (rotated.pegs < board.pegs)
+    finally:
+        BitBoard.USE_SYMMETRY_HASH = True
+
+
+def test_is_dead_english_matches_get_moves():
+    """is_dead согласован с get_moves (без ложных ходов через край строки)."""
+    rng = random.Random(3)
+    for _ in range(2000):
+        pegs = _random_pegs(rng, VALID_MASK)
+        board = BitBoard(pegs, valid_mask=VALID_MASK)
+        expected = board.peg_count() > 1 and not _reference_moves(pegs, VALID_MASK)
+        assert board.is_dead() == expected
+
+
+def test_get_moves_arbitrary_board_matches_reference():
+    """Произвольная доска 7x7 (случайный valid_mask) — ходы и тупики совпадают с эталоном."""
+    rng = random.Random(4)
+    for _ in range(2000):
+        valid_mask = rng.getrandbits(49)
+        pegs = _random_pegs(rng, valid_mask)
+        board = BitBoard(pegs, valid_mask=valid_mask)
+        expected = _reference_moves(pegs, valid_mask)
+        assert board.count_moves() == len(expected)
+        assert board.get_moves() == expected
+        assert board.is_dead() == (board.peg_count() > 1 and not expected)
+
+
+def test_fill_moves_reuses_buffer():
+    """fill_moves очищает буфер и даёт те же ходы, что get_moves."""
+    board = BitBoard.english_start()
+    buf = [(0, 0, 0)] * 10
+    assert board.fill_moves(buf) == 4
+    assert buf == board.get_moves()
+
+
+def test_fast_fallback_matches_bitboard():
+    """fast_get_moves / fast_is_dead (Python fallback) согласованы с BitBoard."""
+    from core.fast_bitboard_py import fast_get_moves, fast_is_dead
+    rng = random.Random(6)
+    for _ in range(500):
+        pegs = _random_pegs(rng, VALID_MASK)
+        board = BitBoard(pegs, valid_mask=VALID_MASK)
+        assert fast_get_moves(pegs) == board.get_moves()
+        assert fast_is_dead(pegs) == board.is_dead()
+
+
+def test_cached_moves_are_copied():
+    """Кэш ходов не портится, если вызывающий меняет список."""
+    board = BitBoard.english_start().apply_move(10, 17, 24)
+    first = board.get_moves()
+    first.reverse()
+    first.pop()
+    assert board.get_moves() == BitBoard(board.pegs).get_moves()
+    assert board.is_dead() is False
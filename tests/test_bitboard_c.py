@@ -0,0 +1,46 @@
+"""
+tests/test_bitboard_c.py
+
+Тесты Cython BitBoard (core/bitboard_c.pyx): сверка с чистым Python.
+Пропускаются, если расширение не собрано (python setup.py build_ext --inplace).
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pickle
+import random
+import pytest
+
+bitboard_c = pytest.importorskip("core.bitboard_c")
+
+from core.bitboard import BitBoard, ENGLISH_VALID_POSITIONS
+
+
+def test_matches_python_bitboard():
+    """Ходы, тупики, симметрии и хеш совпадают с core.bitboard.BitBoard."""
+    rng = random.Random(0)
+    for _ in range(2000):
+        if rng.random() < 0.5:
+            valid_mask = None
+            pegs = sum(1 << p for p in ENGLISH_VALID_POSITIONS if rng.random() < 0.6)
+        else:
+            valid_mask = rng.getrandbits(49)
+            pegs = rng.getrandbits(49) & valid_mask
+        py_board = BitBoard(pegs, valid_mask)
+        c_board = bitboard_c.BitBoard(pegs, valid_mask)
+        assert c_board.valid_mask == py_board.valid_mask
+        assert c_board.get_moves() == py_board.get_moves()
+        assert c_board.count_moves() == py_board.count_moves()
+        assert c_board.is_dead() == py_board.is_dead()
+        assert c_board.canonical().pegs == py_board.canonical().pegs
+        assert hash(c_board) == hash(py_board)
+        for move in py_board.get_moves():
+            assert c_board.apply_move(*move).pegs == py_board.apply_move(*move).pegs
+
+
+def test_pickle_and_goal():
+    board = bitboard_c.BitBoard.english_start()
+    assert pickle.loads(pickle.dumps(board)) == board
+    assert bitboard_c.BitBoard.english_goal().is_goal()
@@ -0,0 +1,64 @@
+"""
+tests/test_bitboard_nb.py
+
+Тесты Numba-ядер (core/bitboard_nb.py): сверка с BitBoard и решение DFS.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import pytest
+
+pytest.importorskip("numba")
+
+import numpy as np
+
+from core.bitboard import BitBoard, VALID_MASK
+from core.bitboard_nb import get_moves_nb, is_dead_nb, canonical_nb, MAX_MOVES
+from solvers import NumbaDFSSolver
+from solutions.verify import verify_bitboard_solution
+
+
+def test_kernels_match_bitboard():
+    """get_moves_nb / is_dead_nb / canonical_nb совпадают с BitBoard."""
+    rng = random.Random(0)
+    buf = np.empty((MAX_MOVES, 3), dtype=np.int64)
+    for _ in range(1000):
+        valid_mask = VALID_MASK if rng.random() < 0.5 else rng.getrandbits(49)
+        pegs = rng.getrandbits(49) & valid_mask
+        board = BitBoard(pegs, valid_mask=valid_mask)
+
+        n = get_moves_nb(pegs, valid_mask, buf)
+        assert [tuple(m) for m in buf[:n].tolist()] == board.get_moves()
+        assert is_dead_nb(pegs, valid_mask) == board.is_dead()
+        if valid_mask == VALID_MASK:
+            assert canonical_nb(pegs) == board.canonical().pegs
+
+
+def test_numba_dfs_solves_english_board():
+    """Numba DFS решает стандартную английскую доску."""
+    board = BitBoard.english_start()
+    solution = NumbaDFSSolver().solve(board)
+    assert solution is not None
+    assert verify_bitboard_solution(board, solution) is True
+
+
+def test_fast_fallback_kernels():
+    """fast_* (Numba) совпадают с BitBoard; Zobrist — с поэлементным XOR."""
+    from core.fast_bitboard_py import (
+        fast_get_moves, fast_get_moves_nb, fast_is_dead, fast_zobrist_hash, ZOBRIST_TABLE
+    )
+    rng = random.Random(4)
+    buf = np.empty((MAX_MOVES, 3), dtype=np.int64)
+    for _ in range(300):
+        pegs = rng.getrandbits(49) & VALID_MASK
+        n = fast_get_moves_nb(pegs, buf)
+        assert [tuple(m) for m in buf[:n].tolist()] == fast_get_moves(pegs)
+        assert fast_is_dead(pegs) == BitBoard(pegs).is_dead()
+        expected = 0
+        for pos, value in ZOBRIST_TABLE.items():
+            if (pegs >> pos) & 1:
+                expected ^= value
+        assert fast_zobrist_hash(pegs) == expected
@@ -0,0 +1,48 @@
+"""
+tests/test_board.py
+
+Тесты frozenset-представления доски (core/board.py).
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.board import Board
+from core.bitboard import BitBoard, is_english_board
+from core.utils import DIRECTIONS
+
+
+CROSS = frozenset((r, c) for r in range(7) for c in range(7) if 2 <= r <= 4 or 2 <= c <= 4)
+
+
+def _brute_force_moves(board):
+    return sorted(
+        (r, c, dr, dc)
+        for r, c in board.pegs
+        for dr, dc in DIRECTIONS
+        if board.is_valid_move(r, c, dr, dc)
+    )
+
+
+def test_get_all_moves_start():
+    board = Board(CROSS - {(3, 3)}, frozenset({(3, 3)}))
+    moves = board.get_all_moves()
+    assert sorted(moves) == [(1, 3, 1, 0), (3, 1, 0, 1), (3, 5, 0, -1), (5, 3, -1, 0)]
+
+
+def test_get_all_moves_matches_is_valid_move():
+    """Таблица прыжков даёт те же ходы, что и проверка по направлениям."""
+    board = Board(CROSS - {(3, 3)}, frozenset({(3, 3)}))
+    for _ in range(6):
+        moves = board.get_all_moves()
+        assert sorted(moves) == _brute_force_moves(board)
+        board = board.apply_move(*moves[0])
+
+
+def test_to_bitboard():
+    board = Board(CROSS - {(3, 3)}, frozenset({(3, 3)}))
+    bitboard = board.to_bitboard()
+    assert bitboard == BitBoard.english_start()
+    assert is_english_board(bitboard)
+    assert len(bitboard.get_moves()) == len(board.get_all_moves())
@@ -0,0 +1,49 @@
+"""
+tests/test_heuristics.py
+
+Тесты эвристик соседства (heuristics/advanced.py).
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+
+from core.bitboard import BitBoard, ENGLISH_VALID_POSITIONS
+from heuristics.advanced import heuristic_isolated, heuristic_cluster
+
+
+def _neighbors(pos):
+    r, c = divmod(pos, 7)
+    for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+        if 0 <= nr < 7 and 0 <= nc < 7 and nr * 7 + nc in ENGLISH_VALID_POSITIONS:
+            yield nr * 7 + nc
+
+
+def _random_boards(n, seed):
+    rng = random.Random(seed)
+    for _ in range(n):
+        board = BitBoard.english_start()
+        for _ in range(rng.randrange(31)):
+            moves = board.get_moves()
+            if not moves:
+                break
+            board = board.apply_move(*rng.choice(moves))
+        yield board
+
+
+def test_no_row_wraparound():
+    # (2, 6) и (3, 0) — соседние биты 20 и 21, но не соседние клетки
+    board = BitBoard((1 << 20) | (1 << 21))
+    assert heuristic_isolated(board) == 2
+    assert heuristic_cluster(board) == 0
+
+
+def test_matches_brute_force():
+    for board in _random_boards(200, seed=4):
+        pegs = [pos for pos in ENGLISH_VALID_POSITIONS if board.has_peg(pos)]
+        isolated = sum(1 for pos in pegs if not any(board.has_peg(n) for n in _neighbors(pos)))
+        pairs = sum(1 for pos in pegs for n in _neighbors(pos) if n > pos and board.has_peg(n))
+        assert heuristic_isolated(board) == isolated
+        assert heuristic_cluster(board) == pairs
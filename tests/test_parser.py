@@ -0,0 +1,48 @@
+"""
+tests/test_parser.py
+
+Тесты разбора входных данных (peg_io/parser.py).
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from core.utils import PEG, HOLE
+from peg_io import parse_input, create_english_board
+
+
+def test_create_english_board():
+    board = create_english_board()
+    assert sum(row.count(PEG) for row in board) == 32
+    assert board[3][3] == HOLE
+    # Каждый вызов — независимая копия шаблона
+    board[0][2] = HOLE
+    assert create_english_board()[0][2] == PEG
+    assert create_english_board((0, 3))[0][3] == HOLE
+
+
+@pytest.mark.parametrize("hole", [(0, 0), (6, 5), (7, 3), (3, -1)])
+def test_create_english_board_rejects_off_board_hole(hole):
+    with pytest.raises(ValueError):
+        create_english_board(hole)
+
+
+def test_parse_input():
+    board = parse_input("size=7x7 pegs=C1,D1 empty=D4")
+    assert board[0][2] == PEG and board[0][3] == PEG
+    assert board[3][3] == HOLE
+    # Поля можно разделять и ';'
+    assert parse_input("size=7x7; pegs=C1,D1; empty=D4") == board
+
+
+@pytest.mark.parametrize("text", [
+    "size=7x7 pegs=C1", "size=7 pegs=C1 empty=D4", "",
+    "size=-1x7 pegs=A3 empty=D4", "size=7x0 pegs=A3 empty=D4",
+    "size=7x7 pegs= empty=D4", "size=7x7 pegs=A3 empty=",
+])
+def test_parse_input_rejects_bad_format(text):
+    with pytest.raises(ValueError):
+        parse_input(text)
@@ -0,0 +1,119 @@
+"""
+tests/test_pattern_db.py
+
+Тесты Pattern Database (heuristics/pattern_db.py).
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pickle
+import pytest
+import random
+
+from core.bitboard import ENGLISH_START, SYMMETRY_MAPS
+from heuristics.pattern_db import PatternDatabase, REGIONS, extract_region_state
+
+
+def _extract_by_bits(pegs, region):
+    state = 0
+    for i, pos in enumerate(sorted(region)):
+        if pegs >> pos & 1:
+            state |= 1 << i
+    return state
+
+
+def test_extract_region_state_matches_bit_loop():
+    rng = random.Random(0)
+    regions = list(REGIONS) + [frozenset(rng.sample(range(49), 7)) for _ in range(20)]
+    for _ in range(500):
+        pegs = rng.getrandbits(49)
+        for region in regions:
+            assert extract_region_state(pegs, region) == _extract_by_bits(pegs, region)
+
+
+def test_get_heuristic_matches_region_dicts(tmp_path):
+    db = PatternDatabase()
+    db.build_all(verbose=False)
+    path = str(tmp_path / "pdb.pkl")
+    db.save(path)
+    loaded = PatternDatabase()
+    assert loaded.load(path)
+
+    rng = random.Random(1)
+    for _ in range(500):
+        pegs = rng.getrandbits(49)
+        expected = sum(
+            db.databases[name].get(extract_region_state(pegs, region), 0)
+            for name, region in db.regions.items()
+        )
+        assert db.get_heuristic(pegs) == expected
+        assert loaded.get_heuristic(pegs) == expected
+
+
+def test_load_legacy_pickle(tmp_path):
+    db = PatternDatabase()
+    db.build_all(verbose=False)
+    path = tmp_path / "pdb.pkl"
+    path.write_bytes(pickle.dumps(db.databases))
+    loaded = PatternDatabase()
+    assert loaded.load(str(path))
+    assert loaded.databases == db.databases
+
+
+def test_heuristic_symmetry_invariant():
+    """Регионы переходят друг в друга при симметриях — h одинакова."""
+    db = PatternDatabase()
+    db.build_all(verbose=False)
+    rng = random.Random(11)
+    for _ in range(100):
+        pegs = ENGLISH_START & rng.getrandbits(49)
+        h = db.get_heuristic(pegs)
+        for perm in SYMMETRY_MAPS:
+            image = sum(1 << perm[pos] for pos in range(49) if pegs >> pos & 1)
+            assert db.get_heuristic(image) == h
+
+
+def test_combined_heuristic_peg_count_argument():
+    from heuristics.pattern_db import combined_pattern_heuristic
+    rng = random.Random(13)
+    for _ in range(20):
+        pegs = ENGLISH_START & rng.getrandbits(49)
+        assert combined_pattern_heuristic(pegs, 3, pegs.bit_count()) == \
+            combined_pattern_heuristic(pegs, 3)
+
+
+def test_get_heuristic_batch_matches_scalar():
+    db = PatternDatabase()
+    db.build_all(verbose=False)
+    rng = random.Random(17)
+    positions = [ENGLISH_START & rng.getrandbits(49) for _ in range(200)]
+    assert db.get_heuristic_batch(positions) == [db.get_heuristic(p) for p in positions]
+    assert db.get_heuristic_batch([]) == []
+
+
+def test_cython_lookup_matches_python():
+    pattern_db_c = pytest.importorskip("heuristics.pattern_db_c")
+    from heuristics.pattern_db import _compile_lookup
+    db = PatternDatabase()
+    db.build_all(verbose=False)
+    fast = pattern_db_c.PatternLookup(db._lookup)
+    slow = _compile_lookup(db._lookup)
+    rng = random.Random(19)
+    for _ in range(500):
+        pegs = rng.getrandbits(49)
+        assert fast(pegs) == slow(pegs)
+
+
+def test_load_rejects_truncated_or_padded_file(tmp_path):
+    """Обрезанный (или с лишними байтами) файл не загружается."""
+    db = PatternDatabase()
+    db.build_all(verbose=False)
+    path = tmp_path / "pdb.bin"
+    db.save(str(path))
+    data = path.read_bytes()
+
+    for broken in (data[:-10], data[:5], data[:7], data + b"\0"):
+        path.write_bytes(broken)
+        assert not PatternDatabase().load(str(path))
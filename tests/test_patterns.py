@@ -0,0 +1,43 @@
+"""
+tests/test_patterns.py
+
+Тесты жадных шаблонов (analysis/patterns.py).
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from copy import deepcopy
+
+from analysis.patterns import (
+    match_line_of_three, match_line_of_four, match_patterns, apply_pattern_sequence
+)
+
+
+def test_line_of_three_horizontal_and_vertical():
+    """●●○ по строке и ○●● по столбцу."""
+    assert match_line_of_three([list('●●○')]) == (0, 0, 0, 1)
+    assert match_line_of_three([list('○●●')]) == (0, 2, 0, -1)
+    assert match_line_of_three([['○'], ['●'], ['●']]) == (2, 0, -1, 0)
+
+
+def test_no_match_across_row_boundary():
+    """Окно не переносится с конца строки на начало следующей."""
+    board = [list('▫●●'), list('○▫▫')]
+    assert match_line_of_three(board) is None
+    assert match_line_of_four(board) is None
+
+
+def test_line_of_four_has_priority():
+    """match_patterns сначала ищет линию из четырёх."""
+    board = [list('●●○▫'), list('●●●○')]
+    assert match_patterns(board) == (1, 0, 0, 1)
+
+
+def test_apply_pattern_sequence_does_not_modify_board():
+    """Решение находится, исходная доска не меняется."""
+    board = [list('●●○')]
+    original = deepcopy(board)
+    assert apply_pattern_sequence(board) == ['A1 → C1']
+    assert board == original
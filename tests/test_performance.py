@@ -17,7 +17,9 @@ from heuristics import pagoda_value
 from heuristics.evaluation import evaluate_position
 from heuristics.fast_pagoda import pagoda_value_fast, NUMBA_AVAILABLE
 from core.fast import USING_CYTHON
-from core.rust_fast import USING_RUST, rust_pagoda_value, rust_evaluate_position
+from core.rust_fast import (
+    USING_RUST, rust_pagoda_value, rust_evaluate_position, rust_evaluate_batch
+)
 
 
 def benchmark_function(func, args, iterations=100000, warmup=1000):
@@ -195,6 +197,18 @@ def test_evaluate_performance():
                 print(f"    {name:20s}: {speedup:.2f}x")
 
 
+def test_evaluate_batch_matches_single():
+    """Пакетная оценка совпадает с поштучной."""
+    boards = [BitBoard.english_start()]
+    for _ in range(10):
+        boards.append(boards[-1].apply_move(*boards[-1].get_moves()[0]))
+    pegs_list = [b.pegs for b in boards]
+    moves_list = [len(b.get_moves()) for b in boards]
+
+    batch = rust_evaluate_batch(pegs_list, moves_list)
+    assert list(batch) == [rust_evaluate_position(p, m) for p, m in zip(pegs_list, moves_list)]
+
+
 def test_implementation_info():
     """Показывает информацию о доступных реализациях."""
     print("\n" + "="*60)
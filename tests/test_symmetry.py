@@ -0,0 +1,40 @@
+"""
+tests/test_symmetry.py
+
+Тесты симметрий (analysis/symmetry.py).
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analysis.symmetry import (
+    rotate_90, flip_horizontal, flip_vertical,
+    get_symmetry_canonical, symmetry_canonical_bits, count_symmetries,
+    _bits_to_set, _set_to_bits
+)
+
+
+def test_transforms_match_coordinates():
+    """Поворот и отражения совпадают с формулами по координатам."""
+    cells = frozenset([(0, 1), (2, 3), (6, 0), (4, 4)])
+    assert rotate_90(cells) == frozenset((c, 6 - r) for r, c in cells)
+    assert flip_horizontal(cells) == frozenset((r, 6 - c) for r, c in cells)
+    assert flip_vertical(cells) == frozenset((6 - r, c) for r, c in cells)
+    assert rotate_90(cells, 9) == frozenset((c, 8 - r) for r, c in cells)
+
+
+def test_bits_roundtrip():
+    cells = frozenset([(0, 0), (3, 3), (6, 6)])
+    assert _bits_to_set(_set_to_bits(cells, 7), 7) == cells
+
+
+def test_canonical_and_count():
+    """Каноническая форма одинакова для всей орбиты."""
+    cells = frozenset([(0, 2), (1, 2), (3, 5)])
+    canonical = get_symmetry_canonical(cells)
+    assert get_symmetry_canonical(rotate_90(cells)) == canonical
+    assert get_symmetry_canonical(flip_vertical(cells)) == canonical
+    assert count_symmetries(cells) == 8
+    assert count_symmetries(frozenset([(3, 3)])) == 1
+    assert symmetry_canonical_bits(_set_to_bits(cells, 7)) == _set_to_bits(canonical, 7)
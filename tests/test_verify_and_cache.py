@@ -6,6 +6,8 @@ tests/test_verify_and_cache.py
 - bitboard_to_matrix + peg_io.cache (кэширование решений)
 """
 
+import json
+import os
 from typing import List, Tuple
 
 from core.bitboard import BitBoard
@@ -77,7 +79,7 @@ def test_bitboard_to_matrix_and_cache_roundtrip(tmp_path, monkeypatch):
       используя board_to_str как ключ.
     """
     # Перенастраиваем файл кэша на временный
-    cache_file = tmp_path / "solutions_cache_test.json"
+    cache_file = tmp_path / "solutions_cache_test.jsonl"
     monkeypatch.setattr(cache_module, "CACHE_FILE", str(cache_file), raising=True)
 
     board, move = _make_simple_board()
@@ -110,3 +112,97 @@ def test_bitboard_to_matrix_and_cache_roundtrip(tmp_path, monkeypatch):
     cached = get_cached_solution(matrix)
     assert cached == moves_str
 
+
+
+def test_load_solutions_rereads_changed_file(tmp_path, monkeypatch):
+    """Разобранный кэш переиспользуется, пока файл не изменился."""
+    cache_file = tmp_path / "solutions_cache_test.jsonl"
+    monkeypatch.setattr(cache_module, "CACHE_FILE", str(cache_file), raising=True)
+
+    assert load_solutions() == {}
+    save_solution([[PEG, PEG, HOLE]], ["A1 → C1"])
+    assert load_solutions() is load_solutions()
+
+    # Внешняя запись (другой процесс) — словарь перечитывается
+    cache_file.write_text(json.dumps({"key": "x", "moves": ["B1 → D1"]}) + "\n")
+    assert load_solutions() == {"x": ["B1 → D1"]}
+
+
+def test_save_solution_appends_and_compacts(tmp_path, monkeypatch):
+    """Сохранение дописывает строку; перезаписанные ключи убирает compact."""
+    cache_file = tmp_path / "solutions_cache_test.jsonl"
+    monkeypatch.setattr(cache_module, "CACHE_FILE", str(cache_file), raising=True)
+
+    board = [[PEG, PEG, HOLE]]
+    save_solution(board, ["A1 → C1"])
+    save_solution([[HOLE, PEG, PEG]], ["C1 → A1"])
+    assert len(cache_file.read_text().splitlines()) == 2
+
+    # Ключ перезаписан: 3 строки на 2 ключа, побеждает последняя
+    save_solution(board, ["A1 → C1", "X"])
+    assert len(cache_file.read_text().splitlines()) == 3
+    assert get_cached_solution(board) == ["A1 → C1", "X"]
+
+    # Ещё две перезаписи: строк больше, чем 2 × ключей, — файл сжат
+    save_solution(board, ["1"])
+    save_solution(board, ["2"])
+    assert len(cache_file.read_text().splitlines()) == 2
+    assert load_solutions() == {
+        board_to_str(board): ["2"], board_to_str([[HOLE, PEG, PEG]]): ["C1 → A1"]
+    }
+
+
+def test_torn_multibyte_record_is_skipped(tmp_path, monkeypatch):
+    """Строка, оборванная посреди UTF-8 символа, не ломает кэш (без orjson)."""
+    cache_file = tmp_path / "solutions_cache_test.jsonl"
+    monkeypatch.setattr(cache_module, "CACHE_FILE", str(cache_file), raising=True)
+    monkeypatch.setattr(cache_module, "ORJSON_AVAILABLE", False)
+    monkeypatch.setattr(cache_module, "_decode_record", json.loads)
+
+    board = [[PEG, PEG, HOLE]]
+    save_solution(board, ["A1 → C1"])
+    torn = cache_module._encode_record(board_to_str([[HOLE, PEG, PEG]]), ["C1 → A1"])
+    # Обрыв внутри многобайтового '○'
+    cut = torn.index("○".encode()) + 1
+    with open(cache_file, "ab") as f:
+        f.write(torn[:cut])
+
+    assert load_solutions() == {board_to_str(board): ["A1 → C1"]}
+    # Следующая запись не склеивается с битой строкой
+    save_solution([[HOLE, PEG, PEG]], ["C1 → A1"])
+    monkeypatch.setattr(cache_module, "_solutions_stamp", None)
+    assert get_cached_solution([[HOLE, PEG, PEG]]) == ["C1 → A1"]
+    assert get_cached_solution(board) == ["A1 → C1"]
+
+
+def test_compact_keeps_lines_from_other_writers(tmp_path, monkeypatch):
+    """compact перечитывает файл: чужие строки после нашего чтения не теряются."""
+    cache_file = tmp_path / "solutions_cache_test.jsonl"
+    monkeypatch.setattr(cache_module, "CACHE_FILE", str(cache_file), raising=True)
+
+    board = [[PEG, PEG, HOLE]]
+    save_solution(board, ["A1 → C1"])
+    # Другой процесс дописал запись — наш словарь о ней не знает
+    with open(cache_file, "ab") as f:
+        f.write(cache_module._encode_record("other", ["B1 → D1"]))
+
+    cache_module.compact()
+    assert load_solutions() == {board_to_str(board): ["A1 → C1"], "other": ["B1 → D1"]}
+
+
+def test_save_solution_without_pread(tmp_path, monkeypatch):
+    """Дописывание работает без os.pread (Windows)."""
+    cache_file = tmp_path / "solutions_cache_test.jsonl"
+    monkeypatch.setattr(cache_module, "CACHE_FILE", str(cache_file), raising=True)
+    monkeypatch.delattr(os, "pread", raising=False)
+
+    board = [[PEG, PEG, HOLE]]
+    save_solution(board, ["A1 → C1"])
+    with open(cache_file, "ab") as f:
+        f.write(b'{"key":"x')
+    save_solution([[HOLE, PEG, PEG]], ["C1 → A1"])
+
+    monkeypatch.setattr(cache_module, "_solutions_stamp", None)
+    assert load_solutions() == {
+        board_to_str(board): ["A1 → C1"], board_to_str([[HOLE, PEG, PEG]]): ["C1 → A1"]
+    }
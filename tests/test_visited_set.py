@@ -0,0 +1,40 @@
+"""
+tests/test_visited_set.py
+
+Тесты компактного множества состояний (core/visited_set.py).
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+
+from core.bitboard import BitBoard
+from core.visited_set import VisitedSet
+from solvers.dfs import DFSSolver
+from solutions.verify import verify_bitboard_solution
+
+
+def test_matches_python_set():
+    """add / in / len совпадают с set, включая рост таблицы и ключ 0."""
+    rng = random.Random(0)
+    visited = VisitedSet(expected=8)
+    reference = set()
+    for _ in range(5000):
+        key = rng.getrandbits(49) if rng.random() < 0.9 else rng.randrange(4)
+        visited.add(key)
+        reference.add(key)
+    assert len(visited) == len(reference)
+    assert all(key in visited for key in reference)
+    assert sum(rng.getrandbits(49) in visited for _ in range(1000)) == 0
+
+    visited.clear()
+    assert len(visited) == 0 and 0 not in visited
+
+
+def test_dfs_with_compact_memo():
+    board = BitBoard.from_positions([(3, 1), (3, 2), (3, 4)])
+    solution = DFSSolver(compact_memo=True).solve(board)
+    assert solution is not None
+    assert verify_bitboard_solution(board, solution)
@@ -0,0 +1,62 @@
+"""
+tests/test_zobrist.py
+
+Тесты ZobristBitBoard (core/zobrist.py): инкрементальный хеш и счётчик
+совпадают с вычисленными с нуля, ходы — с BitBoard.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+
+from core.bitboard import BitBoard, ENGLISH_MOVES
+from core.zobrist import (
+    ZobristBitBoard, compute_zobrist_hash, update_zobrist_hash, MOVE_ZOBRIST_DELTA
+)
+
+
+def test_incremental_state_matches_recomputed():
+    rng = random.Random(3)
+    board = ZobristBitBoard.english_start()
+    while True:
+        assert board.zobrist_hash == compute_zobrist_hash(board.pegs)
+        assert board.peg_count() == board.pegs.bit_count()
+        moves = board.get_moves()
+        if not moves:
+            break
+        board = board.apply_move(*rng.choice(moves))
+
+
+def test_moves_match_bitboard():
+    rng = random.Random(5)
+    board = ZobristBitBoard.english_start()
+    for _ in range(20):
+        moves = board.get_moves()
+        assert sorted(moves) == sorted(BitBoard(board.pegs).get_moves())
+        if not moves:
+            break
+        board = board.apply_move(*rng.choice(moves))
+
+
+def test_move_deltas_match_update():
+    assert len(MOVE_ZOBRIST_DELTA) == 76
+    for move, delta in MOVE_ZOBRIST_DELTA.items():
+        assert delta == update_zobrist_hash(0, *move)
+
+
+def test_move_ids_match_moves():
+    rng = random.Random(7)
+    board = ZobristBitBoard.english_start()
+    for _ in range(15):
+        move_ids = board.get_move_ids()
+        assert [ENGLISH_MOVES[i] for i in move_ids] == board.get_moves()
+        if not move_ids:
+            break
+        move_id = rng.choice(move_ids)
+        child = board.apply_move_by_id(move_id)
+        expected = board.apply_move(*ENGLISH_MOVES[move_id])
+        assert (child.pegs, child.zobrist_hash, child.peg_count()) == \
+            (expected.pegs, expected.zobrist_hash, expected.peg_count())
+        board = child
@@ -0,0 +1,52 @@
+"""
+tests/test_zobrist_c.py
+
+Cython ZobristBitBoard (core/zobrist_c.pyx) совпадает с Python версией.
+Пропускается, если расширение не собрано.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pickle
+import random
+
+import pytest
+
+from core.zobrist import ZobristBitBoard as PyZobristBitBoard
+
+zobrist_c = pytest.importorskip("core.zobrist_c")
+
+
+def _state(board):
+    return board.pegs, board.zobrist_hash, board.peg_count()
+
+
+def test_random_games_match_python():
+    rng = random.Random(11)
+    for _ in range(5):
+        py_board = PyZobristBitBoard.english_start()
+        c_board = zobrist_c.ZobristBitBoard.english_start()
+        while True:
+            assert _state(c_board) == _state(py_board)
+            assert hash(c_board) == hash(py_board)
+            assert c_board.get_moves() == py_board.get_moves()
+            assert c_board.get_move_ids() == py_board.get_move_ids()
+            move_ids = py_board.get_move_ids()
+            if not move_ids:
+                break
+            move_id = rng.choice(move_ids)
+            py_board = py_board.apply_move_by_id(move_id)
+            if rng.random() < 0.5:
+                c_board = c_board.apply_move_by_id(move_id)
+            else:
+                c_board = c_board.apply_move(*c_board.get_moves()[move_ids.index(move_id)])
+
+
+def test_constructor_and_pickle():
+    start = PyZobristBitBoard.english_start()
+    board = zobrist_c.ZobristBitBoard(start.pegs)
+    assert _state(board) == _state(start)
+    assert pickle.loads(pickle.dumps(board)) == board
+    assert board != zobrist_c.ZobristBitBoard(start.pegs ^ 1 << 24)
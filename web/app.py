@@ -193,16 +193,7 @@ def solve_stream():
     # Форма доски определяется из начальной позиции: valid_mask = pegs | holes
     valid_mask = pegs_bits | holes_bits
     
-    # Используем быстрый popcount
-    import sys
-    if sys.version_info >= (3, 10):
-        peg_count = pegs_bits.bit_count()
-    else:
-        x = pegs_bits
-        x = x - ((x >> 1) & 0x5555555555555555)
-        x = (x & 0x3333333333333333) + ((x >> 2) & 0x3333333333333333)
-        x = (x + (x >> 4)) & 0x0F0F0F0F0F0F0F0F
-        peg_count = ((x * 0x0101010101010101) >> 56) & 0xFF
+    peg_count = pegs_bits.bit_count()
     
     board = BitBoard(pegs_bits, valid_mask=valid_mask)
     
@@ -673,17 +664,7 @@ def solve():
     # Клетки, где есть фишка ИЛИ дырка, существуют на доске; остальные вырезаны
     valid_mask = pegs_bits | holes_bits
     
-    # Используем быстрый popcount
-    import sys
-    if sys.version_info >= (3, 10):
-        peg_count = pegs_bits.bit_count()
-    else:
-        # Fallback для старых версий
-        x = pegs_bits
-        x = x - ((x >> 1) & 0x5555555555555555)
-        x = (x & 0x3333333333333333) + ((x >> 2) & 0x3333333333333333)
-        x = (x + (x >> 4)) & 0x0F0F0F0F0F0F0F0F
-        peg_count = ((x * 0x0101010101010101) >> 56) & 0xFF
+    peg_count = pegs_bits.bit_count()
     
     # Создаём битборд с маской валидных клеток
     board = BitBoard(pegs_bits, valid_mask=valid_mask)
@@ -894,17 +875,7 @@ def validate():
             if 0 <= pos < 49:
                 pegs_bits |= (1 << pos)
     
-    # Используем быстрый popcount
-    import sys
-    if sys.version_info >= (3, 10):
-        peg_count = pegs_bits.bit_count()
-    else:
-        # Fallback для старых версий
-        x = pegs_bits
-        x = x - ((x >> 1) & 0x5555555555555555)
-        x = (x & 0x3333333333333333) + ((x >> 2) & 0x3333333333333333)
-        x = (x + (x >> 4)) & 0x0F0F0F0F0F0F0F0F
-        peg_count = ((x * 0x0101010101010101) >> 56) & 0xFF
+    peg_count = pegs_bits.bit_count()
     
     # Проверка Pagoda для произвольных начальных состояний
     board = BitBoard(pegs_bits)
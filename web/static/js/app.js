@@ -646,6 +646,9 @@ function copyBoardNotation() {
     }
 }
 
+// Координата: буква + цифра + опционально (hole)
+const NOTATION_RE = /^([A-G])([1-7])(\(hole\))?$/i;
+
 function parseBoardNotation(notation) {
     /**
      * Парсит координатное описание доски.
@@ -666,8 +669,8 @@ function parseBoardNotation(notation) {
     const parts = notation.trim().split(/\s+/).filter(p => p.length > 0);
     
     for (const part of parts) {
-        // Проверяем формат координаты: буква + цифра + опционально (hole)
-        const match = part.match(/^([A-G])([1-7])(\(hole\))?$/i);
+        // Проверяем формат координаты (NOTATION_RE)
+        const match = NOTATION_RE.exec(part);
         
         if (match) {
             const letter = match[1].toUpperCase();